@@ -0,0 +1 @@
+"""Benchmarks for sportsball, run as modules from the repository root."""
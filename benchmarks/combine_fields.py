@@ -0,0 +1,66 @@
+"""Benchmark combining provider models field by field.
+
+python -m benchmarks.combine_fields
+"""
+
+import random
+
+import requests_cache
+
+from sportsball.data.combined.combine_fields import combine_fields
+from sportsball.data.player_model import PlayerModel
+from tests.fixtures.combine_fields import (chained_combiners, combine_games,
+                                           five_provider_games,
+                                           more_interesting_fields,
+                                           player_model)
+
+from .timer import report, time_per_run
+
+_EXCLUDE = frozenset({"identifier", "version"})
+_INCLUDE_DERIVED = frozenset({"sex"})
+
+
+def _player_benchmark() -> None:
+    rnd = random.Random(42)
+    games = [[player_model(rnd) for _ in range(3)] for _ in range(20)]
+    field_names = [
+        x
+        for x, y in PlayerModel.model_fields.items()
+        if x not in _EXCLUDE
+        and (not y.default_factory_takes_validated_data or x in _INCLUDE_DERIVED)
+    ]
+
+    def _chained() -> None:
+        for player_models in games:
+            more_interesting_fields(player_models, field_names)
+
+    def _combined() -> None:
+        for player_models in games:
+            combine_fields(
+                player_models, exclude=_EXCLUDE, include_derived=_INCLUDE_DERIVED
+            )
+
+    report(
+        "three provider player",
+        time_per_run(_chained) / len(games),
+        time_per_run(_combined) / len(games),
+    )
+
+
+def _game_benchmark() -> None:
+    games = five_provider_games(random.Random(42), 5)
+    session = requests_cache.CachedSession(backend="memory")
+    with chained_combiners():
+        chained = time_per_run(lambda: combine_games(games, session), runs=1)
+    combined = time_per_run(lambda: combine_games(games, session), runs=1)
+    report("five provider game", chained / len(games), combined / len(games))
+
+
+def main() -> None:
+    """Compare more_interesting chains with combine_fields."""
+    _player_benchmark()
+    _game_benchmark()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark handing provider games to the combiner.
+
+python -m benchmarks.combined_league_model
+"""
+
+import datetime
+import queue
+import threading
+from unittest import mock
+
+import requests_cache
+
+from sportsball.data.combined import combined_league_model
+from sportsball.data.game_model import GameModel
+from tests.fixtures.combined_league_model import (SyntheticLeagueModel,
+                                                  synthetic_game_model)
+
+from .timer import report, time_per_run
+
+# A season of NBA games from five providers.
+_SEASON_GAMES = 1230 * 5
+
+
+def _hand_off(league_model, game_models, round_trip):
+    # Puts each provider game on the merge queue and takes it off, as the combiner
+    # does, with or without the dump and validate it used to need.
+    games_queue = queue.Queue()
+    with mock.patch.object(SyntheticLeagueModel, "games", new=iter(game_models)):
+        combined_league_model._produce_league_games(
+            league_model, 0, games_queue, threading.Event()
+        )
+    while True:
+        _, item = games_queue.get()
+        if item == combined_league_model._DONE:
+            break
+        if round_trip:
+            GameModel.model_validate(item.model_dump())
+
+
+def main() -> None:
+    """Compare the hand off with and without the model_dump/model_validate round trip."""
+    dts = [
+        datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x)
+        for x in range(10)
+    ]
+    game_models = [synthetic_game_model(dt) for dt in dts]
+    league_model = SyntheticLeagueModel(
+        requests_cache.CachedSession(backend="memory"), dts
+    )
+    round_trip = time_per_run(
+        lambda: _hand_off(league_model, game_models, True)
+    ) / len(game_models)
+    direct = time_per_run(
+        lambda: _hand_off(league_model, game_models, False)
+    ) / len(game_models)
+    report("provider hand off per game", round_trip, direct)
+    print(
+        f"{(round_trip - direct) * _SEASON_GAMES:.1f}s saved per five provider NBA season"
+    )
+
+
+if __name__ == "__main__":
+    main()
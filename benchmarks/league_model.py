@@ -0,0 +1,24 @@
+"""Benchmark timezone normalisation of a league frame.
+
+python -m benchmarks.league_model
+"""
+
+from sportsball.data.league_model import _normalize_tz
+from tests.fixtures.league_model import (multi_season_frame,
+                                         row_wise_normalize_tz)
+
+from .timer import report, time_per_run
+
+
+def main() -> None:
+    """Compare row-wise and vectorised timezone normalisation."""
+    df = multi_season_frame(2000, 10)
+    report(
+        f"normalize tz for {len(df)} games",
+        time_per_run(lambda: row_wise_normalize_tz(df.copy()), runs=1),
+        time_per_run(lambda: _normalize_tz(df.copy()), runs=1),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark decoding an Open-Meteo response.
+
+python -m benchmarks.openmeteo_weather_model
+"""
+
+import datetime
+
+from openmeteo_sdk.WeatherApiResponse import WeatherApiResponse
+
+from sportsball.data.weather.openmeteo.openmeteo_weather_model import \
+    _parse_openmeteo
+from tests.fixtures.openmeteo_weather_model import (build_openmeteo_response,
+                                                   pandas_weather)
+
+from .timer import report, time_per_run
+
+_TZ = "Australia/Melbourne"
+
+
+def main() -> None:
+    """Compare decoding through pandas frames with decoding into numpy blocks."""
+    data = build_openmeteo_response(
+        datetime.date(2023, 8, 26), datetime.date(2023, 11, 26)
+    )
+    dt = datetime.datetime(2023, 10, 10, 19, 10)
+    report(
+        "openmeteo parse per response",
+        time_per_run(
+            lambda: pandas_weather(WeatherApiResponse.GetRootAs(data, 4), _TZ, dt),
+            runs=20,
+        ),
+        time_per_run(
+            lambda: _parse_openmeteo(
+                [WeatherApiResponse.GetRootAs(data, 4)], _TZ, dt, "0.0.1"
+            ),
+            runs=20,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
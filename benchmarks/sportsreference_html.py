@@ -0,0 +1,44 @@
+"""Benchmark reading a sportsreference boxscore.
+
+python -m benchmarks.sportsreference_html
+"""
+
+import io
+import os
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from sportsball.data.sportsreference.sportsreference_html import (parse_html,
+                                                                  read_tables)
+
+from .timer import report, time_per_run
+
+_BOXSCORE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests",
+    "data",
+    "sportsreference",
+    "201604130MIL.html",
+)
+
+
+def _double_parse(text: str) -> None:
+    BeautifulSoup(text, "lxml")
+    pd.read_html(io.StringIO(text))
+
+
+def main() -> None:
+    """Compare BeautifulSoup and a full read_html with one lxml parse."""
+    with open(_BOXSCORE, encoding="utf8") as handle:
+        text = handle.read()
+    report(
+        "boxscore parse",
+        time_per_run(lambda: _double_parse(text)),
+        time_per_run(lambda: read_tables(parse_html(text))),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Timing helpers for the benchmarks."""
+
+import time
+from typing import Callable
+
+
+def time_per_run(func: Callable[[], object], runs: int = 5) -> float:
+    """Find the mean wall-clock time of a function in seconds."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def report(name: str, old: float, new: float) -> None:
+    """Print the time taken before and after a change."""
+    print(f"{name}: {old * 1000.0:.3f}ms -> {new * 1000.0:.3f}ms")
@@ -1,19 +1,106 @@
 """The CLI for executing the data harvesting."""
 
+import argparse
 import datetime
+import glob
 import io
 import logging
+import os
 import sys
 from contextlib import redirect_stdout
 
+import pandas as pd
+
 from . import __VERSION__
 from .args import parse_args
 from .data import league_model
+from .data.combined import combined_league_model
+from .data.espn.espn_ref_cache import REF_CACHE
 from .data.league import league_from_str
+from .data.league_model import (LeagueModel, game_keys, incremental_dt,
+                                merge_frames)
+from .data.worker_settings import WorkerSettings
 from .logger import setup_logger
 from .sportsball import SportsBall
 
 _STDOUT_FILE = "-"
+_PART_PREFIX = "part-"
+_PART_SUFFIX = ".parquet"
+_INCREMENTAL_LOOKBACK = datetime.timedelta(days=7)
+
+
+def _find_parts(folder: str) -> list[str]:
+    return sorted(glob.glob(os.path.join(folder, f"{_PART_PREFIX}*{_PART_SUFFIX}")))
+
+
+def _write_part(df: pd.DataFrame, part_file: str) -> None:
+    # Write to a temporary file first so a killed run never leaves a torn part.
+    df.to_parquet(part_file + ".tmp", compression="gzip")
+    os.replace(part_file + ".tmp", part_file)
+
+
+def _read_frame(path: str) -> pd.DataFrame:
+    if os.path.isdir(path):
+        parts = _find_parts(path)
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat([pd.read_parquet(x) for x in parts], ignore_index=True)
+    return pd.read_parquet(path)
+
+
+def _write_stream(league: LeagueModel, folder: str, incremental: bool) -> None:
+    os.makedirs(folder, exist_ok=True)
+    existing_parts = _find_parts(folder)
+    if not incremental:
+        for stale_part in existing_parts:
+            os.remove(stale_part)
+        existing_parts = []
+    # The games of each previous part, so refreshed games leave them as soon as their
+    # replacements are written.
+    existing_keys = {x: set(game_keys(pd.read_parquet(x))) for x in existing_parts}
+    for count, df in enumerate(league.to_frames(), start=len(existing_parts)):
+        part_file = os.path.join(folder, f"{_PART_PREFIX}{count:05d}{_PART_SUFFIX}")
+        _write_part(df, part_file)
+        logging.info("Wrote %d games to %s", len(df), part_file)
+        keys = set(game_keys(df))
+        for existing_part, part_keys in existing_keys.items():
+            if part_keys.isdisjoint(keys):
+                continue
+            existing_df = pd.read_parquet(existing_part)
+            refreshed = game_keys(existing_df).isin(keys)
+            _write_part(existing_df[~refreshed], existing_part)
+            part_keys -= keys
+
+
+def _setup_output(args: argparse.Namespace) -> pd.DataFrame:
+    if args.stream and args.file == _STDOUT_FILE:
+        raise ValueError("--stream requires a directory to write to.")
+    if args.incremental is None:
+        return pd.DataFrame()
+    if args.stream and os.path.abspath(args.incremental) != os.path.abspath(args.file):
+        raise ValueError("--stream can only refresh its own output directory.")
+    existing_df = _read_frame(args.incremental)
+    league_model.INCREMENTAL_DT = incremental_dt(existing_df, _INCREMENTAL_LOOKBACK)
+    logging.info("Refreshing games from %s", league_model.INCREMENTAL_DT)
+    return existing_df
+
+
+def _worker_settings(args: argparse.Namespace) -> WorkerSettings:
+    workers = WorkerSettings()
+    for pool, max_workers, requests_per_second in (
+        (workers.espn, args.espn_workers, args.espn_rate),
+        (
+            workers.sportsreference,
+            args.sportsreference_workers,
+            args.sportsreference_rate,
+        ),
+        (workers.oddsportal, args.oddsportal_workers, args.oddsportal_rate),
+    ):
+        if max_workers is not None:
+            pool.max_workers = max_workers
+        if requests_per_second is not None:
+            pool.requests_per_second = requests_per_second
+    return workers
 
 
 def main() -> None:
@@ -29,9 +116,23 @@ def main() -> None:
                 seconds=args.timeout
             )
 
-        ball = SportsBall()
+        if args.espn_ref_cache_size is not None:
+            REF_CACHE.resize(args.espn_ref_cache_size)
+        if args.combined_processes:
+            combined_league_model.USE_PROCESSES = True
+        if args.ffill_state is not None:
+            combined_league_model.FFILL_PATH = args.ffill_state
+        if args.identity_state is not None:
+            combined_league_model.IDENTITY_PATH = args.identity_state
+
+        existing_df = _setup_output(args)
+
+        ball = SportsBall(workers=_worker_settings(args))
         league = ball.league(league_from_str(args.league), args.leaguemodel)
-        df = league.to_frame()
+        if args.stream:
+            _write_stream(league, args.file, args.incremental is not None)
+            return
+        df = merge_frames(existing_df, league.to_frame())
         handle = io.BytesIO()
         df.to_parquet(handle, compression="gzip")
         handle.seek(0)
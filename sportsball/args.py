@@ -34,6 +34,73 @@ def parse_args() -> argparse.Namespace:
         help="The timeout to use (in seconds).",
         type=int,
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the output as a directory of parquet part files as the games are produced.",
+    )
+    parser.add_argument(
+        "--incremental",
+        required=False,
+        help="An existing parquet output to refresh with only the new or changed games.",
+    )
+    parser.add_argument(
+        "--espn-workers",
+        required=False,
+        help="The number of ESPN events to fetch concurrently.",
+        type=int,
+    )
+    parser.add_argument(
+        "--espn-rate",
+        required=False,
+        help="The maximum number of requests per second to each ESPN host.",
+        type=float,
+    )
+    parser.add_argument(
+        "--espn-ref-cache-size",
+        required=False,
+        help="The number of ESPN athlete, position and college references to keep in memory.",
+        type=int,
+    )
+    parser.add_argument(
+        "--sportsreference-workers",
+        required=False,
+        help="The number of sports reference boxscores to process concurrently.",
+        type=int,
+    )
+    parser.add_argument(
+        "--sportsreference-rate",
+        required=False,
+        help="The maximum number of requests per second to each sports reference host.",
+        type=float,
+    )
+    parser.add_argument(
+        "--oddsportal-workers",
+        required=False,
+        help="The number of odds portal archive and game pages to crawl concurrently.",
+        type=int,
+    )
+    parser.add_argument(
+        "--oddsportal-rate",
+        required=False,
+        help="The maximum number of requests per second to each odds portal host.",
+        type=float,
+    )
+    parser.add_argument(
+        "--combined-processes",
+        action="store_true",
+        help="Run each provider of a combined league in its own process.",
+    )
+    parser.add_argument(
+        "--ffill-state",
+        required=False,
+        help="A file to keep the forward filled values of a combined league in between runs.",
+    )
+    parser.add_argument(
+        "--identity-state",
+        required=False,
+        help="A file to keep the resolved identities of a combined league in between runs.",
+    )
     parser.add_argument(
         "file",
         default=STDOUT_FILE,
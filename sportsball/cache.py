@@ -2,4 +2,5 @@
 
 from joblib import Memory  # type: ignore
 
-MEMORY = Memory(".sportsball_cache", verbose=0)
+CACHE_DIR = ".sportsball_cache"
+MEMORY = Memory(CACHE_DIR, verbose=0)
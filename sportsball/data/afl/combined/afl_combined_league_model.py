@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..afl.afl_afl_league_model import AFLAFLLeagueModel
 from ..afltables.afl_afltables_league_model import AFLAFLTablesLeagueModel
 from ..aussportsbetting.afl_aussportsbetting_league_model import \
@@ -278,15 +279,20 @@ AFL_VENUE_IDENTITY_MAP = {
 class AFLCombinedLeagueModel(CombinedLeagueModel):
     """AFL combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.AFL,
             [
                 AFLAFLTablesLeagueModel(session, position=0),
-                AFLESPNLeagueModel(session, position=1),
+                AFLESPNLeagueModel(session, position=1, workers=workers),
                 AFLAusSportsBettingLeagueModel(session, position=2),
-                AFLOddsPortalLeagueModel(session, position=3),
+                AFLOddsPortalLeagueModel(session, position=3, workers=workers),
                 AFLAFLLeagueModel(session, position=4),
             ],
             league_filter,
@@ -6,6 +6,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...espn.espn_league_model import ESPNLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 
 _SEASON_URL = "https://sports.core.api.espn.com/v2/sports/australian-football/leagues/afl/seasons?limit=100"
 
@@ -13,8 +14,15 @@ _SEASON_URL = "https://sports.core.api.espn.com/v2/sports/australian-football/le
 class AFLESPNLeagueModel(ESPNLeagueModel):
     """AFL ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.AFL, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL, League.AFL, session, position=position, workers=workers
+        )
 
     @classmethod
     def name(cls) -> str:
@@ -6,13 +6,19 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...league import League
 from ...oddsportal.oddsportal_league_model import OddsPortalLeagueModel
+from ...worker_settings import WorkerSettings
 
 
 class AFLOddsPortalLeagueModel(OddsPortalLeagueModel):
     """AFL OddsPortal implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(League.AFL, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(League.AFL, session, position=position, workers=workers)
 
     @classmethod
     def name(cls) -> str:
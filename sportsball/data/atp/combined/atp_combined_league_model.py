@@ -5,6 +5,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.atp_espn_league_model import ATPESPNLeagueModel
 from ..oddsportal.atp_oddsportal_league_model import ATPOddsPortalLeagueModel
 from ..sportsdb.atp_sportsdb_league_model import ATPSportsDBLeagueModel
@@ -19,15 +20,20 @@ ATP_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class ATPCombinedLeagueModel(CombinedLeagueModel):
     """ATP combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.ATP,
             [
                 ATPSportsDBLeagueModel(session, position=0),
-                ATPOddsPortalLeagueModel(session, position=1),
+                ATPOddsPortalLeagueModel(session, position=1, workers=workers),
                 ATPTennisAbstractLeagueModel(session, position=2),
-                ATPESPNLeagueModel(session, position=3),
+                ATPESPNLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
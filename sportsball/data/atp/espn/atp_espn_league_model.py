@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...espn.espn_league_model import ESPNLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 
 _SEASON_URL = (
     "http://sports.core.api.espn.com/v2/sports/tennis/leagues/atp/seasons?limit=100"
@@ -13,8 +14,15 @@ _SEASON_URL = (
 class ATPESPNLeagueModel(ESPNLeagueModel):
     """ATP ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.ATP, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL, League.ATP, session, position=position, workers=workers
+        )
 
     @classmethod
     def name(cls) -> str:
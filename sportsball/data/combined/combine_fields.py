@@ -0,0 +1,99 @@
+"""A function for combining the fields of many models."""
+
+import datetime
+import functools
+import types
+import typing
+from typing import Any, Callable, Sequence
+
+from pydantic import BaseModel
+
+from .most_interesting import more_interesting, more_interesting_datetime
+from .null_check import is_null
+
+_Merge = Callable[[Any, Any], Any]
+_NUMBER_TYPES = (bool, int, float)
+
+
+def _more_interesting_number(left: Any, right: Any) -> Any:
+    if is_null(left):
+        return right
+    if is_null(right):
+        return left
+    if left == 0 and right != 0 and isinstance(left, float) == isinstance(right, float):
+        return right
+    return left
+
+
+def _more_interesting_datetime(left: Any, right: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return more_interesting_datetime(left, right)
+
+
+def _first_interesting(left: Any, right: Any) -> Any:
+    return right if left is None else left
+
+
+def _field_merge(annotation: Any) -> _Merge:
+    if (
+        isinstance(annotation, types.UnionType)
+        or typing.get_origin(annotation) is typing.Union
+    ):
+        args = tuple(x for x in typing.get_args(annotation) if x is not type(None))
+    else:
+        args = (annotation,)
+    if args == (datetime.datetime,):
+        return _more_interesting_datetime
+    if all(x in _NUMBER_TYPES for x in args):
+        return _more_interesting_number
+    if len(args) != 1:
+        return more_interesting
+    (arg,) = args
+    if arg in (str, datetime.date) or typing.get_origin(arg) is list:
+        return _first_interesting
+    if isinstance(arg, type) and issubclass(arg, BaseModel):
+        return _first_interesting
+    return more_interesting
+
+
+@functools.cache
+def _field_plan(
+    model_class: type[BaseModel],
+    exclude: frozenset[str],
+    include_derived: frozenset[str],
+) -> tuple[tuple[str, _Merge], ...]:
+    plan = []
+    for field_name, field in model_class.model_fields.items():
+        if field_name in exclude:
+            continue
+        # Fields calculated from the rest of the model are derived again once combined.
+        if (
+            field.default_factory_takes_validated_data
+            and field_name not in include_derived
+        ):
+            continue
+        plan.append((field_name, _field_merge(field.annotation)))
+    return tuple(plan)
+
+
+def combine_fields(
+    models: Sequence[BaseModel],
+    exclude: frozenset[str] = frozenset(),
+    include_derived: frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    """Find the most interesting value of each field across many models of a class."""
+    plan = _field_plan(type(models[0]), exclude, include_derived)
+    model_dicts = [x.__dict__ for x in models]
+    if len(model_dicts) == 1:
+        model_dict = model_dicts[0]
+        return {x: model_dict[x] for x, _ in plan}
+    values = {}
+    for field_name, merge in plan:
+        value = None
+        for model_dict in model_dicts:
+            value = merge(value, model_dict[field_name])
+        values[field_name] = value
+    return values
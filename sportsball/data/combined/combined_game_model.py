@@ -3,7 +3,6 @@
 # pylint: disable=too-many-locals,line-too-long,too-many-arguments,too-many-branches,too-many-statements
 import datetime
 import logging
-from typing import Any
 
 import requests
 
@@ -11,11 +10,18 @@ from ..game_model import VERSION, GameModel
 from ..team_model import TeamModel
 from ..umpire_model import UmpireModel
 from ..venue_model import VenueModel
+from .combine_fields import combine_fields
 from .combined_team_model import create_combined_team_model
 from .combined_umpire_model import create_combined_umpire_model
 from .combined_venue_model import create_combined_venue_model
+from .ffill import FFillState
+from .identity_table import IdentityTable
 from .most_interesting import more_interesting
-from .normalise_name import normalise_name
+
+# The fields that are combined by their own rules rather than the most interesting value.
+_EXCLUDED_FIELDS = frozenset(
+    {"dt", "venue", "teams", "league", "dividends", "umpires", "version"}
+)
 
 
 def _venue_models(
@@ -42,12 +48,11 @@ def _venue_models(
 def _team_models(
     game_models: list[GameModel],
     team_identity_map: dict[str, str],
-    player_identity_map: dict[str, str],
-    names: dict[str, str],
-    coach_names: dict[str, str],
-    player_ffill: dict[str, dict[str, Any]],
-    team_ffill: dict[str, dict[str, Any]],
-    coach_ffill: dict[str, dict[str, Any]],
+    player_identities: IdentityTable,
+    coach_identities: IdentityTable,
+    player_ffill: FFillState,
+    team_ffill: FFillState,
+    coach_ffill: FFillState,
 ) -> list[TeamModel]:
     team_models: dict[str, list[TeamModel]] = {}
     for game_model in game_models:
@@ -69,9 +74,8 @@ def _team_models(
         create_combined_team_model(
             v,
             k,
-            player_identity_map,
-            names,
-            coach_names,
+            player_identities,
+            coach_identities,
             player_ffill,
             team_ffill,
             coach_ffill,
@@ -84,15 +88,15 @@ def create_combined_game_model(
     game_models: list[GameModel],
     venue_identity_map: dict[str, str],
     team_identity_map: dict[str, str],
-    player_identity_map: dict[str, str],
+    player_identities: IdentityTable,
+    coach_identities: IdentityTable,
+    umpire_identities: IdentityTable,
     session: requests.Session,
-    names: dict[str, str],
-    coach_names: dict[str, str],
     last_game_number: int | None,
-    player_ffill: dict[str, dict[str, Any]],
-    team_ffill: dict[str, dict[str, Any]],
-    coach_ffill: dict[str, dict[str, Any]],
-    umpire_ffill: dict[str, dict[str, Any]],
+    player_ffill: FFillState,
+    team_ffill: FFillState,
+    coach_ffill: FFillState,
+    umpire_ffill: FFillState,
 ) -> GameModel:
     """Create a game model by combining many game models."""
     umpires: dict[str, list[UmpireModel]] = {}
@@ -100,47 +104,23 @@ def create_combined_game_model(
     full_team_models = _team_models(
         game_models,
         team_identity_map,
-        player_identity_map,
-        names,
-        coach_names,
+        player_identities,
+        coach_identities,
         player_ffill,
         team_ffill,
         coach_ffill,
     )
-    attendance = None
-    end_dt = None
-    year = None
-    season_type = None
-    week = None
-    game_number = None
-    postponed = None
-    play_off = None
-    distance = None
     dividends = []
-    pot = None
     dt_votes: dict[str, int] = {}
     for game_model in game_models:
         dt_votes[game_model.dt.isoformat()] = (
             dt_votes.get(game_model.dt.isoformat(), 0) + 1
         )
-        attendance = more_interesting(attendance, game_model.attendance)
-        end_dt = more_interesting(end_dt, game_model.end_dt)
-        year = more_interesting(year, game_model.year)
-        season_type = more_interesting(season_type, game_model.season_type)
-        week = more_interesting(week, game_model.week)
-        game_number = more_interesting(game_number, game_model.game_number)
-        postponed = more_interesting(postponed, game_model.postponed)
-        play_off = more_interesting(play_off, game_model.play_off)
-        distance = more_interesting(distance, game_model.distance)
         dividends.extend(game_model.dividends)
-        pot = more_interesting(pot, game_model.pot)
         for umpire_model in game_model.umpires:
-            umpire_id = umpire_model.identifier
-            umpire_name_key = normalise_name(umpire_model.name)
-            if umpire_name_key in names:
-                umpire_id = names[umpire_name_key]
-            else:
-                names[umpire_name_key] = umpire_id
+            umpire_id = umpire_identities.resolve(
+                umpire_model.identifier, umpire_model.name
+            )
             umpires[umpire_id] = umpires.get(umpire_id, []) + [umpire_model]
 
     dt = None
@@ -155,27 +135,19 @@ def create_combined_game_model(
             if venue_model_identifier is not None:
                 full_venue_identity = venue_model_identifier
 
-    if game_number is None and last_game_number is not None:
-        game_number = last_game_number + 1
+    values = combine_fields(game_models, exclude=_EXCLUDED_FIELDS)
+    if values["game_number"] is None and last_game_number is not None:
+        values["game_number"] = last_game_number + 1
 
     return GameModel(
         dt=dt,
-        week=week,
-        game_number=game_number,
         venue=create_combined_venue_model(venue_models, full_venue_identity, session),  # pyright: ignore
         teams=full_team_models,
-        end_dt=end_dt,
-        attendance=attendance,
         league=str(game_models[0].league),
-        year=year,
-        season_type=season_type,
-        postponed=postponed,
-        play_off=play_off,
-        distance=distance,
         dividends=dividends,
-        pot=pot,
-        version=VERSION,
         umpires=[
             create_combined_umpire_model(v, k, umpire_ffill) for k, v in umpires.items()
         ],
+        version=VERSION,
+        **values,
     )
@@ -1,22 +1,186 @@
 """Combined league model."""
 
-# pylint: disable=raise-missing-from,too-many-locals
+# pylint: disable=raise-missing-from,too-many-locals,too-many-instance-attributes,too-many-statements
+import bisect
+import contextlib
 import datetime
 import logging
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Iterator
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, NamedTuple
 
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
+from ..coach_model import VERSION as COACH_VERSION
+from ..coach_model import CoachModel
 from ..game_model import GameModel
 from ..league import League
 from ..league_model import LeagueModel
+from ..player_model import VERSION as PLAYER_VERSION
+from ..player_model import PlayerModel
+from ..team_model import VERSION as TEAM_VERSION
+from ..team_model import TeamModel
+from ..umpire_model import VERSION as UMPIRE_VERSION
+from ..umpire_model import UmpireModel
 from .combined_game_model import create_combined_game_model
+from .ffill import FFillStore
+from .game_index import MATCH_DAYS, GameIndex
+from .identity_table import IdentityTable
 
+# Games are combined once every provider has moved this far past their date, which
+# has to leave room for the days a game can be matched across.
+MERGE_WINDOW = datetime.timedelta(days=MATCH_DAYS + 1)
+QUEUE_SIZE = 256
+# Run each provider in its own process rather than a thread of this one.
+USE_PROCESSES = False
+# How long a provider process gets to finish before it is terminated.
+PROCESS_JOIN_SECONDS = 5.0
+# A file to carry the forward filled player, team, coach and umpire values between runs.
+FFILL_PATH: str | None = None
+# A file to carry the canonical player, coach and umpire identifiers between runs.
+IDENTITY_PATH: str | None = None
+_DONE = "done"
 
-def _produce_league_games(league_model: LeagueModel) -> list[dict[str, Any]]:
-    return [x.model_dump() for x in league_model.games]
+
+class _ProviderError(NamedTuple):
+    """A provider's failure, formatted so it can cross a process boundary."""
+
+    name: str
+    formatted: str
+
+
+def _put(games_queue: Any, stop: Any, item: Any) -> bool:
+    while not stop.is_set():
+        try:
+            games_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_league_games(
+    league_model: LeagueModel,
+    index: int,
+    games_queue: Any,
+    stop: Any,
+) -> None:
+    # pylint: disable=broad-exception-caught
+    try:
+        for game_model in league_model.games:
+            # The model is handed over as is, as re-validating a dump of it is expensive.
+            # Across processes it is pickled, which restores it without validation.
+            if not _put(games_queue, stop, (index, game_model)):
+                return
+        _put(games_queue, stop, (index, _DONE))
+    except Exception:
+        # The exception itself may not pickle, which would drop it on the way to the
+        # parent process.
+        _put(
+            games_queue,
+            stop,
+            (index, _ProviderError(league_model.name(), traceback.format_exc())),
+        )
+
+
+class _ProviderProgress:
+    """Tracks the runs of dates a provider has moved through."""
+
+    def __init__(self) -> None:
+        self.done = False
+        self.ordered = True
+        self.direction = 0
+        self.start: datetime.date | None = None
+        self.watermark: datetime.date | None = None
+        self._first: datetime.date | None = None
+        self._first_direction = 0
+        self._runs: list[tuple[datetime.date, datetime.date]] = []
+
+    def _overlaps(self, start: datetime.date, end: datetime.date) -> bool:
+        lo, hi = min(start, end), max(start, end)
+        return any(x <= hi and y >= lo for x, y in self._runs)
+
+    def advance(self, date: datetime.date) -> None:
+        """Record that the provider produced a game on a date."""
+        if self.start is None or self.watermark is None:
+            self.start = date
+            self.watermark = date
+            self._first = date
+            return
+        if not self.ordered or date == self.watermark:
+            return
+        direction = 1 if date > self.watermark else -1
+        if self.direction == 0:
+            self.direction = direction
+            if not self._runs:
+                self._first_direction = direction
+        if direction == self.direction:
+            if self._overlaps(self.watermark, date):
+                self.ordered = False
+            self.watermark = date
+        elif abs(date - self.watermark) > MERGE_WINDOW:
+            if self._overlaps(date, date) or (
+                min(self.start, self.watermark)
+                <= date
+                <= max(self.start, self.watermark)
+            ):
+                # The provider went back over its own dates, so nothing is safe until
+                # it finishes.
+                self.ordered = False
+                return
+            # The provider jumped to dates it has not produced yet, such as the day
+            # before it started, and begins a new run from there.
+            self._runs.append(
+                (min(self.start, self.watermark), max(self.start, self.watermark))
+            )
+            self.start = date
+            self.watermark = date
+            self.direction = 0
+
+    def passed(self) -> list[tuple[datetime.date, datetime.date]] | None:
+        """The ranges of dates the provider can no longer produce games on, or None for all."""
+        if self.done:
+            return None
+        if not self.ordered or self.start is None or self.watermark is None:
+            return []
+        runs = list(self._runs)
+        # The watermark itself can still get more games.
+        if self.direction > 0 and self.watermark > self.start:
+            runs.append((self.start, self.watermark - datetime.timedelta(days=1)))
+        elif self.direction < 0 and self.watermark < self.start:
+            runs.append((self.watermark + datetime.timedelta(days=1), self.start))
+        merged: list[tuple[datetime.date, datetime.date]] = []
+        for lo, hi in sorted(runs):
+            if merged and lo <= merged[-1][1] + datetime.timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+            else:
+                merged.append((lo, hi))
+        # Games can still be matched across the edges of a range, except behind the
+        # date the provider started from.
+        ranges = []
+        for lo, hi in merged:
+            if lo != self._first or self._first_direction < 0:
+                lo += MERGE_WINDOW
+            if hi != self._first or self._first_direction > 0:
+                hi -= MERGE_WINDOW
+            if lo <= hi:
+                ranges.append((lo, hi))
+        return ranges
+
+
+def _intersect(
+    ranges: list[tuple[datetime.date, datetime.date]],
+    other: list[tuple[datetime.date, datetime.date]],
+) -> list[tuple[datetime.date, datetime.date]]:
+    intersection = []
+    for lo, hi in ranges:
+        for other_lo, other_hi in other:
+            if max(lo, other_lo) <= min(hi, other_hi):
+                intersection.append((max(lo, other_lo), min(hi, other_hi)))
+    return intersection
 
 
 class CombinedLeagueModel(LeagueModel):
@@ -57,79 +221,180 @@ class CombinedLeagueModel(LeagueModel):
 
     @property
     def games(self) -> Iterator[GameModel]:
-        games: dict[str, list[GameModel]] = {}
         team_identity_map = self.team_identity_map()
+        game_index = GameIndex(team_identity_map)
+        progress = [_ProviderProgress() for _ in self._league_models]
+        player_identities = IdentityTable(
+            "player", identity_map=self.player_identity_map(), path=IDENTITY_PATH
+        )
+        coach_identities = IdentityTable("coach", path=IDENTITY_PATH)
+        umpire_identities = IdentityTable("umpire", path=IDENTITY_PATH)
+        player_ffill = FFillStore(
+            "player", PlayerModel, PLAYER_VERSION, path=FFILL_PATH
+        )
+        team_ffill = FFillStore("team", TeamModel, TEAM_VERSION, path=FFILL_PATH)
+        coach_ffill = FFillStore("coach", CoachModel, COACH_VERSION, path=FFILL_PATH)
+        umpire_ffill = FFillStore(
+            "umpire", UmpireModel, UMPIRE_VERSION, path=FFILL_PATH
+        )
+        last_game_number = None
+
+        def _combine(bucket_ids: list[int]) -> Iterator[GameModel]:
+            nonlocal last_game_number
+            for bucket_id in bucket_ids:
+                game_model = create_combined_game_model(  # type: ignore
+                    game_models=game_index.pop(bucket_id),
+                    venue_identity_map=self.venue_identity_map(),
+                    team_identity_map=team_identity_map,
+                    player_identities=player_identities,
+                    coach_identities=coach_identities,
+                    umpire_identities=umpire_identities,
+                    session=self.session,
+                    last_game_number=last_game_number,
+                    player_ffill=player_ffill,
+                    team_ffill=team_ffill,
+                    coach_ffill=coach_ffill,
+                    umpire_ffill=umpire_ffill,
+                )
+                last_game_number = game_model.game_number
+                yield game_model
+
         for league_model in self._league_models:
             league_model.clear_session()
-        with ThreadPoolExecutor(
-            min(multiprocessing.cpu_count(), len(self._league_models))
-        ) as p:
-            # We want to terminate immediately if any of our runners runs into trouble.
+        run_providers = (
+            self._run_provider_processes
+            if USE_PROCESSES
+            else self._run_provider_threads
+        )
+        # The buckets waiting on a provider, by date.
+        pending: dict[datetime.date, list[int]] = {}
+        pending_dates: list[datetime.date] = []
+        direction = 0
 
-            futures = {
-                p.submit(_produce_league_games, model): model
-                for model in self._league_models
-            }
+        def _ready() -> list[int]:
+            ranges: list[tuple[datetime.date, datetime.date]] | None = None
+            for provider_progress in progress:
+                passed = provider_progress.passed()
+                if passed is None:
+                    continue
+                ranges = passed if ranges is None else _intersect(ranges, passed)
+            if ranges is None:
+                ranges = [(datetime.date.min, datetime.date.max)]
+            dates = []
+            for lo, hi in ranges:
+                start = bisect.bisect_left(pending_dates, lo)
+                end = bisect.bisect_right(pending_dates, hi)
+                dates.extend(pending_dates[start:end])
+                del pending_dates[start:end]
+            # Combined games come out in the date order the providers move in.
+            dates.sort(reverse=direction < 0)
+            return [x for date in dates for x in pending.pop(date)]
 
-            results = []
+        try:
+            with run_providers() as next_item:
+                while not all(x.done for x in progress):
+                    index, item = next_item()
+                    if item == _DONE:
+                        progress[index].done = True
+                    elif isinstance(item, _ProviderError):
+                        # We want to terminate immediately if any of our runners runs
+                        # into trouble.
+                        raise RuntimeError(f"{item.name} failed:\n{item.formatted}")
+                    else:
+                        progress[index].advance(item.dt.date())
+                        if not direction:
+                            direction = next(
+                                (x.direction for x in progress if x.direction), 0
+                            )
+                        size = len(game_index)
+                        bucket_id = game_index.add(index, item)
+                        if len(game_index) > size:
+                            date = game_index.date(bucket_id)
+                            if date not in pending:
+                                bisect.insort(pending_dates, date)
+                            pending.setdefault(date, []).append(bucket_id)
+                    # Combine the games every provider has moved past. The slowest
+                    # provider holds back the rest.
+                    yield from _combine(_ready())
+        finally:
+            for ffill_store in (player_ffill, team_ffill, coach_ffill, umpire_ffill):
+                ffill_store.flush()
+            for identities in (player_identities, coach_identities, umpire_identities):
+                identities.flush()
+                logging.info(
+                    "%d %s identities, %d identifiers merged into them by name.",
+                    len(identities),
+                    identities.kind,
+                    identities.collisions,
+                )
+
+    @contextlib.contextmanager
+    def _run_provider_threads(self) -> Iterator[Callable[[], tuple[int, Any]]]:
+        games_queue: queue.Queue = queue.Queue(QUEUE_SIZE)
+        stop = threading.Event()
+        # Every provider runs at once, as the merge waits on the slowest of them.
+        with ThreadPoolExecutor(len(self._league_models)) as p:
+            for index, model in enumerate(self._league_models):
+                p.submit(_produce_league_games, model, index, games_queue, stop)
             try:
-                for future in as_completed(futures):
-                    result = future.result()  # Raises if an exception occurred
-                    results.append(result)
-            except Exception:
-                # Cancel all pending futures
-                for f in futures:
-                    f.cancel()
-                raise  # Optionally re-raise the exception
-        game_lists = [[GameModel.model_validate(y) for y in x] for x in results]
-
-        for game_list in game_lists:
-            for game_model in game_list:
-                old_game_components = [
-                    str(game_model.dt.date() - datetime.timedelta(days=1))
-                ]
-                game_components = [str(game_model.dt.date())]
-                for team in game_model.teams:
-                    if team.identifier not in team_identity_map:
-                        logging.warning(
-                            "%s for team %s not found in team identity map.",
-                            team.identifier,
-                            team.name,
-                        )
-                    team_identifier = team_identity_map.get(
-                        team.identifier, team.identifier
-                    )
-                    old_game_components.append(team_identifier)
-                    game_components.append(team_identifier)
-                old_game_components = sorted(game_components)
-                game_components = sorted(game_components)
-                key = "-".join(old_game_components)
-                if key in games:
-                    games[key].append(game_model)
-                else:
-                    key = "-".join(game_components)
-                    games[key] = [game_model]
-        names: dict[str, str] = {}
-        coach_names: dict[str, str] = {}
-        player_ffill: dict[str, dict[str, Any]] = {}
-        team_ffill: dict[str, dict[str, Any]] = {}
-        coach_ffill: dict[str, dict[str, Any]] = {}
-        umpire_ffill: dict[str, dict[str, Any]] = {}
-        last_game_number = None
-        for game_models in games.values():
-            game_model = create_combined_game_model(  # type: ignore
-                game_models=game_models,
-                venue_identity_map=self.venue_identity_map(),
-                team_identity_map=team_identity_map,
-                player_identity_map=self.player_identity_map(),
-                session=self.session,
-                names=names,
-                coach_names=coach_names,
-                last_game_number=last_game_number,
-                player_ffill=player_ffill,
-                team_ffill=team_ffill,
-                coach_ffill=coach_ffill,
-                umpire_ffill=umpire_ffill,
+                yield games_queue.get
+            finally:
+                stop.set()
+
+    @contextlib.contextmanager
+    def _run_provider_processes(self) -> Iterator[Callable[[], tuple[int, Any]]]:
+        # Forked providers inherit the configured globals and open their own sessions.
+        context = multiprocessing.get_context("fork")
+        games_queue = context.Queue(QUEUE_SIZE)
+        stop = context.Event()
+        processes = [
+            context.Process(
+                target=_produce_league_games,
+                args=(model, index, games_queue, stop),
+                name=f"sportsball-{model.name()}",
             )
-            last_game_number = game_model.game_number
-            yield game_model
+            for index, model in enumerate(self._league_models)
+        ]
+
+        finished: set[int] = set()
+
+        def _get(timeout: float) -> tuple[int, Any]:
+            index, item = games_queue.get(timeout=timeout)
+            if item == _DONE or isinstance(item, _ProviderError):
+                finished.add(index)
+            return index, item
+
+        def _next_item() -> tuple[int, Any]:
+            while True:
+                try:
+                    return _get(1.0)
+                except queue.Empty:
+                    # A child whose last item failed to pickle exits without finishing.
+                    exited = [
+                        x
+                        for index, x in enumerate(processes)
+                        if x.exitcode is not None and index not in finished
+                    ]
+                    if not exited:
+                        continue
+                    # Anything a child put before it exited has reached the pipe.
+                    try:
+                        return _get(1.0)
+                    except queue.Empty as exc:
+                        raise RuntimeError(
+                            f"{exited[0].name} exited with code {exited[0].exitcode} "
+                            "before it finished."
+                        ) from exc
+
+        for process in processes:
+            process.start()
+        try:
+            yield _next_item
+        finally:
+            stop.set()
+            for process in processes:
+                process.join(PROCESS_JOIN_SECONDS)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            games_queue.close()
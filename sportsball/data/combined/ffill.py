@@ -1,23 +1,177 @@
 """A function for forward filling."""
 
+# pylint: disable=too-many-instance-attributes,too-many-arguments
+
+import functools
+import json
+import logging
+import typing
+from collections import OrderedDict
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 from ..field_type import FFILL_KEY
+from ..sqlite_table import SQLiteTable
+
+DEFAULT_MAX_SIZE = 65536
+
+
+class FFillStore:
+    """A size bounded map of identifiers to their last known forward fill values."""
+
+    def __init__(
+        self,
+        kind: str,
+        model_class: type[BaseModel],
+        version: str,
+        path: str | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self._kind = kind
+        self._model_class = model_class
+        self._version = version
+        self._max_size = max_size
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._table = None if path is None else SQLiteTable(path, "ffill", kind)
+        self._dropped = 0
+
+    def _write(self, entries: list[tuple[str, dict[str, Any]]]) -> None:
+        if self._table is None:
+            return
+        values_class = _ffill_values(self._model_class)
+        self._table.update(
+            (
+                x,
+                json.dumps(
+                    {
+                        "version": self._version,
+                        "values": values_class(**y).model_dump(
+                            mode="json", by_alias=True, exclude_unset=True
+                        ),
+                    }
+                ),
+            )
+            for x, y in entries
+        )
+
+    def _read(self, identifier: str) -> dict[str, Any] | None:
+        if self._table is None:
+            return None
+        row = self._table.get(identifier)
+        if row is None:
+            return None
+        stored = json.loads(row)
+        # Values written by another version of the model may not mean the same thing.
+        if stored["version"] != self._version:
+            return None
+        values = _ffill_values(self._model_class).model_validate(stored["values"])
+        return {x: getattr(values, x) for x in values.model_fields_set}
+
+    def get(
+        self, identifier: str, default: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Find the forward fill values of an identifier."""
+        state = self._entries.get(identifier)
+        if state is not None:
+            self._entries.move_to_end(identifier)
+            return state
+        state = self._read(identifier)
+        if state is not None:
+            self._entries[identifier] = state
+            self._evict()
+            return state
+        return default
+
+    def __setitem__(self, identifier: str, state: dict[str, Any]) -> None:
+        self._entries[identifier] = state
+        self._entries.move_to_end(identifier)
+        self._dirty.add(identifier)
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        # Evicted values are only kept if they can be written out.
+        evicted = []
+        while len(self._entries) > self._max_size:
+            identifier, state = self._entries.popitem(last=False)
+            if identifier in self._dirty:
+                self._dirty.remove(identifier)
+                evicted.append((identifier, state))
+        if evicted and self._table is None:
+            if not self._dropped:
+                logging.warning(
+                    "Dropping %s forward fill values past %d entries, "
+                    "as there is no path to write them to.",
+                    self._kind,
+                    self._max_size,
+                )
+            self._dropped += len(evicted)
+        self._write(evicted)
+
+    def flush(self) -> None:
+        """Write the changed forward fill values out."""
+        self._write([(x, self._entries[x]) for x in self._dirty])
+        self._dirty.clear()
+        if self._dropped:
+            logging.info(
+                "%d %s forward fill values dropped.", self._dropped, self._kind
+            )
+
+
+FFillState = dict[str, dict[str, Any]] | FFillStore
+
+
+def _ffill_fields(model_class: type[BaseModel]) -> list[str]:
+    return [
+        x
+        for x, y in model_class.model_fields.items()
+        if (y.json_schema_extra or {}).get(FFILL_KEY, False)  # type: ignore
+    ]
+
+
+@functools.cache
+def _ffill_plan(model_class: type[BaseModel]) -> tuple[tuple[str, bool], ...]:
+    return tuple(
+        (x, typing.get_origin(model_class.model_fields[x].annotation) is list)
+        for x in _ffill_fields(model_class)
+    )
+
+
+@functools.cache
+def _ffill_values(model_class: type[BaseModel]) -> type[BaseModel]:
+    # A model of just the forward filled fields, to write them out as JSON.
+    fields: dict[str, Any] = {
+        x: (
+            model_class.model_fields[x].annotation,
+            Field(None, alias=model_class.model_fields[x].alias),
+        )
+        for x in _ffill_fields(model_class)
+    }
+    return create_model(
+        f"{model_class.__name__}FFill",
+        __config__=ConfigDict(populate_by_name=True),
+        **fields,
+    )
 
 
-def ffill(ffill_dict: dict[str, Any], identifier: str, model: BaseModel) -> None:
+def ffill(ffill_dict: FFillState, identifier: str, model: BaseModel) -> None:
     """Forward fill a dictionary."""
-    instance_ffil = ffill_dict.get(identifier, {})
-    for field_name, field in model.model_fields.items():
-        extra = field.json_schema_extra or {}
-        if extra.get(FFILL_KEY, False):  # type: ignore
-            current_value = getattr(model, field_name)
-            if current_value is None or (
-                isinstance(current_value, list) and not current_value
-            ):
-                setattr(model, field_name, instance_ffil.get(field_name))
-            else:
-                instance_ffil[field_name] = current_value
-    ffill_dict[identifier] = instance_ffil
+    plan = _ffill_plan(type(model))
+    if not plan:
+        return
+    instance_ffil = ffill_dict.get(identifier) or {}
+    changed = False
+    for field_name, is_list in plan:
+        current_value = getattr(model, field_name)
+        if current_value is None or (is_list and not current_value):
+            setattr(model, field_name, instance_ffil.get(field_name))
+        elif instance_ffil.get(field_name) != current_value:
+            instance_ffil[field_name] = current_value
+            changed = True
+    # Only changed values have to be written out again.
+    if changed:
+        ffill_dict[identifier] = instance_ffil
@@ -0,0 +1,127 @@
+"""An index matching the games of different providers to each other."""
+
+import bisect
+import datetime
+import logging
+from typing import Iterator
+
+from ..game_model import GameModel
+
+# How many days apart the same game can be reported, as providers disagree on timezones.
+MATCH_DAYS = 1
+
+
+def _apart(left: datetime.datetime, right: datetime.datetime) -> datetime.timedelta:
+    if left.tzinfo is None or right.tzinfo is None:
+        left = left.replace(tzinfo=None)
+        right = right.replace(tzinfo=None)
+    return abs(left - right)
+
+
+class _Bucket:
+    """The games of each provider that are the same game."""
+
+    __slots__ = ("team_key", "date", "dt", "game_models", "providers")
+
+    def __init__(self, team_key: tuple[str, ...], game_model: GameModel) -> None:
+        self.team_key = team_key
+        self.date = game_model.dt.date()
+        self.dt = game_model.dt
+        self.game_models: list[GameModel] = []
+        self.providers: set[int] = set()
+
+    def add(self, provider: int, game_model: GameModel) -> None:
+        """Add a provider's report of the game."""
+        self.game_models.append(game_model)
+        self.providers.add(provider)
+
+    def apart(self, game_model: GameModel) -> datetime.timedelta:
+        """How far apart a game is from the first game in the bucket."""
+        return _apart(self.dt, game_model.dt)
+
+
+class GameIndex:
+    """Buckets games by their teams, matching dates within a tolerance."""
+
+    def __init__(
+        self, team_identity_map: dict[str, str], match_days: int = MATCH_DAYS
+    ) -> None:
+        self._team_identity_map = team_identity_map
+        self._match_days = datetime.timedelta(days=match_days)
+        self._buckets: dict[int, _Bucket] = {}
+        self._dates: dict[tuple[str, ...], list[tuple[datetime.date, int]]] = {}
+        self._next_bucket = 0
+
+    def _team_key(self, game_model: GameModel) -> tuple[str, ...]:
+        team_identifiers = []
+        for team in game_model.teams:
+            if team.identifier not in self._team_identity_map:
+                logging.warning(
+                    "%s for team %s not found in team identity map.",
+                    team.identifier,
+                    team.name,
+                )
+            team_identifiers.append(
+                self._team_identity_map.get(team.identifier, team.identifier)
+            )
+        return tuple(sorted(team_identifiers))
+
+    def _match(
+        self, team_key: tuple[str, ...], provider: int, game_model: GameModel
+    ) -> int | None:
+        dates = self._dates.get(team_key)
+        if not dates:
+            return None
+        date = game_model.dt.date()
+        # Games without teams can only be told apart by their date.
+        match_days = self._match_days if team_key else datetime.timedelta()
+        start = bisect.bisect_left(dates, (date - match_days, -1))
+        best = None
+        best_apart = None
+        for i in range(start, len(dates)):
+            bucket_date, bucket_id = dates[i]
+            if bucket_date > date + match_days:
+                break
+            bucket = self._buckets[bucket_id]
+            # A provider never reports the same game twice.
+            if provider in bucket.providers:
+                continue
+            apart = bucket.apart(game_model)
+            if best_apart is None or apart < best_apart:
+                best = bucket_id
+                best_apart = apart
+        return best
+
+    def add(self, provider: int, game_model: GameModel) -> int:
+        """Add a provider's game, returning the bucket it was matched to."""
+        team_key = self._team_key(game_model)
+        bucket_id = self._match(team_key, provider, game_model)
+        if bucket_id is None:
+            bucket_id = self._next_bucket
+            self._next_bucket += 1
+            bucket = _Bucket(team_key, game_model)
+            self._buckets[bucket_id] = bucket
+            bisect.insort(
+                self._dates.setdefault(team_key, []), (bucket.date, bucket_id)
+            )
+        self._buckets[bucket_id].add(provider, game_model)
+        return bucket_id
+
+    def date(self, bucket_id: int) -> datetime.date:
+        """The date of the first game in a bucket."""
+        return self._buckets[bucket_id].date
+
+    def pop(self, bucket_id: int) -> list[GameModel]:
+        """Remove a bucket, returning its games."""
+        bucket = self._buckets.pop(bucket_id)
+        dates = self._dates[bucket.team_key]
+        dates.pop(bisect.bisect_left(dates, (bucket.date, bucket_id)))
+        if not dates:
+            del self._dates[bucket.team_key]
+        return bucket.game_models
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._buckets))
+
+    def __len__(self) -> int:
+        return len(self._buckets)
@@ -0,0 +1,64 @@
+"""A table resolving the identities of an entity across providers."""
+
+import sys
+
+from ..sqlite_table import SQLiteTable
+from .normalise_name import normalise_name
+
+
+class IdentityTable:
+    """Resolves the identifiers of one kind of entity to a canonical identifier."""
+
+    def __init__(
+        self,
+        kind: str,
+        identity_map: dict[str, str] | None = None,
+        path: str | None = None,
+    ) -> None:
+        self.kind = kind
+        self._identity_map = identity_map or {}
+        self._table = None if path is None else SQLiteTable(path, "identities", kind)
+        self._identifiers: dict[str, str] | None = None
+        self._dirty: set[str] = set()
+        self._collisions: set[str] = set()
+
+    def _load(self) -> dict[str, str]:
+        if self._identifiers is None:
+            self._identifiers = {}
+            if self._table is not None:
+                self._identifiers = {
+                    name: sys.intern(identifier)
+                    for name, identifier in self._table.items()
+                }
+        return self._identifiers
+
+    def resolve(self, identifier: str, name: str) -> str:
+        """Find the canonical identifier of an entity from its identifier and name."""
+        canonical = self._identity_map.get(identifier)
+        if canonical is not None:
+            return canonical
+        identifiers = self._load()
+        name_key = normalise_name(name)
+        canonical = identifiers.get(name_key)
+        if canonical is None:
+            canonical = sys.intern(identifier)
+            identifiers[name_key] = canonical
+            self._dirty.add(name_key)
+        elif canonical != identifier:
+            self._collisions.add(identifier)
+        return canonical
+
+    @property
+    def collisions(self) -> int:
+        """The number of identifiers that resolved to another identifier by name."""
+        return len(self._collisions)
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def flush(self) -> None:
+        """Write the new canonical identifiers out."""
+        if self._table is None or self._identifiers is None:
+            return
+        self._table.update((x, self._identifiers[x]) for x in self._dirty)
+        self._dirty.clear()
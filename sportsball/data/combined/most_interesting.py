@@ -7,6 +7,17 @@ from typing import Any
 from .null_check import is_null
 
 
+def more_interesting_datetime(
+    left: datetime.datetime, right: datetime.datetime
+) -> datetime.datetime:
+    """Return the datetime with the more interesting time of day."""
+    if left.hour == 0 and right.hour != 0:
+        return right
+    if left.minute == 0 and right.minute != 0:
+        return right
+    return left
+
+
 def more_interesting(left: Any, right: Any) -> Any:
     """Return the more interesting object."""
     if is_null(left):
@@ -14,11 +25,7 @@ def more_interesting(left: Any, right: Any) -> Any:
     if is_null(right):
         return left
     if isinstance(left, datetime.datetime) and isinstance(right, datetime.datetime):
-        if left.hour == 0 and right.hour != 0:
-            return right
-        if left.minute == 0 and right.minute != 0:
-            return right
-        return left
+        return more_interesting_datetime(left, right)
     if isinstance(left, float) and isinstance(right, float):
         if left == 0.0 and right != 0.0:
             return right
@@ -9,6 +9,11 @@ def is_null(obj: Any) -> bool:
     """Whether the object is a null type object."""
     if obj is None:
         return True
+    if isinstance(obj, (str, int)):
+        return False
+    if isinstance(obj, float):
+        # NaN is the only float that does not equal itself.
+        return obj != obj  # pylint: disable=comparison-with-itself
     try:
         if np.isnan(obj):
             return True
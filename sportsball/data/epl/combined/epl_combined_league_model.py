@@ -5,6 +5,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.epl_espn_league_model import EPLESPNLeagueModel
 from ..oddsportal.epl_oddsportal_league_model import EPLOddsPortalLeagueModel
 from ..sportsdb.epl_sportsdb_league_model import EPLSportsDBLeagueModel
@@ -17,15 +18,20 @@ EPL_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class EPLCombinedLeagueModel(CombinedLeagueModel):
     """NBA combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.EPL,
             [
-                EPLESPNLeagueModel(session, position=0),
+                EPLESPNLeagueModel(session, position=0, workers=workers),
                 EPLSportsDBLeagueModel(session, position=1),
-                EPLOddsPortalLeagueModel(session, position=2),
-                # EPLSportsReferenceLeagueModel(session, position=3),
+                EPLOddsPortalLeagueModel(session, position=2, workers=workers),
+                # EPLSportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
@@ -2,6 +2,7 @@
 
 # pylint: disable=too-many-locals,too-many-arguments,line-too-long,too-many-branches,too-many-statements
 import datetime
+import logging
 from typing import Any, Iterator
 from urllib.parse import urlparse
 
@@ -11,9 +12,12 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ..game_model import GameModel
 from ..league import League
-from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..league_model import (SHUTDOWN_FLAG, LeagueModel, before_incremental,
+                            needs_shutdown)
 from ..season_type import SeasonType
+from ..worker_settings import WorkerSettings
 from .espn_game_model import create_espn_game_model
+from .espn_ref_cache import REF_CACHE
 
 
 def _season_type_from_name(name: str) -> SeasonType:
@@ -49,9 +53,11 @@ class ESPNLeagueModel(LeagueModel):
         league: League,
         session: ScrapeSession,
         position: int | None = None,
+        workers: WorkerSettings | None = None,
     ) -> None:
         super().__init__(league, session, position=position)
         self._start_url = start_url
+        self._pool = (workers or WorkerSettings()).espn
 
     @classmethod
     def name(cls) -> str:
@@ -73,29 +79,40 @@ class ESPNLeagueModel(LeagueModel):
         season_type_json: dict[str, Any],
         pbar: tqdm.tqdm,
     ) -> GameModel:
-        if cache_disabled:
-            with self.session.cache_disabled():
-                event_response = self.session.get(event_item["$ref"])
-        else:
-            event_response = self.session.get(event_item["$ref"])
-        event_response.raise_for_status()
-        event = event_response.json()
-        game_model = create_espn_game_model(
-            event,
-            week_count,
-            game_number,
-            self.session,
-            self.league,
-            season_type_json.get("year"),
-            _season_type_from_name(season_type_json["name"]),
-            self.position_validator(),
-        )
+        session = self._worker_session()
+        with session.wayback_disabled():
+            if cache_disabled:
+                with session.cache_disabled():
+                    event_response = session.get(event_item["$ref"])
+            else:
+                event_response = session.get(event_item["$ref"])
+            event_response.raise_for_status()
+            event = event_response.json()
+            game_model = create_espn_game_model(
+                event,
+                week_count,
+                game_number,
+                session,
+                self.league,
+                season_type_json.get("year"),
+                _season_type_from_name(season_type_json["name"]),
+                self.position_validator(),
+            )
         pbar.update(1)
         pbar.set_description(
             f"ESPN {game_model.year} - {game_model.season_type} - {game_model.dt}"
         )
         return game_model
 
+    def _produce_ordered_games(self, jobs: list[dict[str, Any]]) -> Iterator[GameModel]:
+        executor = self._executor
+        if executor is None:
+            for job in jobs:
+                yield self._produce_game(**job)
+            return
+        # The events are fetched concurrently but yielded in their original order.
+        yield from executor.map(lambda x: self._produce_game(**x), jobs)
+
     def _produce_games(
         self,
         week: dict[str, Any],
@@ -114,16 +131,20 @@ class ESPNLeagueModel(LeagueModel):
             )
             events_response.raise_for_status()
             events = events_response.json()
+            jobs = []
             for event_item in events["items"]:
-                yield self._produce_game(
-                    event_item=event_item,
-                    game_number=events_count,
-                    week_count=week_count,
-                    cache_disabled=cache_disabled,
-                    season_type_json=season_type_json,
-                    pbar=pbar,
+                jobs.append(
+                    {
+                        "event_item": event_item,
+                        "game_number": events_count,
+                        "week_count": week_count,
+                        "cache_disabled": cache_disabled,
+                        "season_type_json": season_type_json,
+                        "pbar": pbar,
+                    }
                 )
                 events_count += 1
+            yield from self._produce_ordered_games(jobs)
             if events_page >= events["pageCount"]:
                 break
             events_page += 1
@@ -134,16 +155,20 @@ class ESPNLeagueModel(LeagueModel):
                 break
             qbr_response = self.session.get(week["qbr"]["$ref"] + f"&page={qbr_page}")
             qbr = qbr_response.json()
+            jobs = []
             for qbr_item in qbr["items"]:
-                yield self._produce_game(
-                    event_item=qbr_item["event"],
-                    game_number=qbr_count,
-                    week_count=week_count,
-                    cache_disabled=cache_disabled,
-                    season_type_json=season_type_json,
-                    pbar=pbar,
+                jobs.append(
+                    {
+                        "event_item": qbr_item["event"],
+                        "game_number": qbr_count,
+                        "week_count": week_count,
+                        "cache_disabled": cache_disabled,
+                        "season_type_json": season_type_json,
+                        "pbar": pbar,
+                    }
                 )
                 qbr_count += 1
+            yield from self._produce_ordered_games(jobs)
             if qbr_page >= qbr["pageCount"]:
                 break
             qbr_page += 1
@@ -222,24 +247,40 @@ class ESPNLeagueModel(LeagueModel):
                             parse(x).date() for x in calendar_list
                         }
                         calendar_dates &= declared_calendar_dates
+                jobs = []
                 for event in scoreboard["events"]:
                     event_id = event["id"]
-                    event_response = self.session.get(
-                        f"https://sports.core.api.espn.com/v2/sports/{sport_slug}/leagues/{league_slug}/events/{event_id}?lang=en&region=us"
-                    )
-                    event_response.raise_for_status()
-                    yield self._produce_game(
-                        event_item=event_response.json(),
-                        game_number=events_count,
-                        season_type_json=season_type_json,
-                        pbar=pbar,
-                        cache_disabled=cache_disabled,
-                        week_count=None,
+                    # The event itself is fetched by the worker that produces its game.
+                    jobs.append(
+                        {
+                            "event_item": {
+                                "$ref": f"https://sports.core.api.espn.com/v2/sports/{sport_slug}/leagues/{league_slug}/events/{event_id}?lang=en&region=us"
+                            },
+                            "game_number": events_count,
+                            "season_type_json": season_type_json,
+                            "pbar": pbar,
+                            "cache_disabled": cache_disabled,
+                            "week_count": None,
+                        }
                     )
                     events_count += 1
+                yield from self._produce_ordered_games(jobs)
 
     @property
     def games(self) -> Iterator[GameModel]:
+        try:
+            with self._worker_pool(
+                self._pool.max_workers, self._pool.requests_per_second
+            ):
+                yield from self._produce_season_games()
+        finally:
+            logging.info(
+                "ESPN reference cache: %d hits, %d misses.",
+                REF_CACHE.hits,
+                REF_CACHE.misses,
+            )
+
+    def _produce_season_games(self) -> Iterator[GameModel]:
         try:
             with self.session.wayback_disabled():
                 page = 1
@@ -261,6 +302,10 @@ class ESPNLeagueModel(LeagueModel):
                             season_response = self.session.get(item["$ref"])
                             season_response.raise_for_status()
                             season_json = season_response.json()
+                            if "endDate" in season_json and before_incremental(
+                                parse(season_json["endDate"])
+                            ):
+                                continue
 
                             for season_item in season_json["types"]["items"]:
                                 season_type_response = self.session.get(
@@ -17,6 +17,7 @@ from ..player_model import VERSION, PlayerModel
 from ..sex import Sex
 from ..species import Species
 from ..venue_model import VERSION as VENUE_VERSION
+from .espn_ref_cache import REF_CACHE
 from .espn_venue_model import create_espn_venue_model
 
 _BAD_URLS = {
@@ -24,6 +25,7 @@ _BAD_URLS = {
     "http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/2024/athletes/2333612?lang=en&region=us",
     "http://sports.core.api.espn.com/v2/sports/football/leagues/college-football/seasons/2021/athletes/4426888?lang=en&region=us",
 }
+_CURRENT_SEASON = datetime.timedelta(days=365)
 
 
 def _create_espn_player_model(
@@ -670,28 +672,22 @@ def _create_espn_player_model(
                         rushing_touchdowns_49_yards = stat["value"]
                     elif stat["name"] == "rushingTouchdownsOf50PlusYds":
                         rushing_touchdowns_above_50_yards = stat["value"]
-    athlete_dict = {}
+    current = dt.date() >= datetime.datetime.today().date() - _CURRENT_SEASON
+    athlete_dict: dict[str, Any] = {}
     athelete_url = player["athlete"]["$ref"]
     if athelete_url not in _BAD_URLS:
-        athlete_response = session.get(athelete_url)
-        athlete_response.raise_for_status()
-        athelete_url = athlete_response.url
-        athlete_dict = athlete_response.json()
-    position_dict = {}
+        athelete_url, athlete_dict = REF_CACHE.fetch(session, athelete_url, current)
+    position_dict: dict[str, Any] = {}
     if "position" in player:
-        position_response = session.get(player["position"]["$ref"])
-        position_response.raise_for_status()
-        position_dict = position_response.json()
-    college_dict = {}
+        _, position_dict = REF_CACHE.fetch(session, player["position"]["$ref"], current)
+    college_dict: dict[str, Any] = {}
     if "college" in athlete_dict:
         college_url = athlete_dict["college"]["$ref"]
         if (
             college_url
             != "http://sports.core.api.espn.com/v2/colleges/429?lang=en&region=us"
         ):
-            college_response = session.get(college_url)
-            college_response.raise_for_status()
-            college_dict = college_response.json()
+            _, college_dict = REF_CACHE.fetch(session, college_url, current)
     name = athlete_dict.get("fullName", identifier)
 
     birth_date = None
@@ -0,0 +1,88 @@
+"""An in-process cache of ESPN entity references."""
+
+import datetime
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import requests_cache
+
+DEFAULT_MAX_SIZE = 4096
+DEFAULT_CURRENT_TTL = datetime.timedelta(hours=1)
+
+
+class ESPNRefCache:
+    """A size bounded LRU of ESPN $ref responses keyed by their URL."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        current_ttl: datetime.timedelta = DEFAULT_CURRENT_TTL,
+    ) -> None:
+        self._max_size = max_size
+        self._current_ttl = current_ttl
+        self._entries: OrderedDict[
+            str, tuple[str, str, datetime.datetime | None]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resize(self, max_size: int) -> None:
+        """Change how many references the cache holds, evicting the oldest."""
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def fetch(
+        self, session: requests_cache.CachedSession, url: str, current: bool
+    ) -> tuple[str, dict[str, Any]]:
+        """Fetch the final URL and JSON for a reference, expiring current data after a TTL.
+
+        The response body is kept rather than its JSON, so each caller decodes its own copy.
+        """
+        now = datetime.datetime.now()
+        cached = None
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                final_url, text, expires = entry
+                if expires is None or expires > now:
+                    self._entries.move_to_end(url)
+                    self.hits += 1
+                    cached = final_url, text
+                else:
+                    del self._entries[url]
+            if cached is None:
+                self.misses += 1
+        if cached is not None:
+            return cached[0], json.loads(cached[1])
+
+        response = session.get(url)
+        response.raise_for_status()
+        final_url, text = response.url, response.text
+
+        with self._lock:
+            self._entries[url] = (
+                final_url,
+                text,
+                now + self._current_ttl if current else None,
+            )
+            self._entries.move_to_end(url)
+            self._evict()
+        return final_url, json.loads(text)
+
+    def clear(self) -> None:
+        """Clear the cache and its counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+REF_CACHE = ESPNRefCache()
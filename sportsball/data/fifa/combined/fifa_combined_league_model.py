@@ -5,6 +5,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.fifa_espn_league_model import FIFAESPNLeagueModel
 from ..oddsportal.fifa_oddsportal_league_model import FIFAOddsPortalLeagueModel
 from ..sportsdb.fifa_sportsdb_league_model import FIFASportsDBLeagueModel
@@ -17,15 +18,20 @@ FIFA_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class FIFACombinedLeagueModel(CombinedLeagueModel):
     """FIFA combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.FIFA,
             [
                 FIFASportsDBLeagueModel(session, position=0),
-                FIFAOddsPortalLeagueModel(session, position=1),
-                FIFAESPNLeagueModel(session, position=2),
-                # FIFASportsReferenceLeagueModel(session, position=3),
+                FIFAOddsPortalLeagueModel(session, position=1, workers=workers),
+                FIFAESPNLeagueModel(session, position=2, workers=workers),
+                # FIFASportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
@@ -6,6 +6,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from ...epl.position import Position
 from ...espn.espn_league_model import ESPNLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 
 _SEASON_URL = "http://sports.core.api.espn.com/v2/sports/soccer/leagues/fifa.world/seasons?limit=100"
 
@@ -13,8 +14,15 @@ _SEASON_URL = "http://sports.core.api.espn.com/v2/sports/soccer/leagues/fifa.wor
 class FIFAESPNLeagueModel(ESPNLeagueModel):
     """FIFA ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.FIFA, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL, League.FIFA, session, position=position, workers=workers
+        )
 
     @classmethod
     def name(cls) -> str:
@@ -8,17 +8,24 @@ from ...epl.position import Position
 from ...league import League
 from ...sportsreference.sportsreference_league_model import \
     SportsReferenceLeagueModel
+from ...worker_settings import WorkerSettings
 
 
 class FIFASportsReferenceLeagueModel(SportsReferenceLeagueModel):
     """FIFA Sports Reference implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.FIFA,
             "https://fbref.com/en/matches/",
             position=position,
+            workers=workers,
         )
 
     @classmethod
@@ -0,0 +1,192 @@
+"""A streaming columnar builder for assembling flattened games into a frame."""
+
+import datetime
+import json
+import logging
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+
+DEFAULT_CHUNK_SIZE = 256
+_MIXED_DATETIMES_KEY = b"sportsball_mixed_datetimes"
+
+
+def _mixes_naive_and_aware(values: list[Any]) -> bool:
+    naive = False
+    aware = False
+    for value in values:
+        if not isinstance(value, datetime.datetime):
+            continue
+        if value.tzinfo is None:
+            naive = True
+        else:
+            aware = True
+        if naive and aware:
+            return True
+    return False
+
+
+def _to_arrow(col: str, values: list[Any]) -> tuple[pa.Array, bool]:
+    try:
+        arr = pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+        logging.warning("Storing column %s as strings as it mixes types: %s", col, exc)
+        return pa.array([None if x is None else str(x) for x in values]), False
+    if not pa.types.is_timestamp(arr.type):
+        return arr, False
+    if _mixes_naive_and_aware(values):
+        # Naive datetimes are localised to the venue later on, so they can't share a
+        # timestamp buffer with the timezone aware ones. Keep both as ISO strings.
+        return pa.array([None if x is None else x.isoformat() for x in values]), True
+    if arr.type.tz is not None or any(
+        getattr(x, "tzinfo", None) is not None for x in values
+    ):
+        # Columns can hold many timezones, keep them comparable across chunks.
+        arr = arr.cast(pa.timestamp(arr.type.unit, tz="UTC"))
+    return arr, False
+
+
+def _mixed_datetime_columns(table: pa.Table) -> set[str]:
+    metadata = table.schema.metadata or {}
+    return set(json.loads(metadata.get(_MIXED_DATETIMES_KEY, b"[]")))
+
+
+def _mark_mixed_datetime_columns(table: pa.Table, cols: set[str]) -> pa.Table:
+    if not cols:
+        return table
+    metadata = dict(table.schema.metadata or {})
+    metadata[_MIXED_DATETIMES_KEY] = json.dumps(sorted(cols)).encode()
+    return table.replace_schema_metadata(metadata)
+
+
+def _resolve_conflicts(tables: list[pa.Table]) -> tuple[list[pa.Table], set[str]]:
+    mixed_cols: set[str] = set()
+    col_types: dict[str, set[pa.DataType]] = {}
+    for table in tables:
+        mixed_cols |= _mixed_datetime_columns(table)
+        for field in table.schema:
+            col_types.setdefault(field.name, set()).add(field.type)
+    casts = {}
+    for col, types in col_types.items():
+        types = types - {pa.null()}
+        if col in mixed_cols:
+            casts[col] = pa.string()
+            continue
+        if len(types) <= 1:
+            continue
+        if (
+            all(pa.types.is_timestamp(x) for x in types)
+            and len({x.tz is None for x in types}) > 1
+        ):
+            # Naive and timezone aware chunks of the same column.
+            mixed_cols.add(col)
+            casts[col] = pa.string()
+            continue
+        try:
+            pa.unify_schemas(
+                [pa.schema([pa.field(col, x)]) for x in types],
+                promote_options="permissive",
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logging.warning(
+                "Storing column %s as strings as its chunks have the types %s.",
+                col,
+                ", ".join(sorted(str(x) for x in types)),
+            )
+            casts[col] = pa.string()
+    fixed_tables = []
+    for table in tables:
+        for col in casts.keys() & set(table.column_names):
+            if table.schema.field(col).type == casts[col]:
+                continue
+            idx = table.column_names.index(col)
+            table = table.set_column(
+                idx, col, pc.cast(table.column(col), casts[col], safe=False)
+            )
+        fixed_tables.append(table)
+    return fixed_tables, mixed_cols
+
+
+def table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """Convert a builder chunk into a dataframe, restoring any mixed datetimes."""
+    mixed_cols = _mixed_datetime_columns(table)
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    for col in mixed_cols & set(df.columns.values.tolist()):
+        df[col] = pd.Series(
+            [None if pd.isnull(x) else pd.Timestamp(x) for x in df[col]],
+            index=df.index,
+            dtype=object,
+        )
+    return df
+
+
+class FrameBuilder:
+    """Accumulates flattened rows into chunked, typed arrow columns."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._chunk_size = chunk_size
+        self._columns: dict[str, list[Any]] = {}
+        self._rows = 0
+        self._tables: list[pa.Table] = []
+        self._seen_columns: set[str] = set()
+
+    @property
+    def columns(self) -> set[str]:
+        """The union of all the columns seen so far."""
+        return self._seen_columns | self._columns.keys()
+
+    def append(self, row: dict[str, Any]) -> None:
+        """Append a flattened row to the pending chunk."""
+        for col, values in self._columns.items():
+            values.append(row.get(col))
+        for col in row.keys() - self._columns.keys():
+            self._columns[col] = [None] * self._rows + [row[col]]
+        self._rows += 1
+        if self._rows >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> pa.Table | None:
+        """Convert the pending rows into an arrow chunk."""
+        if not self._rows:
+            return None
+        arrays = {}
+        mixed_cols = set()
+        for col, values in self._columns.items():
+            arrays[col], mixed = _to_arrow(col, values)
+            if mixed:
+                mixed_cols.add(col)
+        table = pa.table(arrays)
+        # Empty lists are left behind by flatten, and can't be represented as columns.
+        table = table.select(
+            [x.name for x in table.schema if not pa.types.is_list(x.type)]
+        )
+        table = _mark_mixed_datetime_columns(
+            table, mixed_cols & set(table.column_names)
+        )
+        self._seen_columns |= set(table.column_names)
+        self._columns = {}
+        self._rows = 0
+        self._tables.append(table)
+        return table
+
+    def drain(self) -> list[pa.Table]:
+        """Remove and return the chunks that have been completed so far."""
+        tables, self._tables = self._tables, []
+        return tables
+
+    def to_table(self) -> pa.Table:
+        """Assemble all the chunks into a single arrow table."""
+        self.flush()
+        tables = self.drain()
+        if not tables:
+            return pa.table({})
+        tables, mixed_cols = _resolve_conflicts(tables)
+        return _mark_mixed_datetime_columns(
+            pa.concat_tables(tables, promote_options="permissive"), mixed_cols
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Assemble all the chunks into a dataframe."""
+        return table_to_frame(self.to_table())
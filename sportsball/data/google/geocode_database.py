@@ -0,0 +1,136 @@
+"""A compact on-disk database of known geocodes.
+
+The database is built from the venues in geocodes.json, which is the file to edit. It
+is built into the cache directory on first use, and rebuilt whenever the JSON changes.
+"""
+
+# pylint: disable=too-few-public-methods
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+
+from ...cache import CACHE_DIR
+from ..sqlite_table import connect_read_only
+
+SportsballGeocodeTuple = namedtuple(
+    "SportsballGeocodeTuple",
+    ["city", "state", "postal", "lat", "lng", "housenumber", "country"],
+)
+GEOCODES_SOURCE = os.path.join(os.path.dirname(__file__), "geocodes.json")
+
+
+def normalise_query(query: str) -> str:
+    """Normalise an address query into the key it is stored under."""
+    return query.replace("\n", "").replace("&nbsp;", " ")
+
+
+class GeocodeDatabase:
+    """A read only lookup of geocodes by their normalised query, opened on first use.
+
+    Without a path, the database is built from the geocode source into a directory.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        source: str = GEOCODES_SOURCE,
+        directory: str = CACHE_DIR,
+    ) -> None:
+        self._path = path
+        self._source = source
+        self._directory = directory
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            path = self._path
+            if path is None:
+                path = ensure_geocodes(self._source, self._directory)
+            self._connection = connect_read_only(path)
+        return self._connection
+
+    def get(self, query: str) -> SportsballGeocodeTuple | None:
+        """Find the geocode for a normalised query."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT city, state, postal, lat, lng, housenumber, country "
+                    "FROM searches JOIN venues ON searches.venue = venues.id "
+                    "WHERE searches.query = ?",
+                    (query,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return SportsballGeocodeTuple(*row)
+
+
+def write_geocodes(path: str, geocodes: dict[str, SportsballGeocodeTuple]) -> None:
+    """Write geocodes keyed by their normalised query to a new database."""
+    venue_ids: dict[SportsballGeocodeTuple, int] = {}
+    for geocode in geocodes.values():
+        venue_ids.setdefault(geocode, len(venue_ids))
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(
+            "CREATE TABLE venues (id INTEGER PRIMARY KEY, city TEXT, state TEXT, "
+            "postal TEXT, lat REAL, lng REAL, housenumber TEXT, country TEXT)"
+        )
+        connection.execute(
+            "CREATE TABLE searches (query TEXT PRIMARY KEY, venue INTEGER) WITHOUT ROWID"
+        )
+        connection.executemany(
+            "INSERT INTO venues VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(y, *x) for x, y in venue_ids.items()],
+        )
+        connection.executemany(
+            "INSERT INTO searches VALUES (?, ?)",
+            sorted((x, venue_ids[y]) for x, y in geocodes.items()),
+        )
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+
+def read_geocode_source(path: str) -> dict[str, SportsballGeocodeTuple]:
+    """Read the venues and the queries that find them into geocodes keyed by query."""
+    with open(path, encoding="utf8") as handle:
+        venues = json.load(handle)
+    geocodes = {}
+    for venue in venues:
+        geocode = SportsballGeocodeTuple(
+            **{x: venue[x] for x in SportsballGeocodeTuple._fields}
+        )
+        for query in venue["queries"]:
+            geocodes[normalise_query(query)] = geocode
+    return geocodes
+
+
+def build_geocodes(source: str, path: str) -> None:
+    """Rebuild the database at a path from a geocode source."""
+    # Written alongside and moved into place, so a reader never opens a partial file.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        write_geocodes(tmp_path, read_geocode_source(source))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def ensure_geocodes(source: str, directory: str) -> str:
+    """Find the database built from a geocode source, building it if it is missing."""
+    with open(source, "rb") as handle:
+        digest = hashlib.sha256(handle.read()).hexdigest()[:16]
+    path = os.path.join(directory, f"geocodes-{digest}.sqlite")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        build_geocodes(source, path)
+    return path
@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espncricinfo.ipl_espncricinfo_league_model import \
     ESPNCricInfoLeagueModel
 from ..oddsportal.ipl_oddsportal_league_model import IPLOddsPortalLeagueModel
@@ -17,13 +18,18 @@ IPL_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class IPLCombinedLeagueModel(CombinedLeagueModel):
     """IPL combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.IPL,
             [
                 IPLSportsDBLeagueModel(session, position=0),
-                IPLOddsPortalLeagueModel(session, position=1),
+                IPLOddsPortalLeagueModel(session, position=1, workers=workers),
                 ESPNCricInfoLeagueModel(session, position=2),
             ],
             league_filter,
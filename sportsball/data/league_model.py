@@ -1,28 +1,37 @@
 """The prototype class defining how to interface to the league."""
 
 # pylint: disable=line-too-long
+import contextlib
 import datetime
 import logging
 import threading
-from typing import Any, Iterator, get_args, get_origin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa  # type: ignore
 import tqdm
 from flatten_json import flatten  # type: ignore
-from pydantic import BaseModel
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from .address_model import ADDRESS_TIMEZONE_COLUMN
 from .delimiter import DELIMITER
 from .field_type import FieldType
-from .game_model import GAME_DT_COLUMN, VENUE_COLUMN_PREFIX, GameModel
+from .frame_builder import DEFAULT_CHUNK_SIZE, FrameBuilder, table_to_frame
+from .game_model import (GAME_DT_COLUMN, TEAM_COLUMN_PREFIX,
+                         VENUE_COLUMN_PREFIX, GameModel)
 from .league import League
 from .model import Model
+from .rate_limiter import HostRateLimiter
+from .schema_index import classify_columns
+from .team_model import TEAM_IDENTIFIER_COLUMN
 from .venue_model import VENUE_ADDRESS_COLUMN
 
 LEAGUE_COLUMN = "league"
 SHUTDOWN_FLAG = threading.Event()
 TIMEOUT_DT = datetime.datetime.now() + datetime.timedelta(days=365)
+INCREMENTAL_DT: datetime.datetime | None = None
 
 
 def _clear_column_list(df: pd.DataFrame) -> pd.DataFrame:
@@ -43,6 +52,44 @@ def _reduce_memory_usage(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _to_datetime(series: pd.Series) -> pd.Series:
+    try:
+        return pd.to_datetime(series)
+    except (ValueError, TypeError):
+        # Naive and timezone aware values can't share a dtype until they are localised.
+        return series
+
+
+def _localize_timestamp(dt: Any, tz: str) -> pd.Timestamp:
+    if pd.isnull(dt):
+        return pd.NaT  # type: ignore
+    dt = pd.Timestamp(dt)
+    if dt.tz is None:
+        return dt.tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
+    return dt.tz_convert(tz)
+
+
+def _localize_series(series: pd.Series, tz: str) -> pd.Series:
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        series = _to_datetime(series)
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return pd.to_datetime(series.map(lambda x: _localize_timestamp(x, tz)))
+    if series.dt.tz is None:
+        return series.dt.tz_localize(
+            tz,
+            ambiguous=np.ones(len(series), dtype=bool),
+            nonexistent="shift_forward",
+        )
+    if str(series.dt.tz) != str(tz):
+        return series.dt.tz_convert(tz)
+    return series
+
+
+def _holds_datetimes(series: pd.Series) -> bool:
+    values = series.dropna()
+    return not values.empty and all(isinstance(x, datetime.datetime) for x in values)
+
+
 def _normalize_tz(df: pd.DataFrame) -> pd.DataFrame:
     tz_column = DELIMITER.join(
         [VENUE_COLUMN_PREFIX, VENUE_ADDRESS_COLUMN, ADDRESS_TIMEZONE_COLUMN]
@@ -51,90 +98,31 @@ def _normalize_tz(df: pd.DataFrame) -> pd.DataFrame:
         return df
     df = df.dropna(subset=tz_column)
 
-    tqdm.tqdm.pandas(desc="Timezone Conversions")
-
-    # Check each row to see if they have the correct timezone
-    dt_cols = set()
-
-    def apply_tz(row: pd.Series) -> pd.Series:
-        if tz_column not in row:
-            return row
-        tz = row[tz_column]
-        if pd.isnull(tz):
-            return row
-
-        datetime_cols = {
-            col for col, val in row.items() if isinstance(val, pd.Timestamp)
-        }
-        datetime_cols.add(GAME_DT_COLUMN)
-        for col in datetime_cols:
-            dt_cols.add(col)
-            dt = row[col]  # type: ignore
-            if isinstance(dt, (datetime.date, datetime.datetime)):
-                dt = pd.to_datetime(dt)
-            if dt.tz is None:
-                row[col] = dt.tz_localize(
-                    tz, ambiguous=True, nonexistent="shift_forward"
-                )
-            elif str(dt.tz) != str(tz):
-                row[col] = dt.tz_convert(tz)
-
-        return row
-
-    for dt_col in dt_cols:
-        df[dt_col] = pd.to_datetime(df[dt_col])
-
-    return df.progress_apply(apply_tz, axis=1)  # type: ignore
-
-
-def _find_nested_paths(
-    field_type: str, model_class: type[BaseModel], cols: list[str]
-) -> list[str]:
-    def any_column_contains(substr: str) -> bool:
-        for col in cols:
-            if substr in col:
-                return True
-        return False
-
-    nested_paths = []
-    for field_name, field in model_class.model_fields.items():
-        nested_field_type = (
-            field.json_schema_extra.get("type")  # type: ignore
-            if field.json_schema_extra
-            else None
-        )
-        if nested_field_type == field_type:
-            nested_paths.append(field_name)
+    dt_cols = set(df.select_dtypes(include=["datetime", "datetimetz"]).columns)
+    # Columns mixing timezones, or naive and aware values, are left as objects.
+    dt_cols |= {
+        x
+        for x in df.columns.values.tolist()
+        if df[x].dtype == object and _holds_datetimes(df[x])
+    }
+    if GAME_DT_COLUMN in df.columns.values:
+        dt_cols.add(GAME_DT_COLUMN)
+
+    # Localise each datetime column one timezone at a time rather than per row.
+    groups = df.groupby(tz_column, observed=True, sort=False).groups
+    for dt_col in tqdm.tqdm(sorted(dt_cols), desc="Timezone Conversions"):
+        localized = [
+            _localize_series(df.loc[idx, dt_col], str(tz))  # type: ignore
+            for tz, idx in groups.items()
+        ]
+        if len(localized) == 1:
+            df[dt_col] = localized[0]
         else:
-            if issubclass(
-                get_origin(field.annotation) or field.annotation,  # type: ignore
-                BaseModel,  # type: ignore
-            ):
-                nested_paths.extend(
-                    [
-                        DELIMITER.join([field_name, x])
-                        for x in _find_nested_paths(
-                            field_type,
-                            field.annotation,  # type: ignore
-                            cols,
-                        )  # type: ignore
-                    ]
-                )
-            elif get_origin(field.annotation) == list and issubclass(
-                get_args(field.annotation)[0], BaseModel
-            ):
-                i = 0
-                while any_column_contains(DELIMITER.join([field_name, str(i)])):
-                    nested_paths.extend(
-                        [
-                            DELIMITER.join([field_name, str(i), x])
-                            for x in _find_nested_paths(
-                                field_type, get_args(field.annotation)[0], cols
-                            )
-                        ]
-                    )
-                    i += 1
-    return nested_paths
+            df[dt_col] = pd.concat([x.astype(object) for x in localized]).reindex(
+                df.index
+            )
+
+    return df
 
 
 def _print_memory_usage(df: pd.DataFrame) -> None:
@@ -148,6 +136,124 @@ def _print_memory_usage(df: pd.DataFrame) -> None:
     logging.info(summary_sorted.head(50))
 
 
+def _process_frame(df: pd.DataFrame) -> pd.DataFrame:
+    column_types = classify_columns(GameModel, df.columns.values.tolist())
+    categorical_cols = column_types[FieldType.CATEGORICAL]
+    datetime_cols = column_types[FieldType.DATETIME]
+    for col in df.columns.values.tolist():
+        if col in categorical_cols:
+            df[col] = pd.Categorical(df[col])
+        elif col in datetime_cols:
+            df[col] = _to_datetime(df[col])
+
+    df.attrs[str(FieldType.ODDS)] = list(column_types[FieldType.ODDS])
+    df.attrs[str(FieldType.POINTS)] = list(column_types[FieldType.POINTS])
+    df.attrs[str(FieldType.TEXT)] = list(column_types[FieldType.TEXT])
+    df.attrs[str(FieldType.CATEGORICAL)] = list(categorical_cols)
+    df.attrs[str(FieldType.LOOKAHEAD)] = list(
+        column_types[FieldType.LOOKAHEAD] | column_types[FieldType.POINTS]
+    )
+
+    for categorical_column in df.attrs[str(FieldType.CATEGORICAL)]:
+        df[categorical_column] = df[categorical_column].astype("category")
+
+    df = _normalize_tz(df)
+
+    if GAME_DT_COLUMN in df.columns.values:
+        df = df.sort_values(
+            by=GAME_DT_COLUMN,
+            ascending=True,
+        )
+    df = _clear_column_list(df)
+    df = df.reset_index()
+
+    df = _reduce_memory_usage(
+        df[sorted(df.columns.values.tolist())].dropna(axis=1, how="all")
+    )
+    return df
+
+
+def _process_chunk(table: pa.Table, offset: int) -> pd.DataFrame:
+    df = table_to_frame(table)
+    df.index = pd.RangeIndex(offset, offset + len(df))
+    return _process_frame(df)
+
+
+def game_keys(df: pd.DataFrame) -> pd.Series:
+    """Find a key identifying each game in a dataframe by its date and teams."""
+    if df.empty:
+        # A part emptied by a refresh has no rows to key.
+        return pd.Series(index=df.index, dtype=str)
+    dates = (
+        pd.to_datetime(df[GAME_DT_COLUMN], utc=True).dt.strftime("%Y-%m-%d").astype(str)
+    )
+    team_cols = [
+        x
+        for x in df.columns.values.tolist()
+        if x.startswith(TEAM_COLUMN_PREFIX + DELIMITER)
+        and x.endswith(DELIMITER + TEAM_IDENTIFIER_COLUMN)
+        and x.count(DELIMITER) == 2
+    ]
+    teams = (
+        df[team_cols]
+        .astype(object)
+        .apply(
+            lambda x: "-".join(sorted(str(y) for y in x if not pd.isnull(y))), axis=1
+        )
+    )
+    return dates + "-" + teams
+
+
+def merge_frames(existing_df: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+    """Upsert the games in a new dataframe over an existing dataframe."""
+    if existing_df.empty:
+        return df
+    if df.empty:
+        return existing_df
+    existing_df = existing_df[~game_keys(existing_df).isin(set(game_keys(df)))]
+    attrs = {
+        k: sorted(set(existing_df.attrs.get(k, [])) | set(df.attrs.get(k, [])))
+        for k in set(existing_df.attrs.keys()) | set(df.attrs.keys())
+    }
+    merged_df = pd.concat(
+        [
+            existing_df.drop(columns="index", errors="ignore"),
+            df.drop(columns="index", errors="ignore"),
+        ],
+        ignore_index=True,
+    )
+    merged_df = merged_df.iloc[
+        np.argsort(
+            pd.to_datetime(merged_df[GAME_DT_COLUMN], utc=True).to_numpy(),
+            kind="stable",
+        )
+    ].reset_index()
+    merged_df = merged_df[sorted(merged_df.columns.values.tolist())]
+    merged_df.attrs = attrs
+    return merged_df
+
+
+def incremental_dt(
+    df: pd.DataFrame, lookback: datetime.timedelta
+) -> datetime.datetime | None:
+    """Find the point an incremental run should restart from for an existing dataframe."""
+    if df.empty or GAME_DT_COLUMN not in df.columns.values:
+        return None
+    max_dt = pd.to_datetime(df[GAME_DT_COLUMN], utc=True).max()
+    if pd.isnull(max_dt):
+        return None
+    return max_dt.to_pydatetime().replace(tzinfo=None) - lookback
+
+
+def before_incremental(dt: datetime.datetime) -> bool:
+    """Whether the datetime is before the data that an incremental run refreshes."""
+    if INCREMENTAL_DT is None:
+        return False
+    if dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return dt < INCREMENTAL_DT
+
+
 def needs_shutdown() -> bool:
     """Whether the system needs to shutdown."""
     if SHUTDOWN_FLAG.is_set():
@@ -169,6 +275,9 @@ class LeagueModel(Model):
         super().__init__(session)
         self._league = league
         self.position = position
+        self._executor: ThreadPoolExecutor | None = None
+        self._local: threading.local | None = None
+        self._rate_limiter: HostRateLimiter | None = None
 
     @classmethod
     def name(cls) -> str:
@@ -185,91 +294,72 @@ class LeagueModel(Model):
         """Return the league this league model represents."""
         return self._league
 
-    def to_frame(self) -> pd.DataFrame:
-        """Render the league as a dataframe."""
-        jsonl: list[dict[str, Any]] = []
-        cols: set[str] = set()
+    @contextlib.contextmanager
+    def _worker_pool(
+        self, max_workers: int, requests_per_second: float | None = None
+    ) -> Iterator[ThreadPoolExecutor | None]:
+        # Without more than one worker everything runs on the caller's session.
+        if max_workers <= 1:
+            yield None
+            return
+        session = self.session
+        rate_limiter = None
+        if requests_per_second is not None:
+            rate_limiter = HostRateLimiter(requests_per_second)
+            # The caller's own requests, such as index pages, come out of the same budget.
+            rate_limiter.throttle(session)
+        with ThreadPoolExecutor(max_workers) as executor:
+            self._executor = executor
+            self._local = threading.local()
+            self._rate_limiter = rate_limiter
+            try:
+                yield executor
+            finally:
+                self._executor = None
+                self._local = None
+                self._rate_limiter = None
+                if rate_limiter is not None:
+                    rate_limiter.release(session)
+
+    def _worker_session(self) -> ScrapeSession:
+        # Each worker gets its own session, as disabling the cache is not thread safe.
+        local = self._local
+        if local is None:
+            return self.session
+        session = getattr(local, "session", None)
+        if session is None:
+            session = self.new_session()
+            rate_limiter = self._rate_limiter
+            if rate_limiter is not None:
+                rate_limiter.throttle(session)
+            local.session = session
+        return session
+
+    def _frame_games(self) -> Iterator[GameModel]:
         for game in tqdm.tqdm(self.games, desc="Games"):
-            game_dict = flatten(game.model_dump(by_alias=True), DELIMITER)
-            jsonl.append(game_dict)
-            cols |= set(game_dict.keys())
+            if before_incremental(game.dt):
+                continue
+            yield game
 
-        data: dict[str, Any] = {x: [] for x in cols}
-        for json_dict in jsonl:
-            for col in cols:
-                data[col].append(json_dict.get(col))
-
-        categorical_cols = set(
-            _find_nested_paths(FieldType.CATEGORICAL, GameModel, list(cols))
-        )
-        for k in data:
-            if k in categorical_cols:
-                data[k] = pd.Categorical(data[k])
-
-        datetime_cols = set(
-            _find_nested_paths(FieldType.DATETIME, GameModel, list(cols))
-        )
-        for k in data:
-            if k in datetime_cols:
-                data[k] = pd.to_datetime(data[k])
-
-        df = pd.DataFrame(data)
-
-        df.attrs[str(FieldType.LOOKAHEAD)] = list(
-            set(df.columns.values)
-            & set(
-                _find_nested_paths(
-                    FieldType.LOOKAHEAD, GameModel, df.columns.values.tolist()
-                )
-            )
-        )
-        df.attrs[str(FieldType.ODDS)] = list(
-            set(df.columns.values)
-            & set(
-                _find_nested_paths(
-                    FieldType.ODDS, GameModel, df.columns.values.tolist()
-                )
-            )
-        )
-        df.attrs[str(FieldType.POINTS)] = list(
-            set(df.columns.values)
-            & set(
-                _find_nested_paths(
-                    FieldType.POINTS, GameModel, df.columns.values.tolist()
-                )
-            )
-        )
-        df.attrs[str(FieldType.TEXT)] = list(
-            set(df.columns.values)
-            & set(
-                _find_nested_paths(
-                    FieldType.TEXT, GameModel, df.columns.values.tolist()
-                )
-            )
-        )
-        df.attrs[str(FieldType.CATEGORICAL)] = list(
-            set(df.columns.values) & categorical_cols
-        )
-        df.attrs[str(FieldType.LOOKAHEAD)] = list(
-            set(df.attrs[str(FieldType.LOOKAHEAD)])
-            | set(df.attrs[str(FieldType.POINTS)])
-        )
-
-        for categorical_column in df.attrs[str(FieldType.CATEGORICAL)]:
-            df[categorical_column] = df[categorical_column].astype("category")
-
-        df = _normalize_tz(df)
-
-        if GAME_DT_COLUMN in df.columns.values:
-            df = df.sort_values(
-                by=GAME_DT_COLUMN,
-                ascending=True,
-            )
-        df = _clear_column_list(df)
-        df = df.reset_index()
-
-        df = _reduce_memory_usage(
-            df[sorted(df.columns.values.tolist())].dropna(axis=1, how="all")
-        )
+    def to_frame(self) -> pd.DataFrame:
+        """Render the league as a dataframe."""
+        builder = FrameBuilder()
+        for game in self._frame_games():
+            builder.append(flatten(game.model_dump(by_alias=True), DELIMITER))
+        df = _process_frame(builder.to_frame())
         _print_memory_usage(df)
         return df
+
+    def to_frames(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Render the league as a series of dataframes as the games are produced."""
+        builder = FrameBuilder(chunk_size=chunk_size)
+        offset = 0
+        for game in self._frame_games():
+            builder.append(flatten(game.model_dump(by_alias=True), DELIMITER))
+            for table in builder.drain():
+                rows = table.num_rows
+                yield _process_chunk(table, offset)
+                offset += rows
+        builder.flush()
+        for table in builder.drain():
+            yield _process_chunk(table, offset)
@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.mlb_espn_league_model import MLBESPNLeagueModel
 from ..oddsportal.mlb_oddsportal_league_model import MLBOddsPortalLeagueModel
 from ..sportsdb.mlb_sportsdb_league_model import MLBSportsDBLeagueModel
@@ -16,15 +17,20 @@ MLB_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class MLBCombinedLeagueModel(CombinedLeagueModel):
     """MLB combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.MLB,
             [
-                MLBESPNLeagueModel(session, position=0),
+                MLBESPNLeagueModel(session, position=0, workers=workers),
                 MLBSportsDBLeagueModel(session, position=1),
-                MLBOddsPortalLeagueModel(session, position=2),
-                # MLBSportsReferenceLeagueModel(session, position=3),
+                MLBOddsPortalLeagueModel(session, position=2, workers=workers),
+                # MLBSportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
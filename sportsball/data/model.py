@@ -19,17 +19,21 @@ class Model:
         """Fetch a session that can never be null."""
         session = self._session
         if session is None:
-            session = create_scrape_session(
-                "sportsball",
-                fast_fail_urls={
-                    "https://news.google.com/",
-                    "https://historical-forecast-api.open-meteo.com/",
-                    "https://api.open-meteo.com/",
-                },
-            )
+            session = self.new_session()
             self._session = session
         return session
 
+    def new_session(self) -> ScrapeSession:
+        """Create a new session, such as one for use on another thread."""
+        return create_scrape_session(
+            "sportsball",
+            fast_fail_urls={
+                "https://news.google.com/",
+                "https://historical-forecast-api.open-meteo.com/",
+                "https://api.open-meteo.com/",
+            },
+        )
+
     def clear_session(self):
         """Clear the session."""
         self._session = None
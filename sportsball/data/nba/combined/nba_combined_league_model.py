@@ -5,6 +5,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.nba_espn_league_model import NBAESPNLeagueModel
 from ..nba.nba_nba_league_model import NBANBALeagueModel
 from ..nbacom.nba_nbacom_league_model import NBANBAComLeagueModel
@@ -894,17 +895,22 @@ NBA_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class NBACombinedLeagueModel(CombinedLeagueModel):
     """NBA combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NBA,
             [
                 NBANBALeagueModel(session, position=0),
-                NBAESPNLeagueModel(session, position=1),
+                NBAESPNLeagueModel(session, position=1, workers=workers),
                 NBASportsDBLeagueModel(session, position=2),
-                NBAOddsPortalLeagueModel(session, position=3),
+                NBAOddsPortalLeagueModel(session, position=3, workers=workers),
                 NBANBAComLeagueModel(session, position=4),
-                # NBASportsReferenceLeagueModel(session, position=5),
+                # NBASportsReferenceLeagueModel(session, position=5, workers=workers),
             ],
             league_filter,
         )
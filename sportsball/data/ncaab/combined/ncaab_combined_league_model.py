@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.ncaab_espn_league_model import NCAABESPNLeagueModel
 from ..oddsportal.ncaab_oddsportal_league_model import \
     NCAABOddsPortalLeagueModel
@@ -756,15 +757,20 @@ NCAAB_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class NCAABCombinedLeagueModel(CombinedLeagueModel):
     """NCAAB combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NCAAB,
             [
-                NCAABESPNLeagueModel(session, position=0),
-                NCAABOddsPortalLeagueModel(session, position=1),
+                NCAABESPNLeagueModel(session, position=0, workers=workers),
+                NCAABOddsPortalLeagueModel(session, position=1, workers=workers),
                 NCAABSportsDBLeagueModel(session, position=2),
-                # NCAABSportsReferenceLeagueModel(session, position=3),
+                # NCAABSportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
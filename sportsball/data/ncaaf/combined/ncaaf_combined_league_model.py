@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.ncaaf_espn_league_model import NCAAFESPNLeagueModel
 from ..oddsportal.ncaaf_oddsportal_league_model import \
     NCAAFOddsPortalLeagueModel
@@ -20,15 +21,20 @@ NCAAF_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class NCAAFCombinedLeagueModel(CombinedLeagueModel):
     """NCAAF combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NCAAF,
             [
-                NCAAFESPNLeagueModel(session, position=0),
-                NCAAFOddsPortalLeagueModel(session, position=1),
+                NCAAFESPNLeagueModel(session, position=0, workers=workers),
+                NCAAFOddsPortalLeagueModel(session, position=1, workers=workers),
                 NCAAFSportsDBLeagueModel(session, position=2),
-                # NCAAFSportsReferenceLeagueModel(session, position=3),
+                # NCAAFSportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
@@ -7,6 +7,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from ...espn.espn_league_model import ESPNLeagueModel
 from ...league import League
 from ...nfl.position import Position
+from ...worker_settings import WorkerSettings
 
 _SEASON_URL = "http://sports.core.api.espn.com/v2/sports/football/leagues/college-football/seasons?limit=100"
 
@@ -14,8 +15,15 @@ _SEASON_URL = "http://sports.core.api.espn.com/v2/sports/football/leagues/colleg
 class NCAAFESPNLeagueModel(ESPNLeagueModel):
     """NCAAF ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.NCAAF, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL, League.NCAAF, session, position=position, workers=workers
+        )
 
     @classmethod
     def name(cls) -> str:
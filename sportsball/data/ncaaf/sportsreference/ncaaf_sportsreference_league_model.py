@@ -8,17 +8,24 @@ from ...league import League
 from ...nfl.position import Position
 from ...sportsreference.sportsreference_league_model import \
     SportsReferenceLeagueModel
+from ...worker_settings import WorkerSettings
 
 
 class NCAAFSportsReferenceLeagueModel(SportsReferenceLeagueModel):
     """NCAAF Sports Reference implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NCAAF,
             "https://www.sports-reference.com/cfb/boxscores/",
             position=position,
+            workers=workers,
         )
 
     @classmethod
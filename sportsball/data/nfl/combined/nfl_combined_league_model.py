@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..aussportsbetting.nfl_aussportsbetting_league_model import \
     NFLAusSportsBettingLeagueModel
 from ..espn.nfl_espn_league_model import NFLESPNLeagueModel
@@ -389,16 +390,21 @@ NFL_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class NFLCombinedLeagueModel(CombinedLeagueModel):
     """NFL combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NFL,
             [
-                NFLESPNLeagueModel(session, position=0),
+                NFLESPNLeagueModel(session, position=0, workers=workers),
                 NFLAusSportsBettingLeagueModel(session, position=1),
-                NFLOddsPortalLeagueModel(session, position=2),
+                NFLOddsPortalLeagueModel(session, position=2, workers=workers),
                 # NFLSportsDBLeagueModel(session, position=3),
-                # NFLSportsReferenceLeagueModel(session, position=4),
+                # NFLSportsReferenceLeagueModel(session, position=4, workers=workers),
             ],
             league_filter,
         )
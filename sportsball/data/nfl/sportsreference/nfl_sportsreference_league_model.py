@@ -7,18 +7,25 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from ...league import League
 from ...sportsreference.sportsreference_league_model import \
     SportsReferenceLeagueModel
+from ...worker_settings import WorkerSettings
 from ..position import Position
 
 
 class NFLSportsReferenceLeagueModel(SportsReferenceLeagueModel):
     """NFL Sports Reference implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NFL,
             "https://www.pro-football-reference.com/boxscores/",
             position=position,
+            workers=workers,
         )
 
     @classmethod
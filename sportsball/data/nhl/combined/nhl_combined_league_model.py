@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...combined.combined_league_model import CombinedLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..espn.nhl_espn_league_model import NHLESPNLeagueModel
 from ..oddsportal.nhl_oddsportal_league_model import NHLOddsPortalLeagueModel
 from ..sportsdb.nhl_sportsdb_league_model import NHLSportsDBLeagueModel
@@ -16,15 +17,20 @@ NHL_PLAYER_IDENTITY_MAP: dict[str, str] = {}
 class NHLCombinedLeagueModel(CombinedLeagueModel):
     """NHL combined implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, league_filter: str | None) -> None:
+    def __init__(
+        self,
+        session: ScrapeSession,
+        league_filter: str | None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
         super().__init__(
             session,
             League.NHL,
             [
-                NHLESPNLeagueModel(session, position=0),
+                NHLESPNLeagueModel(session, position=0, workers=workers),
                 NHLSportsDBLeagueModel(session, position=1),
-                NHLOddsPortalLeagueModel(session, position=2),
-                # NHLSportsReferenceLeagueModel(session, position=3),
+                NHLOddsPortalLeagueModel(session, position=2, workers=workers),
+                # NHLSportsReferenceLeagueModel(session, position=3, workers=workers),
             ],
             league_filter,
         )
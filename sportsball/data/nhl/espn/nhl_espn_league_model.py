@@ -4,6 +4,7 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ...espn.espn_league_model import ESPNLeagueModel
 from ...league import League
+from ...worker_settings import WorkerSettings
 from ..position import Position
 
 _SEASON_URL = (
@@ -14,8 +15,15 @@ _SEASON_URL = (
 class NHLESPNLeagueModel(ESPNLeagueModel):
     """NHL ESPN implementation of the league model."""
 
-    def __init__(self, session: ScrapeSession, position: int | None = None) -> None:
-        super().__init__(_SEASON_URL, League.NHL, session, position=position)
+    def __init__(
+        self,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(
+            _SEASON_URL, League.NHL, session, position=position, workers=workers
+        )
 
     @classmethod
     def name(cls) -> str:
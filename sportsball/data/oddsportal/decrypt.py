@@ -5,6 +5,7 @@ import base64
 import binascii
 import json
 import logging
+import threading
 import urllib.parse
 from typing import Any
 
@@ -16,49 +17,109 @@ from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
+_DECRYPTION_DATA: dict[str, tuple[bytes, bytes]] = {}
+_AES_KEYS: dict[tuple[bytes, bytes], bytes] = {}
+_LOCK = threading.Lock()
 
-def _find_decryption_data(
-    session: ScrapeSession,
-    soup: BeautifulSoup,
-    referer_url: str,
-    user_agent: str | None = None,
-) -> tuple[bytes, bytes]:
-    salt: bytes | None = None
-    password: bytes | None = None
+
+def _find_app_url(soup: BeautifulSoup, referer_url: str) -> str | None:
     for script in soup.find_all("script"):
         src = script.get("src")
         if src is None:
             continue
         if ("/app-" in src and src.endswith(".js")) or "/app.js" in src:
-            src_url = urllib.parse.urljoin(referer_url, src)
-            headers = {}
-            if user_agent is not None:
-                headers["User-Agent"] = user_agent
-            with session.wayback_disabled():
-                src_response = session.get(src_url, headers=headers)
-            src_response.raise_for_status()
-            variables = src_response.text
-            sentinel = 'break}return e.next=9,g(r.data,"'
-            variables = variables[variables.find(sentinel) + len(sentinel) :]
-            variables = variables[
-                : variables.find('");case 9:return s=e.sent,l=JSON.parse(s),e.abrupt')
-            ]
-            try:
-                password_str, salt_str = variables.split('","')
-            except ValueError:
-                sentinel = "YupiOddsPortal"
-                variables = src_response.text
-                variables = variables[: variables.find(sentinel) + len(sentinel)]
-                variables = '"'.join(variables.split('"')[-3:])
-                password_str, salt_str = variables.split('","')
-            salt = str.encode(salt_str)
-            password = str.encode(password_str)
-            break
-    if salt is None:
+            return urllib.parse.urljoin(referer_url, src)
+    return None
+
+
+def _fetch_decryption_data(
+    session: ScrapeSession, src_url: str, user_agent: str | None
+) -> tuple[bytes, bytes]:
+    headers = {}
+    if user_agent is not None:
+        headers["User-Agent"] = user_agent
+    with session.wayback_disabled():
+        src_response = session.get(src_url, headers=headers)
+    src_response.raise_for_status()
+    variables = src_response.text
+    sentinel = 'break}return e.next=9,g(r.data,"'
+    variables = variables[variables.find(sentinel) + len(sentinel) :]
+    variables = variables[
+        : variables.find('");case 9:return s=e.sent,l=JSON.parse(s),e.abrupt')
+    ]
+    try:
+        password_str, salt_str = variables.split('","')
+    except ValueError:
+        sentinel = "YupiOddsPortal"
+        variables = src_response.text
+        variables = variables[: variables.find(sentinel) + len(sentinel)]
+        variables = '"'.join(variables.split('"')[-3:])
+        password_str, salt_str = variables.split('","')
+    return str.encode(salt_str), str.encode(password_str)
+
+
+def _find_decryption_data(
+    session: ScrapeSession,
+    soup: BeautifulSoup,
+    referer_url: str,
+    user_agent: str | None = None,
+) -> tuple[str, bytes, bytes]:
+    src_url = _find_app_url(soup, referer_url)
+    if src_url is None:
         raise ValueError(f"salt is null for {referer_url}.")
-    if password is None:
-        raise ValueError("password is null.")
-    return salt, password
+    # The salt and password only change when a new app bundle is deployed.
+    with _LOCK:
+        decryption_data = _DECRYPTION_DATA.get(src_url)
+    if decryption_data is None:
+        decryption_data = _fetch_decryption_data(session, src_url, user_agent)
+        with _LOCK:
+            _DECRYPTION_DATA[src_url] = decryption_data
+    salt, password = decryption_data
+    return src_url, salt, password
+
+
+def _derive_key(password: bytes, salt: bytes) -> bytes:
+    with _LOCK:
+        aes_key = _AES_KEYS.get((password, salt))
+    if aes_key is None:
+        kdf = PBKDF2HMAC(
+            algorithm=SHA256(),
+            length=32,
+            salt=salt,
+            iterations=1000,
+            backend=default_backend(),
+        )
+        aes_key = kdf.derive(password)
+        with _LOCK:
+            _AES_KEYS[(password, salt)] = aes_key
+    return aes_key
+
+
+def _invalidate(
+    session: ScrapeSession, src_url: str, salt: bytes, password: bytes
+) -> None:
+    with _LOCK:
+        _DECRYPTION_DATA.pop(src_url, None)
+        _AES_KEYS.pop((password, salt), None)
+    session.cache.delete(urls=[src_url])
+
+
+def _decrypt(decoded_data: str, salt: bytes, password: bytes) -> dict[str, Any]:
+    encrypted, key = decoded_data.split(":")
+    encrypted_bytes = base64.urlsafe_b64decode(encrypted)
+    key_bytes = bytes.fromhex(key)
+    cipher = Cipher(
+        algorithms.AES(_derive_key(password, salt)),
+        modes.CBC(key_bytes),
+        backend=default_backend(),
+    )
+    decryptor = cipher.decryptor()
+    decrypted_bytes = decryptor.update(encrypted_bytes) + decryptor.finalize()
+    decrypted_data = decrypted_bytes.decode("utf-8")
+    end_of_json = decrypted_data.rfind("}")
+    if end_of_json != -1:
+        decrypted_data = decrypted_data[: end_of_json + 1]
+    return json.loads(decrypted_data)
 
 
 def fetch_data(
@@ -69,7 +130,7 @@ def fetch_data(
     user_agent: str | None = None,
 ) -> dict[str, Any]:
     """Fetch the data from the URL and decrypt it."""
-    salt, password = _find_decryption_data(
+    src_url, salt, password = _find_decryption_data(
         session, soup, referer_url, user_agent=user_agent
     )
     headers = {
@@ -95,24 +156,13 @@ def fetch_data(
         logging.error("URL: %s", url)
         logging.error("Error base64 decoding payload: %s", response.content)
         raise exc
-    encrypted, key = decoded_data.split(":")
-    encrypted_bytes = base64.urlsafe_b64decode(encrypted)
-    key_bytes = bytes.fromhex(key)
-    kdf = PBKDF2HMAC(
-        algorithm=SHA256(),
-        length=32,
-        salt=salt,
-        iterations=1000,
-        backend=default_backend(),
-    )
-    aes_key = kdf.derive(password)
-    cipher = Cipher(
-        algorithms.AES(aes_key), modes.CBC(key_bytes), backend=default_backend()
-    )
-    decryptor = cipher.decryptor()
-    decrypted_bytes = decryptor.update(encrypted_bytes) + decryptor.finalize()
-    decrypted_data = decrypted_bytes.decode("utf-8")
-    end_of_json = decrypted_data.rfind("}")
-    if end_of_json != -1:
-        decrypted_data = decrypted_data[: end_of_json + 1]
-    return json.loads(decrypted_data)
+    try:
+        return _decrypt(decoded_data, salt, password)
+    except ValueError as exc:
+        # The cached salt and password may be stale, so refetch the bundle once.
+        logging.warning("Failed to decrypt %s, refetching %s: %s", url, src_url, exc)
+        _invalidate(session, src_url, salt, password)
+        src_url, salt, password = _find_decryption_data(
+            session, soup, referer_url, user_agent=user_agent
+        )
+        return _decrypt(decoded_data, salt, password)
@@ -5,7 +5,9 @@ import http
 import json
 import logging
 import urllib.parse
-from typing import Iterator
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generator, Iterator
 
 import extruct  # type: ignore
 import requests
@@ -16,7 +18,9 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 from ..game_model import GameModel
 from ..google.address_exception import AddressException
 from ..league import League
-from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..league_model import (SHUTDOWN_FLAG, LeagueModel, before_incremental,
+                            needs_shutdown)
+from ..worker_settings import WorkerSettings
 from .decrypt import fetch_data
 from .oddsportal_game_model import create_oddsportal_game_model
 
@@ -52,6 +56,10 @@ def _find_ids(text: str) -> tuple[str, str]:
     return str(page_outrights["sid"]), page_outrights["id"]
 
 
+def _archive_url(sports_id: str, oddsportal_id: str, page: int) -> str:
+    return f"https://www.oddsportal.com/ajax-sport-country-tournament-archive_/{sports_id}/{oddsportal_id}/X134529032X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X512X32X0X0X0X0X0X0X131072X0X2048/1/-5/page/{page}//"
+
+
 def _process_results_pages(
     url: str,
     session: ScrapeSession,
@@ -59,7 +67,7 @@ def _process_results_pages(
     league: League,
     pbar: tqdm.tqdm,
     response: requests.Response,
-) -> Iterator[GameModel]:
+) -> Generator[GameModel, None, bool]:
     # Fetch first page
     sports_id, oddsportal_id = _find_ids(response.text)
 
@@ -68,20 +76,23 @@ def _process_results_pages(
     while (current_page == 1 and total_pages is None) or (
         current_page <= (0 if total_pages is None else total_pages)
     ):
-        dat_url = f"https://www.oddsportal.com/ajax-sport-country-tournament-archive_/{sports_id}/{oddsportal_id}/X134529032X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X0X512X32X0X0X0X0X0X0X131072X0X2048/1/-5/page/{current_page}//"
+        dat_url = _archive_url(sports_id, oddsportal_id, current_page)
         try:
             parsed_data = fetch_data(dat_url, session, url, soup)
             d = parsed_data["d"]
             if d.get("total") == 0:
-                return
+                return False
             for row in d.get("rows", []):
                 if needs_shutdown():
-                    return
+                    return False
                 game_model = create_oddsportal_game_model(
                     session, urllib.parse.urljoin(url, row["url"]), league, False
                 )
                 if game_model is None:
                     continue
+                if before_incremental(game_model.dt):
+                    # The archive is ordered newest first, so the rest are already known.
+                    return True
                 pbar.update(1)
                 pbar.set_description(f"OddsPortal {game_model.dt}")
                 yield game_model
@@ -93,11 +104,32 @@ def _process_results_pages(
         except Exception as exc:
             logging.warning(str(exc))
             break
+    return False
+
+
+def _season_urls(soup: BeautifulSoup, url: str, path: str) -> list[str]:
+    # The season picker links every season's results, which sort newest first.
+    season_urls = set()
+    for option in soup.select("option"):
+        next_url = urllib.parse.urljoin(url, str(option.get("value")))
+        if next_url.endswith("/results/") and path[:-1] in next_url:
+            season_urls.add(next_url)
+    return sorted(season_urls, reverse=True)
 
 
 class OddsPortalLeagueModel(LeagueModel):
     """Odds Portal implementation of the league model."""
 
+    def __init__(
+        self,
+        league: League,
+        session: ScrapeSession,
+        position: int | None = None,
+        workers: WorkerSettings | None = None,
+    ) -> None:
+        super().__init__(league, session, position=position)
+        self._pool = (workers or WorkerSettings()).oddsportal
+
     @classmethod
     def name(cls) -> str:
         return "oddsportal-league-model"
@@ -170,32 +202,8 @@ class OddsPortalLeagueModel(LeagueModel):
 
     def _find_previous(self, pbar: tqdm.tqdm) -> Iterator[GameModel]:
         for path in self._paths:
-            standard_suffix = path + "results/"
-            seen_urls = set()
-            queued_urls = {"https://www.oddsportal.com/" + standard_suffix}
-            while queued_urls:
-                if needs_shutdown():
-                    return
-                url = queued_urls.pop()
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
-
-                with self.session.cache_disabled():
-                    with self.session.wayback_disabled():
-                        self.session.cache.delete(urls=[url])
-                        response = self.session.get(url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Find next URLs
-                for option in soup.find_all("option"):
-                    next_url = urllib.parse.urljoin(url, option.get("value"))
-                    if next_url.endswith("/results/") and path[:-1] in next_url:
-                        queued_urls.add(next_url)
-
-                yield from _process_results_pages(
+            for url, response, soup in self._crawl_results_urls(path):
+                reached_incremental = yield from _process_results_pages(
                     url,
                     self.session,
                     soup,
@@ -203,13 +211,127 @@ class OddsPortalLeagueModel(LeagueModel):
                     pbar,
                     response,
                 )
+                if reached_incremental:
+                    # The seasons are crawled newest first, so the rest are already known.
+                    break
+
+    def _fetch_results(self, url: str) -> tuple[requests.Response, BeautifulSoup]:
+        session = self._worker_session()
+        with session.cache_disabled():
+            with session.wayback_disabled():
+                session.cache.delete(urls=[url])
+                response = session.get(url)
+        response.raise_for_status()
+        return response, BeautifulSoup(response.text, "lxml")
+
+    def _crawl_results_urls(
+        self, path: str
+    ) -> Iterator[tuple[str, requests.Response, BeautifulSoup]]:
+        # Seasons are fetched one at a time as they are asked for, newest first, so a
+        # crawl that stops early never fetches the older seasons.
+        root_url = "https://www.oddsportal.com/" + path + "results/"
+        seen_urls = {root_url}
+        queued_urls = deque([root_url])
+        while queued_urls:
+            if needs_shutdown():
+                return
+            url = queued_urls.popleft()
+            response, soup = self._fetch_results(url)
+            for next_url in _season_urls(soup, url, path):
+                if next_url not in seen_urls:
+                    seen_urls.add(next_url)
+                    queued_urls.append(next_url)
+            yield url, response, soup
+
+    def _crawl_results_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        window: int,
+        url: str,
+        soup: BeautifulSoup,
+        pbar: tqdm.tqdm,
+        response: requests.Response,
+    ) -> Generator[GameModel, None, bool]:
+        sports_id, oddsportal_id = _find_ids(response.text)
+
+        def _fetch_page(page: int) -> dict[str, Any]:
+            return fetch_data(
+                _archive_url(sports_id, oddsportal_id, page),
+                self._worker_session(),
+                url,
+                soup,
+            )["d"]
+
+        def _create_game(row: dict[str, Any]) -> GameModel | None:
+            return create_oddsportal_game_model(
+                self._worker_session(),
+                urllib.parse.urljoin(url, row["url"]),
+                self.league,
+                False,
+            )
+
+        # Only a window of pages is fetched ahead, so an incremental run
+        # stops without crawling the whole season.
+        pages: deque[Future[dict[str, Any]]] = deque()
+        try:
+            d = _fetch_page(1)
+            if d.get("total") == 0:
+                return False
+            next_page = 2
+            total_pages = d["pagination"]["pages"]
+            while True:
+                while next_page <= total_pages and len(pages) < window:
+                    pages.append(executor.submit(_fetch_page, next_page))
+                    next_page += 1
+                for game_model in executor.map(_create_game, d.get("rows", [])):
+                    if needs_shutdown():
+                        return False
+                    if game_model is None:
+                        continue
+                    if before_incremental(game_model.dt):
+                        # The archive is ordered newest first, so the rest are already known.
+                        return True
+                    pbar.update(1)
+                    pbar.set_description(f"OddsPortal {game_model.dt}")
+                    yield game_model
+                if not pages:
+                    return False
+                d = pages.popleft().result()
+        except AddressException as exc:
+            raise exc
+        except Exception as exc:
+            logging.warning(str(exc))
+            return False
+        finally:
+            for page in pages:
+                page.cancel()
+
+    def _crawl_previous(
+        self, executor: ThreadPoolExecutor, window: int, pbar: tqdm.tqdm
+    ) -> Iterator[GameModel]:
+        for path in self._paths:
+            for url, response, soup in self._crawl_results_urls(path):
+                reached_incremental = yield from self._crawl_results_pages(
+                    executor, window, url, soup, pbar, response
+                )
+                if reached_incremental:
+                    # The seasons are crawled newest first, so the rest are already known.
+                    break
 
     @property
     def games(self) -> Iterator[GameModel]:
         try:
             with tqdm.tqdm(position=self.position) as pbar:
                 yield from self._find_next(pbar)
-                yield from self._find_previous(pbar)
+                with self._worker_pool(
+                    self._pool.max_workers, self._pool.requests_per_second
+                ) as executor:
+                    if executor is None:
+                        yield from self._find_previous(pbar)
+                    else:
+                        yield from self._crawl_previous(
+                            executor, self._pool.max_workers, pbar
+                        )
         except Exception as exc:
             SHUTDOWN_FLAG.set()
             raise exc
@@ -0,0 +1,141 @@
+"""Elevation lookups from opentopodata, cached on disk and batched across threads."""
+
+# pylint: disable=too-few-public-methods
+
+import itertools
+import os
+import threading
+from concurrent.futures import Future
+
+import requests_cache
+
+from ...cache import MEMORY
+from ..sqlite_table import SQLiteTable
+
+_PRECISION = 4
+_DATASET = "aster30m"
+_URL = f"https://api.opentopodata.org/v1/{_DATASET}"
+# The most locations the public API accepts in one request.
+_BATCH_SIZE = 100
+
+Coordinate = tuple[float, float]
+
+
+def rounded_coordinate(latitude: float, longitude: float) -> Coordinate:
+    """Round a coordinate to the precision elevations are cached at."""
+    return round(latitude, _PRECISION), round(longitude, _PRECISION)
+
+
+def _key(coordinate: Coordinate) -> str:
+    return f"{coordinate[0]},{coordinate[1]}"
+
+
+class ElevationStore:
+    """A persistent map of rounded coordinates to their elevation."""
+
+    def __init__(self, path: str) -> None:
+        self._table = SQLiteTable(path, "elevations", _DATASET)
+
+    def find(self, coordinates: list[Coordinate]) -> dict[Coordinate, float | None]:
+        """Find the cached elevations of coordinates, leaving out any not cached yet."""
+        found = self._table.get_many([_key(x) for x in coordinates])
+        return {x: found[_key(x)] for x in coordinates if _key(x) in found}
+
+    def update(self, elevations: dict[Coordinate, float | None]) -> None:
+        """Cache the elevations of coordinates."""
+        self._table.update((_key(x), y) for x, y in elevations.items())
+
+
+def _fetch_elevations(
+    session: requests_cache.CachedSession, coordinates: list[Coordinate]
+) -> dict[Coordinate, float | None]:
+    # The store caches each coordinate, so a response for a whole batch is not kept.
+    with session.cache_disabled():
+        response = session.get(
+            _URL, params={"locations": "|".join(_key(x) for x in coordinates)}
+        )
+    response.raise_for_status()
+    return {
+        x: y["elevation"]
+        for x, y in zip(coordinates, response.json()["results"], strict=True)
+    }
+
+
+class ElevationBatcher:
+    """Fetches the coordinates missing from a store, in as few requests as it can.
+
+    Coordinates asked for while a request is in flight wait for the next one, so
+    concurrent address lookups share requests.
+    """
+
+    def __init__(self, store: ElevationStore, batch_size: int = _BATCH_SIZE) -> None:
+        self._store = store
+        self._batch_size = batch_size
+        self._pending: dict[Coordinate, Future[float | None]] = {}
+        self._fetching = False
+        self._lock = threading.Lock()
+
+    def find(
+        self, session: requests_cache.CachedSession, coordinates: list[Coordinate]
+    ) -> dict[Coordinate, float | None]:
+        """Find the elevations of coordinates."""
+        elevations = self._store.find(coordinates)
+        futures = {}
+        with self._lock:
+            for coordinate in coordinates:
+                if coordinate in elevations or coordinate in futures:
+                    continue
+                future = self._pending.get(coordinate)
+                if future is None:
+                    future = Future()
+                    self._pending[coordinate] = future
+                futures[coordinate] = future
+            fetch = bool(futures) and not self._fetching
+            if fetch:
+                self._fetching = True
+        if fetch:
+            self._drain(session)
+        elevations.update({x: y.result() for x, y in futures.items()})
+        return elevations
+
+    def _drain(self, session: requests_cache.CachedSession) -> None:
+        while True:
+            with self._lock:
+                batch = list(itertools.islice(self._pending.items(), self._batch_size))
+                if not batch:
+                    self._fetching = False
+                    return
+            coordinates = [x for x, _ in batch]
+            elevations: dict[Coordinate, float | None] = {}
+            error: Exception | None = None
+            try:
+                elevations = _fetch_elevations(session, coordinates)
+                self._store.update(elevations)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                error = exc
+            with self._lock:
+                for coordinate in coordinates:
+                    del self._pending[coordinate]
+            for coordinate, future in batch:
+                if error is None:
+                    future.set_result(elevations[coordinate])
+                else:
+                    future.set_exception(error)
+
+
+ELEVATIONS = ElevationBatcher(
+    ElevationStore(os.path.join(str(MEMORY.location), "elevations.sqlite"))
+)
+
+
+def find_elevation(
+    session: requests_cache.CachedSession,
+    latitude: float,
+    longitude: float,
+    batcher: ElevationBatcher | None = None,
+) -> float | None:
+    """Find the elevation of a coordinate."""
+    if batcher is None:
+        batcher = ELEVATIONS
+    coordinate = rounded_coordinate(latitude, longitude)
+    return batcher.find(session, [coordinate])[coordinate]
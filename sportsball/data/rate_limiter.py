@@ -0,0 +1,60 @@
+"""A per host rate limiter for sessions shared between threads."""
+
+import threading
+import time
+import weakref
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+
+
+class HostRateLimiter:
+    """Spaces out the network requests to each host."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+        # The responses already waited on, by id as cached responses can't be hashed.
+        self._seen: weakref.WeakValueDictionary[int, requests.Response] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def wait(self, url: str | None) -> None:
+        """Block until a request to the URL's host is allowed."""
+        if not self._interval or url is None:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def hook(self, response: requests.Response, *_: Any, **__: Any) -> Any:
+        """Hold a response from the network until its host's next request is allowed.
+
+        As a response hook it runs once the request has been made, so each thread's
+        next request is spaced from everyone else's.
+        """
+        if getattr(response, "from_cache", False):
+            return response
+        with self._lock:
+            # Cached sessions dispatch the hooks of a network response a second time.
+            if self._seen.get(id(response)) is response:
+                return response
+            self._seen[id(response)] = response
+        self.wait(response.url)
+        return response
+
+    def throttle(self, session: requests.Session) -> None:
+        """Rate limit every request the session sends that is not already cached."""
+        session.hooks["response"].append(self.hook)
+
+    def release(self, session: requests.Session) -> None:
+        """Stop rate limiting a session throttled by this limiter."""
+        hooks = session.hooks["response"]
+        if self.hook in hooks:
+            hooks.remove(self.hook)
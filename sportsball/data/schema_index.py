@@ -0,0 +1,78 @@
+"""An index from flattened column paths to the field types of the model schema."""
+
+import functools
+import types
+from typing import Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from .delimiter import DELIMITER
+from .field_type import TYPE_KEY, FieldType
+
+_FieldIndex = dict[str, tuple[frozenset[FieldType], type[BaseModel] | None]]
+
+
+def _nested_model(annotation: type | None) -> type[BaseModel] | None:
+    origin = get_origin(annotation)
+    if origin in (list, Union, types.UnionType):
+        for arg in get_args(annotation):
+            nested_model = _nested_model(arg)
+            if nested_model is not None:
+                return nested_model
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+@functools.cache
+def _field_index(model_class: type[BaseModel]) -> _FieldIndex:
+    index: _FieldIndex = {}
+    for field_name, field in model_class.model_fields.items():
+        extra = (
+            field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+        )
+        field_type = extra.get(TYPE_KEY)
+        types_of_field: frozenset[FieldType] = frozenset()
+        if field_type:
+            types_of_field = frozenset([FieldType(field_type)])  # type: ignore
+        nested_model = _nested_model(field.annotation)
+        index[field_name] = (types_of_field, nested_model)
+        if field.alias is not None:
+            index[field.alias] = (types_of_field, nested_model)
+    return index
+
+
+@functools.cache
+def _stripped_field_types(
+    model_class: type[BaseModel], stripped_path: tuple[str, ...]
+) -> frozenset[FieldType]:
+    current_model: type[BaseModel] | None = model_class
+    types_of_field: frozenset[FieldType] = frozenset()
+    for component in stripped_path:
+        if current_model is None:
+            return frozenset()
+        entry = _field_index(current_model).get(component)
+        if entry is None:
+            return frozenset()
+        types_of_field, current_model = entry
+    return types_of_field
+
+
+def field_types(model_class: type[BaseModel], column: str) -> frozenset[FieldType]:
+    """Find the field types for a flattened column such as teams/3/players/12/kicks."""
+    return _stripped_field_types(
+        model_class,
+        tuple(x for x in column.split(DELIMITER) if not x.isdigit()),
+    )
+
+
+def classify_columns(
+    model_class: type[BaseModel], cols: list[str]
+) -> dict[FieldType, set[str]]:
+    """Classify each flattened column into the field types it belongs to."""
+    classified: dict[FieldType, set[str]] = {x: set() for x in FieldType}
+    for col in cols:
+        for field_type in field_types(model_class, col):
+            classified[field_type].add(col)
+    return classified
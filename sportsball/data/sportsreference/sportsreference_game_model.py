@@ -2,7 +2,6 @@
 
 # pylint: disable=too-many-locals,too-many-statements,unused-argument,protected-access,too-many-arguments,use-maxsplit-arg,too-many-branches,duplicate-code,broad-exception-caught,too-many-lines,line-too-long
 import datetime
-import io
 import logging
 import math
 import os
@@ -14,10 +13,10 @@ from urllib.parse import urlparse
 
 import datefinder  # type: ignore
 import dateutil
+import lxml.html
 import pandas as pd
 import pytest_is_running
 import requests
-from bs4 import BeautifulSoup, Tag
 from dateutil.parser import parse
 from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
@@ -26,6 +25,8 @@ from ..game_model import VERSION, GameModel
 from ..league import League
 from ..season_type import SeasonType
 from ..team_model import TeamModel
+from .sportsreference_html import (find, find_all, get_text, parse_html,
+                                   read_tables, tag_string)
 from .sportsreference_team_model import create_sportsreference_team_model
 from .sportsreference_umpire_model import create_sportsreference_umpire_model
 from .sportsreference_venue_model import create_sportsreference_venue_model
@@ -68,7 +69,7 @@ _NON_WAYBACK_URLS: set[str] = {
 def _find_old_dt(
     dfs: list[pd.DataFrame],
     session: ScrapeSession,
-    soup: BeautifulSoup,
+    tree: lxml.html.HtmlElement,
     url: str,
     league: League,
     player_urls: set[str],
@@ -361,8 +362,15 @@ def _find_old_dt(
             team_name = " ".join(
                 re.sub(_NUMBER_PARENTHESIS_PATTERN, "", team_name).split()
             ).strip()
-            team_a = soup.find("a", text=team_name, href=True)
-            if not isinstance(team_a, Tag):
+            team_a = next(
+                (
+                    x
+                    for x in tree.iter("a")
+                    if x.get("href") is not None and tag_string(x) == team_name
+                ),
+                None,
+            )
+            if team_a is None:
                 logging.error(team_name)
                 logging.error(response.url)
                 logging.error(response.text)
@@ -619,10 +627,10 @@ def _find_old_dt(
                 raise exc
 
     if dt is None:
-        title_tag = soup.find("title")
-        if not isinstance(title_tag, Tag):
+        title_tag = find(tree, "title")
+        if title_tag is None:
             raise ValueError("title_tag is not a tag.")
-        title = title_tag.get_text().strip().split("|")[0].strip()
+        title = get_text(title_tag).strip().split("|")[0].strip()
         date = title[title.find(",") :].strip()
         dt = parse(date)
         for df in dfs:
@@ -651,8 +659,8 @@ def _find_old_dt(
 
 
 def _find_new_dt(
-    soup: BeautifulSoup,
-    scorebox_meta_div: Tag,
+    tree: lxml.html.HtmlElement,
+    scorebox_meta_div: lxml.html.HtmlElement,
     url: str,
     session: ScrapeSession,
     league: League,
@@ -858,19 +866,19 @@ def _find_new_dt(
     defensive_rating: dict[str, int],
     box_plus_minus: dict[str, float],
 ) -> tuple[datetime.datetime, list[TeamModel], str]:
-    in_divs = scorebox_meta_div.find_all("div")
+    in_divs = find_all(scorebox_meta_div, "div")
     current_in_div_idx = 0
     in_div = in_divs[current_in_div_idx]
-    in_div_text = in_div.get_text().strip()
+    in_div_text = get_text(in_div).strip()
     current_in_div_idx += 1
     if "Tournament" in in_div_text:
-        in_div_text = in_divs[1].get_text().strip()
+        in_div_text = get_text(in_divs[1]).strip()
         current_in_div_idx += 1
     dt = None
     try:
         dt = parse(in_div_text)
     except dateutil.parser._parser.ParserError as exc:  # type: ignore
-        matches = datefinder.find_dates(scorebox_meta_div.get_text(separator="\n"))
+        matches = datefinder.find_dates(get_text(scorebox_meta_div, separator="\n"))
         for match in matches:
             if isinstance(match, datetime.datetime):
                 dt = match
@@ -879,14 +887,14 @@ def _find_new_dt(
             logging.error("Failed to parse date for URL: %s", url)
             raise exc
     venue_div = in_divs[current_in_div_idx]
-    venue_name = venue_div.get_text().strip()
+    venue_name = get_text(venue_div).strip()
     if league == League.NCAAF:
         filepath = url.split("/")[-1]
         filename, _ = os.path.splitext(filepath)
         venue_name = "-".join(filename.split("-")[3:])
     else:
         for in_div in in_divs:
-            in_div_text = in_div.get_text()
+            in_div_text = get_text(in_div)
             if "Arena:" in in_div_text:
                 venue_name = in_div_text.replace("Arena: ", "").strip()
             elif "Stadium:" in in_div_text:
@@ -894,12 +902,12 @@ def _find_new_dt(
             elif "Venue:" in in_div_text:
                 venue_name = in_div_text.replace("Venue: ", "").strip()
 
-    scorebox_div = soup.find("div", class_="scorebox")
-    if not isinstance(scorebox_div, Tag):
+    scorebox_div = find(tree, "div", class_name="scorebox")
+    if scorebox_div is None:
         raise ValueError("scorebox_div is not a Tag.")
 
     teams: list[TeamModel] = []
-    for a in scorebox_div.find_all("a"):
+    for a in find_all(scorebox_div, "a"):
         team_url = urllib.parse.urljoin(url, a.get("href"))
         if "/schools/" in team_url or "/teams/" in team_url:
             teams.append(
@@ -915,7 +923,7 @@ def _find_new_dt(
                     offensive_rebounds=offensive_rebounds,
                     assists=assists,
                     turnovers=turnovers,
-                    team_name=a.get_text().strip(),
+                    team_name=get_text(a).strip(),
                     positions_validator=positions_validator,
                     minutes_played=minutes_played,
                     three_point_field_goals=three_point_field_goals,
@@ -1130,22 +1138,26 @@ def _create_sportsreference_game_model(
     else:
         response = session.get(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "lxml")
-    page_title = soup.find("h1", class_="page_title")
+    tree = parse_html(response.text)
+    page_title = find(tree, "h1", class_name="page_title")
 
     # If the page_title is bad, try fetching from a non wayback source
     if page_title is not None:
-        if "file not found" in page_title.get_text().strip().lower():
+        if "file not found" in get_text(page_title).strip().lower():
             session.cache.delete(urls=[url, response.url])
             with session.wayback_disabled():
                 response = session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
+            tree = parse_html(response.text)
 
+    # The links are collected in a single pass over the tree.
     comp_ids = []
-    for a in soup.find_all("a"):
-        comp_url = urllib.parse.urljoin(url, a.get("href"))
-        o = urlparse(comp_url)
+    player_urls = set()
+    for href in tree.xpath("//a/@href"):
+        link_url = urllib.parse.urljoin(url, href)
+        if "/players/" in link_url and not link_url.endswith("/players/"):
+            player_urls.add(link_url)
+        o = urlparse(link_url)
         path_components = o.path.split("/")
         if len(path_components) >= 4 and path_components[2] == "comps":
             comp_id = path_components[3]
@@ -1165,16 +1177,10 @@ def _create_sportsreference_game_model(
             if mode_comp_id != 1:
                 return None
 
-    player_urls = set()
-    for a in soup.find_all("a"):
-        player_url = urllib.parse.urljoin(url, a.get("href"))
-        if "/players/" in player_url and not player_url.endswith("/players/"):
-            player_urls.add(player_url)
-
     scores = []
-    for score_div in soup.find_all("div", class_="score"):
+    for score_div in find_all(tree, "div", class_name="score"):
         try:
-            scores.append(float(score_div.get_text().strip()))
+            scores.append(float(get_text(score_div).strip()))
         except ValueError as exc:
             session.cache.delete(urls=[url, response.url])
             logging.error(response.text)
@@ -1189,9 +1195,6 @@ def _create_sportsreference_game_model(
             return None
         return value
 
-    handle = io.StringIO()
-    handle.write(response.text)
-    handle.seek(0)
     fg = {}
     fga = {}
     offensive_rebounds = {}
@@ -1391,7 +1394,7 @@ def _create_sportsreference_game_model(
     defensive_rating = {}
     box_plus_minus = {}
     try:
-        dfs = pd.read_html(handle)
+        dfs = read_tables(tree)
         for df in dfs:
             if df.index.nlevels > 1:
                 df.columns = df.columns.get_level_values(1)
@@ -2306,12 +2309,12 @@ def _create_sportsreference_game_model(
         logging.error(str(exc))
         return None
 
-    scorebox_meta_div = soup.find("div", class_="scorebox_meta")
-    if not isinstance(scorebox_meta_div, Tag):
+    scorebox_meta_div = find(tree, "div", class_name="scorebox_meta")
+    if scorebox_meta_div is None:
         dt, teams, venue_name = _find_old_dt(
             dfs=dfs,
             session=session,
-            soup=soup,
+            tree=tree,
             url=url,
             league=league,
             player_urls=player_urls,
@@ -2518,7 +2521,7 @@ def _create_sportsreference_game_model(
         )
     else:
         dt, teams, venue_name = _find_new_dt(
-            soup=soup,
+            tree=tree,
             scorebox_meta_div=scorebox_meta_div,
             url=url,
             session=session,
@@ -2730,11 +2733,11 @@ def _create_sportsreference_game_model(
             raise ValueError("team name is File Not Found (invalid)")
 
     season_type = SeasonType.REGULAR
-    for h2 in soup.find_all("h2"):
-        a = h2.find("a")
+    for h2 in find_all(tree, "h2"):
+        a = find(h2, "a")
         if a is None:
             continue
-        season_text = a.get_text().strip()
+        season_text = get_text(a).strip()
         match season_text:
             case "Big Sky Conference":
                 season_type = SeasonType.REGULAR
@@ -2816,7 +2819,7 @@ def _create_sportsreference_game_model(
                 logging.warning("Unrecognised Season Text: %s", season_text)
         break
 
-    game_text = soup.get_text().replace("\n", "")
+    game_text = get_text(tree).replace("\n", "")
     attendance = None
     if "Attendance:" in game_text:
         attendance_text = (
@@ -2837,11 +2840,11 @@ def _create_sportsreference_game_model(
             attendance = int(attendance_text)
 
     umpire_urls = []
-    for div in soup.find_all("div"):
-        for strong in div.find_all("strong"):
-            strong_text = strong.get_text().strip().lower()
+    for div in find_all(tree, "div"):
+        for strong in find_all(div, "strong"):
+            strong_text = get_text(strong).strip().lower()
             if strong_text == "officials:":
-                for umpire_a in div.find_all("a", href=True):
+                for umpire_a in div.xpath(".//a[@href]"):
                     umpire_url = urllib.parse.urljoin(url, str(umpire_a.get("href")))
                     if "/referees/" in umpire_url and not umpire_url.endswith(
                         "/referees/"
@@ -0,0 +1,285 @@
+"""Helpers to query sports reference pages from a single lxml parse."""
+
+import collections
+import copy
+import io
+import re
+
+import lxml.html
+import numpy as np
+import pandas as pd
+
+_TEXT_XPATH = (
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+_TABLE_XPATH = "//table[.//text()[re:test(., '.+')]]"
+_REGEX_NAMESPACES = {"re": "http://exslt.org/regular-expressions"}
+_MUTATED_XPATH = ".//br|.//style|.//*[@style]"
+_WHITESPACE_PATTERN = re.compile(r"[\r\n]+|\s{2,}")
+# The cells read_html treats as missing, and the numbers it strips thousands from.
+_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+_THOUSANDS_PATTERN = re.compile(
+    r"^[\-\+]?([0-9]+,|[0-9])*(\.[0-9]*)?([0-9]?(E|e)\-?[0-9]+)?$"
+)
+_BOOL_VALUES = {
+    "True": True,
+    "TRUE": True,
+    "true": True,
+    "False": False,
+    "FALSE": False,
+    "false": False,
+}
+
+
+def parse_html(text: str) -> lxml.html.HtmlElement:
+    """Parse a page into an lxml tree."""
+    try:
+        root = lxml.html.parse(io.StringIO(text)).getroot()
+    except ValueError:
+        # Pages with an XML encoding declaration can only be parsed from bytes.
+        root = lxml.html.parse(
+            io.BytesIO(text.encode()), parser=lxml.html.HTMLParser(encoding="utf-8")
+        ).getroot()
+    # An empty page has no root element.
+    if root is None:
+        return lxml.html.document_fromstring("<html></html>")
+    return root
+
+
+def get_text(element: lxml.html.HtmlElement, separator: str = "") -> str:
+    """Find the visible text beneath an element, as BeautifulSoup's get_text does."""
+    return separator.join(element.xpath(_TEXT_XPATH))
+
+
+def find_all(
+    element: lxml.html.HtmlElement, tag: str, class_name: str | None = None
+) -> list[lxml.html.HtmlElement]:
+    """Find the descendants with a tag and optionally a class."""
+    elements = element.xpath(".//" + tag)
+    if class_name is None:
+        return elements
+    return [x for x in elements if class_name in x.get("class", "").split()]
+
+
+def find(
+    element: lxml.html.HtmlElement, tag: str, class_name: str | None = None
+) -> lxml.html.HtmlElement | None:
+    """Find the first descendant with a tag and optionally a class."""
+    elements = find_all(element, tag, class_name=class_name)
+    return elements[0] if elements else None
+
+
+def tag_string(element: lxml.html.HtmlElement) -> str | None:
+    """Find the only string within an element, as BeautifulSoup's string does."""
+    if len(element) == 0:
+        return element.text
+    if len(element) == 1 and not element.text and not element[0].tail:
+        return tag_string(element[0])
+    return None
+
+
+def _cells(row: lxml.html.HtmlElement) -> list[lxml.html.HtmlElement]:
+    return row.xpath("./td|./th")
+
+
+def _expand_rows(
+    rows: list[lxml.html.HtmlElement],
+    remainder: list[tuple[int, str, int]],
+    overflow: bool,
+) -> tuple[list[list[str]], list[tuple[int, str, int]]]:
+    # Copies the text of cells that span several rows or columns, as pd.read_html does.
+    all_texts = []
+    for tr in rows:
+        texts = []
+        next_remainder = []
+        index = 0
+        for td in _cells(tr):
+            while remainder and remainder[0][0] <= index:
+                prev_i, prev_text, prev_rowspan = remainder.pop(0)
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+                index += 1
+            text = _WHITESPACE_PATTERN.sub(" ", td.text_content().strip())
+            rowspan = int(td.get("rowspan") or 1)
+            colspan = int(td.get("colspan") or 1)
+            for _ in range(colspan):
+                texts.append(text)
+                if rowspan > 1:
+                    next_remainder.append((index, text, rowspan - 1))
+                index += 1
+        for prev_i, prev_text, prev_rowspan in remainder:
+            texts.append(prev_text)
+            if prev_rowspan > 1:
+                next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+        all_texts.append(texts)
+        remainder = next_remainder
+
+    if not overflow:
+        while remainder:
+            next_remainder = []
+            texts = []
+            for prev_i, prev_text, prev_rowspan in remainder:
+                texts.append(prev_text)
+                if prev_rowspan > 1:
+                    next_remainder.append((prev_i, prev_text, prev_rowspan - 1))
+            all_texts.append(texts)
+            remainder = next_remainder
+
+    return all_texts, remainder
+
+
+def _columns(levels: list[list[str]]) -> pd.Index:
+    # Blank names are filled in and repeated names numbered, as read_csv does.
+    if len(levels) == 1:
+        names = [x or f"Unnamed: {i}" for i, x in enumerate(levels[0])]
+        counts: collections.Counter[str] = collections.Counter()
+        blank = [i for i, x in enumerate(levels[0]) if not x]
+        for i in [i for i in range(len(names)) if i not in blank] + blank:
+            name = names[i]
+            count = counts[name]
+            while count > 0 and f"{name}.{count}" in names:
+                count += 1
+            if count > 0:
+                counts[name] = count + 1
+                names[i] = f"{name}.{count}"
+            counts[names[i]] += 1
+        return pd.Index(names)
+    tuples = [
+        tuple(x or f"Unnamed: {i}_level_{j}" for j, x in enumerate(column))
+        for i, column in enumerate(zip(*levels))
+    ]
+    # Repeated columns are numbered on their last level.
+    tuple_counts: collections.Counter[tuple[str, ...]] = collections.Counter()
+    for i, column in enumerate(tuples):
+        count = tuple_counts[column]
+        while count > 0:
+            tuple_counts[column] = count + 1
+            column = column[:-1] + (f"{column[-1]}.{count}",)
+            count = tuple_counts[column]
+        tuples[i] = column
+        tuple_counts[column] = count + 1
+    return pd.MultiIndex.from_tuples(tuples)
+
+
+def _column(texts: list[str]) -> np.ndarray:
+    # Cells are typed as read_csv types them: numbers, then booleans, then strings.
+    values = np.array(
+        [
+            None
+            if x in _NA_VALUES
+            else x.replace(",", "")
+            if "," in x and _THOUSANDS_PATTERN.search(x.strip())
+            else x
+            for x in texts
+        ],
+        dtype=object,
+    )
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        pass
+    if texts and all(x in _BOOL_VALUES for x in texts):
+        return np.array([_BOOL_VALUES[x] for x in texts], dtype=bool)
+    return values
+
+
+def _visible_table(table: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+    if not table.xpath(_MUTATED_XPATH):
+        return table
+    # Hidden cells are dropped and line breaks become spaces, so work on a copy
+    # to leave the shared tree untouched.
+    table = copy.deepcopy(table)
+    for br in table.xpath(".//br"):
+        br.tail = "\n" + (br.tail or "")
+    for elem in table.xpath(".//style"):
+        elem.drop_tree()
+    for elem in table.xpath(".//*[@style]"):
+        if "display:none" in elem.get("style", "").replace(" ", ""):
+            elem.drop_tree()
+    return table
+
+
+def _table_texts(
+    table: lxml.html.HtmlElement,
+) -> tuple[list[list[str]], list[list[str]]]:
+    header_rows = []
+    for thead in table.xpath(".//thead"):
+        header_rows.extend(thead.xpath("./tr"))
+        if _cells(thead):
+            header_rows.append(thead)
+    body_rows = table.xpath(".//tbody//tr") + table.xpath("./tr")
+    footer_rows = table.xpath(".//tfoot//tr")
+    if not header_rows:
+        while body_rows and all(x.tag == "th" for x in _cells(body_rows[0])):
+            header_rows.append(body_rows.pop(0))
+
+    head, remainder = _expand_rows(header_rows, [], True)
+    body, remainder = _expand_rows(body_rows, remainder, len(footer_rows) > 0)
+    foot, _ = _expand_rows(footer_rows, remainder, False)
+    return head, body + foot
+
+
+def _table_to_frame(table: lxml.html.HtmlElement) -> pd.DataFrame | None:
+    head, body = _table_texts(_visible_table(table))
+    if not head and not body:
+        return None
+    width = max(len(x) for x in head + body)
+    for row in head + body:
+        row += [""] * (width - len(row))
+    if width == 1:
+        # Rows of a single blank cell are blank lines to read_csv.
+        head = [x for x in head if x[0].strip()]
+        body = [x for x in body if x[0].strip()]
+        if not head and not body:
+            return None
+    if head:
+        # Every header row with text is a level of the columns, and the data follows
+        # the last of them.
+        levels = [i for i, row in enumerate(head) if any(row)] if len(head) > 1 else [0]
+        body = head[levels[-1] + 1 :] + body
+        columns = _columns([head[i] for i in levels])
+    else:
+        columns = pd.RangeIndex(width)
+    return pd.DataFrame(
+        {i: _column([x[i] for x in body]) for i in range(width)}
+    ).set_axis(columns, axis=1)
+
+
+def read_tables(tree: lxml.html.HtmlElement) -> list[pd.DataFrame]:
+    """Read the visible tables in a tree into dataframes, as pd.read_html does."""
+    tables = [
+        x
+        for x in tree.xpath(_TABLE_XPATH, namespaces=_REGEX_NAMESPACES)
+        if "display:none" not in x.get("style", "").replace(" ", "")
+    ]
+    if not tables:
+        raise ValueError("No tables found")
+    dfs = []
+    for table in tables:
+        df = _table_to_frame(table)
+        if df is not None:
+            dfs.append(df)
+    return dfs
@@ -1,6 +1,6 @@
 """Sports reference league model."""
 
-# pylint: disable=line-too-long,too-many-branches,too-many-nested-blocks
+# pylint: disable=line-too-long,too-many-branches,too-many-nested-blocks,too-many-arguments
 import datetime
 import logging
 import re
@@ -14,7 +14,9 @@ from scrapesession.scrapesession import ScrapeSession  # type: ignore
 
 from ..game_model import GameModel
 from ..league import League
-from ..league_model import SHUTDOWN_FLAG, LeagueModel, needs_shutdown
+from ..league_model import (SHUTDOWN_FLAG, LeagueModel, before_incremental,
+                            needs_shutdown)
+from ..worker_settings import WorkerSettings
 from .sportsreference_game_model import create_sportsreference_game_model
 
 REPLACEMENT_URLS = {
@@ -112,9 +114,11 @@ class SportsReferenceLeagueModel(LeagueModel):
         league: League,
         base_url: str,
         position: int | None = None,
+        workers: WorkerSettings | None = None,
     ) -> None:
         super().__init__(league, session, position=position)
         self._base_url = base_url
+        self._pool = (workers or WorkerSettings()).sportsreference
 
     @classmethod
     def name(cls) -> str:
@@ -127,29 +131,49 @@ class SportsReferenceLeagueModel(LeagueModel):
             "position_validator is not implemented by parent class"
         )
 
+    def _produce_game(self, game_url: str) -> GameModel | None:
+        if needs_shutdown():
+            return None
+        try:
+            return create_sportsreference_game_model(
+                self._worker_session(),
+                game_url,
+                self.league,
+                self.position_validator(),
+            )
+        except Exception as exc:
+            logging.warning(str(exc))
+            raise exc
+
     def _produce_games(
         self, soup: BeautifulSoup, pbar: tqdm.tqdm, url: str
     ) -> Iterator[GameModel]:
-        for game_url in _find_game_urls(soup, url):
+        game_urls = _find_game_urls(soup, url)
+        executor = self._executor
+        if executor is None:
+            game_models: Iterator[GameModel | None] = (
+                self._produce_game(x) for x in game_urls
+            )
+        else:
+            # The day's boxscores are fetched concurrently but yielded in page order.
+            game_models = executor.map(self._produce_game, game_urls)
+        for game_model in game_models:
             if needs_shutdown():
                 return
             pbar.update(1)
-            try:
-                game_model = create_sportsreference_game_model(
-                    self.session, game_url, self.league, self.position_validator()
-                )
-                if game_model is None:
-                    continue
-                pbar.set_description(
-                    f"SportsReference {game_model.year} - {game_model.season_type} - {game_model.dt}"
-                )
-                yield game_model
-            except Exception as exc:
-                logging.warning(str(exc))
-                raise exc
+            if game_model is None:
+                continue
+            pbar.set_description(
+                f"SportsReference {game_model.year} - {game_model.season_type} - {game_model.dt}"
+            )
+            yield game_model
 
     @property
     def games(self) -> Iterator[GameModel]:
+        with self._worker_pool(self._pool.max_workers, self._pool.requests_per_second):
+            yield from self._produce_day_games()
+
+    def _produce_day_games(self) -> Iterator[GameModel]:
         # pylint: disable=too-many-locals
         try:
             final_path: str | None = ""
@@ -178,7 +202,7 @@ class SportsReferenceLeagueModel(LeagueModel):
                             dt = datetime.datetime.strptime(
                                 parsed_url.path.split("/")[-1], "%Y-%m-%d"
                             )
-                        if dt.year <= 1945:
+                        if dt.year <= 1945 or before_incremental(dt):
                             break
                     soup = BeautifulSoup(response.text, "lxml")
                     yield from self._produce_games(soup, pbar, url)
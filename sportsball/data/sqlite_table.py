@@ -0,0 +1,103 @@
+"""A small key value table kept in a SQLite file."""
+
+import os
+import sqlite3
+import threading
+import urllib.parse
+from typing import Any, Iterable
+
+_MAX_VARIABLES = 500
+
+
+def connect_read_only(path: str) -> sqlite3.Connection:
+    """Open a SQLite file that is never written to, such as one shipped with the package."""
+    return sqlite3.connect(
+        f"file:{urllib.parse.quote(path)}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=False,
+    )
+
+
+class SQLiteTable:
+    """A table of keys to values for one kind of entry, opened on first use."""
+
+    def __init__(
+        self, path: str, table: str, kind: str, read_only: bool = False
+    ) -> None:
+        self._path = path
+        self._table = table
+        self._kind = kind
+        self._read_only = read_only
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+        if self._read_only:
+            self._connection = connect_read_only(self._path)
+            return self._connection
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} "
+            "(kind TEXT, key TEXT, value, PRIMARY KEY (kind, key)) WITHOUT ROWID"
+        )
+        self._connection = connection
+        return connection
+
+    def get(self, key: str) -> Any:
+        """Find the value of a key, or None if it is not in the table."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    f"SELECT value FROM {self._table} WHERE kind = ? AND key = ?",
+                    (self._kind, key),
+                )
+                .fetchone()
+            )
+        return None if row is None else row[0]
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Find the values of keys, leaving out any that are not in the table."""
+        found: dict[str, Any] = {}
+        with self._lock:
+            connection = self._connect()
+            # Kept well under SQLite's limit on the variables in one statement.
+            for i in range(0, len(keys), _MAX_VARIABLES):
+                chunk = keys[i : i + _MAX_VARIABLES]
+                found.update(
+                    connection.execute(
+                        f"SELECT key, value FROM {self._table} WHERE kind = ? "
+                        f"AND key IN ({', '.join('?' * len(chunk))})",
+                        (self._kind, *chunk),
+                    ).fetchall()
+                )
+        return found
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Find every key and its value."""
+        with self._lock:
+            return (
+                self._connect()
+                .execute(
+                    f"SELECT key, value FROM {self._table} WHERE kind = ?",
+                    (self._kind,),
+                )
+                .fetchall()
+            )
+
+    def update(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Write the values of keys, replacing any they had before."""
+        rows = [(self._kind, x, y) for x, y in items]
+        if self._read_only or not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?)", rows
+                )
@@ -1,10 +1,13 @@
 """Gribstream weather model."""
 
+# pylint: disable=too-few-public-methods
 import datetime
 import gzip
 import io
 import json
 import os
+import threading
+from concurrent.futures import Future
 
 import pandas as pd
 import pytest_is_running
@@ -15,24 +18,37 @@ import requests_cache
 from ....cache import MEMORY
 from ...weather_model import VERSION, WeatherModel
 
+_URL = "https://gribstream.com/api/v2/nbm/forecasts"
+_PRECISION = 4
+_BATCH_SIZE = 64
 
-def _create_gribstream_weather_model(
+# A lookup by its UTC instant and rounded coordinate.
+Lookup = tuple[datetime.datetime, float, float]
+
+
+def _lookup(latitude: float, longitude: float, dt: datetime.datetime) -> Lookup:
+    return (
+        dt.astimezone(pytz.utc),
+        round(latitude, _PRECISION),
+        round(longitude, _PRECISION),
+    )
+
+
+def _post(
     session: requests_cache.CachedSession,
-    latitude: float,
-    longitude: float,
-    dt: datetime.datetime,
-    version: str,
-) -> WeatherModel | None:
-    api_key = os.environ.get("GRIBSTREAM_API_KEY")
-    if api_key is None:
-        return None
-    url = "https://gribstream.com/api/v2/nbm/forecasts"
+    forecasted_from: datetime.datetime,
+    forecasted_until: datetime.datetime,
+    coordinates: list[tuple[float, float]],
+) -> pd.DataFrame | None:
     payload = {
-        "forecastedFrom": dt.astimezone(pytz.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "forecastedUntil": dt.astimezone(pytz.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "forecastedFrom": forecasted_from.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "forecastedUntil": forecasted_until.strftime("%Y-%m-%dT%H:%M:%SZ"),
         "minHorizon": 12,
         "maxHorizon": 24,
-        "coordinates": [{"lat": latitude, "lon": longitude}],
+        # Each coordinate is named by its position, so its rows can be found in the response.
+        "coordinates": [
+            {"lat": x, "lon": y, "name": str(i)} for i, (x, y) in enumerate(coordinates)
+        ],
         "variables": [
             {"name": "TMP", "level": "2 m above ground", "info": ""},
             {"name": "DPT", "level": "2 m above ground", "info": ""},
@@ -41,7 +57,7 @@ def _create_gribstream_weather_model(
     }
     try:
         resp = session.post(
-            url,
+            _URL,
             data=gzip.compress(json.dumps(payload).encode("utf-8")),
             headers={
                 "Accept-Encoding": "gzip",
@@ -54,8 +70,127 @@ def _create_gribstream_weather_model(
         return None
     if not resp.ok:
         return None
-    df = pd.read_csv(io.BytesIO(resp.content), parse_dates=[0, 1])
-    idx = df.index.get_indexer([dt], method="nearest")[0]
+    return pd.read_csv(
+        io.BytesIO(resp.content), parse_dates=[0, 1], dtype={"name": str}
+    )
+
+
+def _fetch_rows(
+    session: requests_cache.CachedSession, lookups: list[Lookup]
+) -> dict[tuple[float, float], pd.DataFrame | None]:
+    coordinates = list(dict.fromkeys((x[1], x[2]) for x in lookups))
+    df = _post(
+        session,
+        min(x[0] for x in lookups),
+        max(x[0] for x in lookups),
+        coordinates,
+    )
+    if df is None:
+        return {x: None for x in coordinates}
+    if "name" not in df.columns:
+        if len(coordinates) == 1:
+            return {coordinates[0]: df}
+        # Without the names the rows can't be told apart, so each coordinate is asked alone.
+        return {
+            x: _fetch_rows(session, [y for y in lookups if (y[1], y[2]) == x])[x]
+            for x in coordinates
+        }
+    return {
+        x: df[df["name"] == str(i)].reset_index(drop=True)
+        for i, x in enumerate(coordinates)
+    }
+
+
+class GribstreamBatcher:
+    """Fetches the forecast rows of lookups, several venues to a request.
+
+    Lookups made while a request is in flight wait for the next one, which covers
+    every queued venue on the same UTC day from the earliest to the latest lookup.
+    """
+
+    def __init__(self, batch_size: int = _BATCH_SIZE) -> None:
+        self._batch_size = batch_size
+        self._pending: dict[Lookup, Future[pd.DataFrame | None]] = {}
+        self._fetching = False
+        self._lock = threading.Lock()
+
+    def find(
+        self,
+        session: requests_cache.CachedSession,
+        latitude: float,
+        longitude: float,
+        dt: datetime.datetime,
+    ) -> pd.DataFrame | None:
+        """Find the forecast rows of a venue around a time."""
+        lookup = _lookup(latitude, longitude, dt)
+        with self._lock:
+            future = self._pending.get(lookup)
+            if future is None:
+                future = Future()
+                self._pending[lookup] = future
+            fetch = not self._fetching
+            if fetch:
+                self._fetching = True
+        if fetch:
+            self._drain(session)
+        return future.result()
+
+    def _next_batch(self) -> list[tuple[Lookup, Future[pd.DataFrame | None]]]:
+        with self._lock:
+            if not self._pending:
+                self._fetching = False
+                return []
+            day = next(iter(self._pending))[0].date()
+            same_day = (x for x in self._pending.items() if x[0][0].date() == day)
+            batch = []
+            coordinates: set[tuple[float, float]] = set()
+            for lookup, future in same_day:
+                coordinate = (lookup[1], lookup[2])
+                if coordinate not in coordinates:
+                    if len(coordinates) == self._batch_size:
+                        continue
+                    coordinates.add(coordinate)
+                batch.append((lookup, future))
+            return batch
+
+    def _drain(self, session: requests_cache.CachedSession) -> None:
+        for batch in iter(self._next_batch, []):
+            lookups = [x for x, _ in batch]
+            rows: dict[tuple[float, float], pd.DataFrame | None] = {}
+            error: Exception | None = None
+            try:
+                rows = _fetch_rows(session, lookups)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                error = exc
+            with self._lock:
+                for lookup in lookups:
+                    del self._pending[lookup]
+            for lookup, future in batch:
+                if error is None:
+                    future.set_result(rows[(lookup[1], lookup[2])])
+                else:
+                    future.set_exception(error)
+
+
+GRIBSTREAM = GribstreamBatcher()
+
+
+def _create_gribstream_weather_model(
+    session: requests_cache.CachedSession,
+    latitude: float,
+    longitude: float,
+    dt: datetime.datetime,
+    version: str,
+) -> WeatherModel | None:
+    if os.environ.get("GRIBSTREAM_API_KEY") is None:
+        return None
+    df = GRIBSTREAM.find(session, latitude, longitude, dt)
+    if df is None or df.empty:
+        return None
+    forecasted_times = pd.DatetimeIndex(df["forecasted_time"])
+    if forecasted_times.tz is None:
+        forecasted_times = forecasted_times.tz_localize(pytz.utc)
+    idx = (forecasted_times - dt.astimezone(pytz.utc)).to_series().abs().argmin()
     temperature = df.iloc[idx]["TMP|2 m above ground|"]  # type: ignore
     relative_humidity = df.iloc[idx]["RH|2 m above ground|"]  # type: ignore
     return WeatherModel(
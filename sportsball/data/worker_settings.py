@@ -0,0 +1,30 @@
+"""The worker pools the providers run their requests on."""
+
+# pylint: disable=too-few-public-methods
+
+
+class PoolSettings:
+    """How many workers a provider runs and how often they may request each host."""
+
+    def __init__(
+        self, max_workers: int = 1, requests_per_second: float | None = None
+    ) -> None:
+        self.max_workers = max_workers
+        self.requests_per_second = requests_per_second
+
+
+class WorkerSettings:
+    """The pool settings of each provider that can fetch concurrently."""
+
+    def __init__(
+        self,
+        espn: PoolSettings | None = None,
+        sportsreference: PoolSettings | None = None,
+        oddsportal: PoolSettings | None = None,
+    ) -> None:
+        # Concurrency is opt in, and the scraped sites throttle aggressive clients.
+        self.espn = espn or PoolSettings(requests_per_second=10.0)
+        self.sportsreference = sportsreference or PoolSettings(
+            requests_per_second=20.0 / 60.0
+        )
+        self.oddsportal = oddsportal or PoolSettings(requests_per_second=2.0)
@@ -23,6 +23,7 @@ from .data.ncaab import NCAABLeagueModel
 from .data.ncaaf import NCAAFLeagueModel
 from .data.nfl import NFLLeagueModel
 from .data.nhl import NHLLeagueModel
+from .data.worker_settings import WorkerSettings
 
 
 class SportsBall:
@@ -32,8 +33,9 @@ class SportsBall:
 
     _leagues: Dict[str, LeagueModel]
     _session: ScrapeSession
+    _workers: WorkerSettings | None
 
-    def __init__(self) -> None:
+    def __init__(self, workers: WorkerSettings | None = None) -> None:
         self._session = create_scrape_session(
             "sportsball",
             {
@@ -43,6 +45,7 @@ class SportsBall:
             },
         )
         self._leagues = {}
+        self._workers = workers
         simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
         load_dotenv()
 
@@ -50,29 +53,51 @@ class SportsBall:
         """Provide a league model for the given league."""
         if league not in self._leagues:
             if league == League.NFL:
-                self._leagues[league] = NFLLeagueModel(self._session, league_filter)
+                self._leagues[league] = NFLLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.AFL:
-                self._leagues[league] = AFLLeagueModel(self._session, league_filter)
+                self._leagues[league] = AFLLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.NBA:
-                self._leagues[league] = NBALeagueModel(self._session, league_filter)
+                self._leagues[league] = NBALeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.NCAAF:
-                self._leagues[league] = NCAAFLeagueModel(self._session, league_filter)
+                self._leagues[league] = NCAAFLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.NCAAB:
-                self._leagues[league] = NCAABLeagueModel(self._session, league_filter)
+                self._leagues[league] = NCAABLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.HKJC:
                 self._leagues[league] = HKJCLeagueModel(self._session)
             elif league == League.NHL:
-                self._leagues[league] = NHLLeagueModel(self._session, league_filter)
+                self._leagues[league] = NHLLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.MLB:
-                self._leagues[league] = MLBLeagueModel(self._session, league_filter)
+                self._leagues[league] = MLBLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.EPL:
-                self._leagues[league] = EPLLeagueModel(self._session, league_filter)
+                self._leagues[league] = EPLLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.IPL:
-                self._leagues[league] = IPLLeagueModel(self._session, league_filter)
+                self._leagues[league] = IPLLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.FIFA:
-                self._leagues[league] = FIFALeagueModel(self._session, league_filter)
+                self._leagues[league] = FIFALeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             elif league == League.ATP:
-                self._leagues[league] = ATPLeagueModel(self._session, league_filter)
+                self._leagues[league] = ATPLeagueModel(
+                    self._session, league_filter, workers=self._workers
+                )
             else:
                 raise ValueError(f"Unrecognised league: {league}")
         return self._leagues[league]
@@ -0,0 +1,80 @@
+"""Tests for the combine fields function."""
+import math
+import random
+import unittest
+
+import requests_cache
+from sportsball.data.combined.combine_fields import combine_fields
+from sportsball.data.game_model import GameModel
+from sportsball.data.player_model import PlayerModel
+
+from tests.fixtures.combine_fields import (chained_combiners, combine_games, five_provider_games, game_model,
+                                           more_interesting_fields, player_model)
+
+
+def _assert_same(test_case, left, right):
+    test_case.assertEqual(left.keys(), right.keys())
+    for key, value in left.items():
+        if isinstance(value, float) and math.isnan(value):
+            test_case.assertTrue(math.isnan(right[key]), key)
+        else:
+            test_case.assertEqual(value, right[key], key)
+            test_case.assertIs(type(value), type(right[key]), key)
+
+
+class TestCombineFields(unittest.TestCase):
+
+    def test_more_interesting(self):
+        rnd = random.Random(42)
+        exclude = frozenset({"dt", "venue", "teams", "league", "dividends", "umpires", "version"})
+        for _ in range(200):
+            game_models = [game_model(rnd) for _ in range(rnd.randint(1, 4))]
+            values = combine_fields(game_models, exclude=exclude)
+            _assert_same(
+                self,
+                values,
+                more_interesting_fields(
+                    game_models, [x for x in GameModel.model_fields if x not in exclude]
+                ),
+            )
+
+    def test_derived_fields(self):
+        rnd = random.Random(42)
+        player_models = [player_model(rnd) for _ in range(2)]
+        values = combine_fields(
+            player_models,
+            exclude=frozenset({"identifier", "version"}),
+            include_derived=frozenset({"sex"}),
+        )
+        self.assertIn("sex", values)
+        self.assertNotIn("total_rebounds", values)
+        self.assertNotIn("identifier", values)
+
+    def test_player_fields(self):
+        rnd = random.Random(42)
+        field_names = [
+            x
+            for x, y in PlayerModel.model_fields.items()
+            if x not in {"identifier", "version"}
+            and (not y.default_factory_takes_validated_data or x == "sex")
+        ]
+        for _ in range(20):
+            player_models = [player_model(rnd) for _ in range(3)]
+            _assert_same(
+                self,
+                combine_fields(
+                    player_models,
+                    exclude=frozenset({"identifier", "version"}),
+                    include_derived=frozenset({"sex"}),
+                ),
+                more_interesting_fields(player_models, field_names),
+            )
+
+    def test_game_fields(self):
+        games = five_provider_games(random.Random(42), 2)
+        session = requests_cache.CachedSession(backend="memory")
+        with chained_combiners():
+            expected_game_models = combine_games(games, session)
+        game_models = combine_games(games, session)
+        for game_model, expected_game_model in zip(game_models, expected_game_models):
+            self.assertEqual(game_model.model_dump_json(), expected_game_model.model_dump_json())
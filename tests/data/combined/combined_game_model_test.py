@@ -6,6 +6,7 @@ import unittest
 import requests_mock
 import requests_cache
 from sportsball.data.combined.combined_game_model import create_combined_game_model
+from sportsball.data.combined.identity_table import IdentityTable
 from sportsball.data.league import League
 from sportsball.data.season_type import SeasonType
 from sportsball.data.game_model import GameModel, VERSION
@@ -39,8 +40,8 @@ class TestCombinedGameModel(unittest.TestCase):
                 umpires=[],
                 version=VERSION,
             )
-            names = {}
-            coach_names = {}
+            player_identities = IdentityTable("player")
+            coach_identities = IdentityTable("coach")
             players_ffill = {}
             teams_ffill = {}
             coaches_ffill = {}
@@ -49,10 +50,10 @@ class TestCombinedGameModel(unittest.TestCase):
                 game_models=[game_model],
                 venue_identity_map={},
                 team_identity_map={},
-                player_identity_map={},
+                player_identities=player_identities,
+                coach_identities=coach_identities,
+                umpire_identities=IdentityTable("umpire"),
                 session=self._session,
-                names=names,
-                coach_names=coach_names,
                 last_game_number=None,
                 player_ffill=players_ffill,
                 team_ffill=teams_ffill,
@@ -0,0 +1,199 @@
+"""Tests for the combined league model class."""
+import datetime
+import os
+import queue
+import threading
+import unittest
+from unittest import mock
+
+import requests_cache
+from sportsball.data.combined import combined_league_model
+from sportsball.data.combined.combined_league_model import CombinedLeagueModel
+from sportsball.data.league import League
+
+from tests.fixtures.combined_league_model import SyntheticLeagueModel, game_model, synthetic_game_model
+
+
+class _LockedError(Exception):
+
+    def __init__(self):
+        super().__init__("provider failed")
+        self.lock = threading.Lock()
+
+
+class _FailingLeagueModel(SyntheticLeagueModel):
+
+    @property
+    def games(self):
+        yield game_model(self._dts[0])
+        raise _LockedError()
+
+
+class _ExitingLeagueModel(SyntheticLeagueModel):
+
+    @property
+    def games(self):
+        yield game_model(self._dts[0])
+        # Exits cleanly without sending the done marker, as a child does when its last
+        # item fails to pickle.
+        os._exit(0)
+
+
+class _TestCombinedLeagueModel(CombinedLeagueModel):
+
+    @classmethod
+    def team_identity_map(cls):
+        return {}
+
+    @classmethod
+    def venue_identity_map(cls):
+        return {}
+
+
+class TestCombinedLeagueModel(unittest.TestCase):
+
+    def setUp(self):
+        self._session = requests_cache.CachedSession(backend="memory")
+
+    def test_streaming(self):
+        event = threading.Event()
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(10)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, dts, event=event),
+                SyntheticLeagueModel(self._session, dts),
+            ],
+            None,
+        )
+        games = league_model.games
+        # The first games are combined while a provider is still running.
+        first_game = next(games)
+        self.assertFalse(event.is_set())
+        event.set()
+        game_models = [first_game] + list(games)
+        self.assertListEqual([x.dt for x in game_models], dts)
+
+    def test_reversed(self):
+        dts = [datetime.datetime(2023, 10, 10, 19) - datetime.timedelta(days=x) for x in range(10)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, dts),
+                SyntheticLeagueModel(self._session, dts[:3] + [dts[4], dts[3]] + dts[5:]),
+            ],
+            None,
+        )
+        game_models = list(league_model.games)
+        self.assertListEqual([x.dt for x in game_models], dts)
+
+    def test_unordered(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(10)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, dts),
+                SyntheticLeagueModel(self._session, dts[5:] + list(reversed(dts[:5]))),
+            ],
+            None,
+        )
+        game_models = list(league_model.games)
+        self.assertListEqual(sorted(x.dt for x in game_models), dts)
+
+    def test_final_flush(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(3)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, [dts[1], dts[2], dts[0]]),
+                SyntheticLeagueModel(self._session, [dts[1], dts[2], dts[0]]),
+            ],
+            None,
+        )
+        game_models = list(league_model.games)
+        # The games left when the providers finish come out in date order.
+        self.assertListEqual([x.dt for x in game_models], dts)
+
+    def test_split_runs(self):
+        # Upcoming games forwards, then past games backwards from the day before.
+        event = threading.Event()
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(20)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, dts, event=event),
+                SyntheticLeagueModel(self._session, dts[10:] + list(reversed(dts[:10]))),
+            ],
+            None,
+        )
+        games = league_model.games
+        first_game = next(games)
+        self.assertFalse(event.is_set())
+        event.set()
+        game_models = [first_game] + list(games)
+        self.assertListEqual(sorted(x.dt for x in game_models), dts)
+
+    def test_processes(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(10)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                SyntheticLeagueModel(self._session, dts),
+                SyntheticLeagueModel(self._session, dts),
+            ],
+            None,
+        )
+        with mock.patch.object(combined_league_model, "USE_PROCESSES", True):
+            game_models = list(league_model.games)
+        self.assertListEqual([x.dt for x in game_models], dts)
+
+    def test_provider_error(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(10)]
+        for use_processes in (False, True):
+            league_model = _TestCombinedLeagueModel(
+                self._session,
+                League.NBA,
+                [
+                    _FailingLeagueModel(self._session, dts),
+                    SyntheticLeagueModel(self._session, dts),
+                ],
+                None,
+            )
+            with mock.patch.object(combined_league_model, "USE_PROCESSES", use_processes):
+                with self.assertRaisesRegex(RuntimeError, "_LockedError: provider failed"):
+                    list(league_model.games)
+
+    def test_process_exited(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(10)]
+        league_model = _TestCombinedLeagueModel(
+            self._session,
+            League.NBA,
+            [
+                _ExitingLeagueModel(self._session, dts),
+                SyntheticLeagueModel(self._session, dts),
+            ],
+            None,
+        )
+        with mock.patch.object(combined_league_model, "USE_PROCESSES", True):
+            with self.assertRaisesRegex(RuntimeError, "exited with code 0 before it finished"):
+                list(league_model.games)
+
+    def test_hand_off(self):
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(3)]
+        game_models = [synthetic_game_model(dt) for dt in dts]
+        league_model = SyntheticLeagueModel(self._session, dts)
+        games_queue = queue.Queue()
+        with mock.patch.object(SyntheticLeagueModel, "games", new=iter(game_models)):
+            combined_league_model._produce_league_games(league_model, 0, games_queue, threading.Event())
+        items = [games_queue.get() for _ in range(len(game_models) + 1)]
+        # The provider's games are handed to the combiner as they are, without a copy.
+        for (index, item), expected_game_model in zip(items, game_models):
+            self.assertEqual(index, 0)
+            self.assertIs(item, expected_game_model)
+        self.assertTupleEqual(items[-1], (0, combined_league_model._DONE))
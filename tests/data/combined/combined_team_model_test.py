@@ -6,6 +6,7 @@ import unittest
 import requests_mock
 import requests_cache
 from sportsball.data.combined.combined_team_model import create_combined_team_model
+from sportsball.data.combined.identity_table import IdentityTable
 from sportsball.data.team_model import TeamModel, VERSION
 from sportsball.data.player_model import PlayerModel, VERSION as PLAYER_VERSION
 from sportsball.data.species import Species
@@ -20,8 +21,8 @@ class TestCombinedTeamModel(unittest.TestCase):
 
     def test_names_resolve(self):
         with requests_mock.Mocker() as m:
-            names = {}
-            coach_names = {}
+            player_identities = IdentityTable("player")
+            coach_identities = IdentityTable("coach")
             player_ffill = {}
             team_ffill = {}
             coach_ffill = {}
@@ -562,9 +563,8 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model = create_combined_team_model(
                 team_models=team_models,
                 identifier="a",
-                player_identity_map={},
-                names=names,
-                coach_names=coach_names,
+                player_identities=player_identities,
+                coach_identities=coach_identities,
                 player_ffill=player_ffill,
                 team_ffill=team_ffill,
                 coach_ffill=coach_ffill,
@@ -1106,9 +1106,8 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model_2 = create_combined_team_model(
                 team_models=team_models_2,
                 identifier="a",
-                player_identity_map={},
-                names=names,
-                coach_names=coach_names,
+                player_identities=player_identities,
+                coach_identities=coach_identities,
                 player_ffill=player_ffill,
                 team_ffill=team_ffill,
                 coach_ffill=coach_ffill,
@@ -1117,8 +1116,8 @@ class TestCombinedTeamModel(unittest.TestCase):
 
     def test_names_resolve_with_surname_firstname(self):
         with requests_mock.Mocker() as m:
-            names = {}
-            coach_names = {}
+            player_identities = IdentityTable("player")
+            coach_identities = IdentityTable("coach")
             player_ffill = {}
             team_ffill = {}
             coach_ffill = {}
@@ -1659,9 +1658,8 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model = create_combined_team_model(
                 team_models=team_models,
                 identifier="a",
-                player_identity_map={},
-                names=names,
-                coach_names=coach_names,
+                player_identities=player_identities,
+                coach_identities=coach_identities,
                 player_ffill=player_ffill,
                 team_ffill=team_ffill,
                 coach_ffill=coach_ffill,
@@ -2203,9 +2201,8 @@ class TestCombinedTeamModel(unittest.TestCase):
             team_model_2 = create_combined_team_model(
                 team_models=team_models_2,
                 identifier="a",
-                player_identity_map={},
-                names=names,
-                coach_names=coach_names,
+                player_identities=player_identities,
+                coach_identities=coach_identities,
                 player_ffill=player_ffill,
                 team_ffill=team_ffill,
                 coach_ffill=coach_ffill,
@@ -2213,8 +2210,8 @@ class TestCombinedTeamModel(unittest.TestCase):
             self.assertEqual(team_model.players[0].identifier, team_model_2.players[0].identifier)
 
     def test_coach_ffill(self):
-        names = {}
-        coach_names = {}
+        player_identities = IdentityTable("player")
+        coach_identities = IdentityTable("coach")
         player_ffill = {}
         team_ffill = {}
         coach_ffill = {}
@@ -2257,9 +2254,8 @@ class TestCombinedTeamModel(unittest.TestCase):
         team_model = create_combined_team_model(
             team_models=team_models,
             identifier="a",
-            player_identity_map={},
-            names=names,
-            coach_names=coach_names,
+            player_identities=player_identities,
+            coach_identities=coach_identities,
             player_ffill=player_ffill,
             team_ffill=team_ffill,
             coach_ffill=coach_ffill,
@@ -2296,9 +2292,8 @@ class TestCombinedTeamModel(unittest.TestCase):
         next_team_model = create_combined_team_model(
             team_models=next_team_models,
             identifier="a",
-            player_identity_map={},
-            names=names,
-            coach_names=coach_names,
+            player_identities=player_identities,
+            coach_identities=coach_identities,
             player_ffill=player_ffill,
             team_ffill=team_ffill,
             coach_ffill=coach_ffill,
@@ -0,0 +1,88 @@
+"""Tests for the ffill function."""
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from sportsball.data.coach_model import VERSION, CoachModel
+from sportsball.data.combined.ffill import FFillStore, ffill
+from sportsball.data.umpire_model import VERSION as UMPIRE_VERSION
+from sportsball.data.umpire_model import UmpireModel
+
+
+def _coach_model(birth_date):
+    return CoachModel(
+        identifier="a",
+        name="James Jones",
+        birth_date=birth_date,
+        age=None,
+        sex=None,
+        version=VERSION,
+    )
+
+
+class TestFFill(unittest.TestCase):
+
+    def test_ffill(self):
+        birth_date = datetime.date(1970, 1, 1)
+        ffill_store = FFillStore("coach", CoachModel, VERSION)
+        ffill(ffill_store, "a", _coach_model(birth_date))
+        coach_model = _coach_model(None)
+        ffill(ffill_store, "a", coach_model)
+        self.assertEqual(coach_model.birth_date, birth_date)
+        self.assertEqual(ffill_store.get("a"), {"birth_date": birth_date})
+
+    def test_max_size(self):
+        ffill_store = FFillStore("coach", CoachModel, VERSION, max_size=1)
+        ffill_store["a"] = {"sex": "male"}
+        with self.assertLogs(level="WARNING"):
+            ffill_store["b"] = {"sex": "female"}
+        self.assertEqual(len(ffill_store), 1)
+        self.assertIsNone(ffill_store.get("a"))
+        self.assertEqual(ffill_store.get("b"), {"sex": "female"})
+
+    def test_persistence(self):
+        birth_date = datetime.date(1970, 1, 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "ffill.sqlite")
+            ffill_store = FFillStore("coach", CoachModel, VERSION, path=path, max_size=1)
+            ffill(ffill_store, "a", _coach_model(birth_date))
+            # Evicted values are written out and read back when they are next needed.
+            ffill_store["b"] = {"sex": "female"}
+            self.assertEqual(ffill_store.get("a"), {"birth_date": birth_date})
+            ffill_store.flush()
+
+            ffill_store = FFillStore("coach", CoachModel, VERSION, path=path)
+            coach_model = _coach_model(None)
+            ffill(ffill_store, "a", coach_model)
+            self.assertEqual(coach_model.birth_date, birth_date)
+            self.assertEqual(ffill_store.get("b"), {"sex": "female"})
+            self.assertIsNone(FFillStore("umpire", UmpireModel, UMPIRE_VERSION, path=path).get("a"))
+
+    def test_version(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "ffill.sqlite")
+            ffill_store = FFillStore("coach", CoachModel, VERSION, path=path)
+            ffill(ffill_store, "a", _coach_model(datetime.date(1970, 1, 1)))
+            ffill_store.flush()
+            connection = sqlite3.connect(path)
+            (value,) = connection.execute("SELECT value FROM ffill").fetchone()
+            connection.close()
+            self.assertEqual(
+                json.loads(value),
+                {"version": VERSION, "values": {"birth_date": "1970-01-01"}},
+            )
+            # Values written by another version of the model are discarded.
+            self.assertIsNone(FFillStore("coach", CoachModel, "0.0.0", path=path).get("a"))
+
+    def test_unchanged(self):
+        ffill_store = FFillStore("coach", CoachModel, VERSION)
+        ffill(ffill_store, "a", _coach_model(datetime.date(1970, 1, 1)))
+        ffill_store.flush()
+        ffill(ffill_store, "a", _coach_model(datetime.date(1970, 1, 1)))
+        ffill(ffill_store, "a", _coach_model(None))
+        self.assertSetEqual(ffill_store._dirty, set())
+        ffill(ffill_store, "a", _coach_model(datetime.date(1971, 1, 1)))
+        self.assertSetEqual(ffill_store._dirty, {"a"})
@@ -0,0 +1,50 @@
+"""Tests for the game index class."""
+import datetime
+import types
+import unittest
+
+import pytz
+from sportsball.data.combined.game_index import GameIndex
+
+
+def _game_model(dt, teams):
+    return types.SimpleNamespace(
+        dt=dt,
+        teams=[types.SimpleNamespace(identifier=x, name=x) for x in teams],
+    )
+
+
+class TestGameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self._index = GameIndex({"lal": "lakers", "los-angeles-lakers": "lakers", "bos": "celtics", "boston-celtics": "celtics"})
+
+    def test_timezone_shift(self):
+        # The same game reported in UTC by one provider and in local time by another.
+        utc = self._index.add(0, _game_model(pytz.utc.localize(datetime.datetime(2023, 10, 2, 2, 30)), ["lal", "bos"]))
+        local = self._index.add(1, _game_model(datetime.datetime(2023, 10, 1, 19, 30), ["boston-celtics", "los-angeles-lakers"]))
+        self.assertEqual(utc, local)
+        self.assertEqual(len(self._index), 1)
+        self.assertEqual(self._index.date(utc), datetime.date(2023, 10, 2))
+
+    def test_series(self):
+        # Consecutive games between the same teams stay apart.
+        dts = [datetime.datetime(2023, 10, 1, 19) + datetime.timedelta(days=x) for x in range(3)]
+        first = [self._index.add(0, _game_model(x, ["lal", "bos"])) for x in dts]
+        second = [self._index.add(1, _game_model(x, ["bos", "lal"])) for x in dts]
+        self.assertListEqual(first, second)
+        self.assertEqual(len(set(first)), 3)
+
+    def test_pop(self):
+        dt = datetime.datetime(2023, 10, 1, 19)
+        bucket_id = self._index.add(0, _game_model(dt, ["lal", "bos"]))
+        game_models = self._index.pop(bucket_id)
+        self.assertEqual(len(game_models), 1)
+        self.assertEqual(len(self._index), 0)
+        self.assertNotEqual(self._index.add(1, _game_model(dt, ["lal", "bos"])), bucket_id)
+
+    def test_no_teams(self):
+        dt = datetime.datetime(2023, 10, 1, 19)
+        first = self._index.add(0, _game_model(dt, []))
+        second = self._index.add(1, _game_model(dt + datetime.timedelta(days=1), []))
+        self.assertNotEqual(first, second)
@@ -0,0 +1,29 @@
+"""Tests for the identity table class."""
+import os
+import tempfile
+import unittest
+
+from sportsball.data.combined.identity_table import IdentityTable
+
+
+class TestIdentityTable(unittest.TestCase):
+
+    def test_resolve(self):
+        identities = IdentityTable("player", identity_map={"x": "mapped"})
+        self.assertEqual(identities.resolve("1", "Johnny Johnson"), "1")
+        self.assertEqual(identities.resolve("1a", "Johnson, Johnny"), "1")
+        self.assertEqual(identities.resolve("1a", "Johnny Johnson"), "1")
+        self.assertEqual(identities.resolve("x", "Johnny Johnson"), "mapped")
+        self.assertEqual(identities.resolve("2", "Jim Jones"), "2")
+        self.assertEqual(len(identities), 2)
+        self.assertEqual(identities.collisions, 1)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "identities.sqlite")
+            identities = IdentityTable("player", path=path)
+            identities.resolve("1", "Johnny Johnson")
+            identities.flush()
+
+            self.assertEqual(IdentityTable("player", path=path).resolve("1a", "Johnny Johnson"), "1")
+            self.assertEqual(IdentityTable("coach", path=path).resolve("1a", "Johnny Johnson"), "1a")
@@ -0,0 +1,112 @@
+"""Tests for the ESPN league model class."""
+import random
+import threading
+import time
+import unittest
+
+import requests_mock
+from scrapesession.scrapesession import ScrapeSession
+from sportsball.data.espn.espn_league_model import ESPNLeagueModel
+from sportsball.data.league import League
+from sportsball.data.worker_settings import PoolSettings, WorkerSettings
+
+_START_URL = "https://example.com/seasons?limit=100"
+
+
+class _TestESPNLeagueModel(ESPNLeagueModel):
+
+    def __init__(self, session, league, max_workers):
+        super().__init__(
+            _START_URL,
+            league,
+            session,
+            workers=WorkerSettings(espn=PoolSettings(max_workers=max_workers)),
+        )
+        self.threads = set()
+        self.sessions = set()
+        self.event_urls = []
+
+    def new_session(self):
+        return ScrapeSession(backend="memory")
+
+    @classmethod
+    def position_validator(cls):
+        return {}
+
+    def _produce_game(self, **kwargs):
+        self.threads.add(threading.get_ident())
+        self.sessions.add(id(self._worker_session()))
+        self.event_urls.append(kwargs["event_item"]["$ref"])
+        time.sleep(random.random() / 100.0)
+        return kwargs["game_number"]
+
+
+class TestESPNLeagueModel(unittest.TestCase):
+
+    def setUp(self):
+        self._session = ScrapeSession(backend="memory")
+
+    def _mock_season(self, m, season_type):
+        m.get(_START_URL + "&page=1", json={"items": [{"$ref": "https://example.com/season"}], "pageCount": 1})
+        m.get("https://example.com/season", json={"types": {"items": [{"$ref": "https://example.com/type"}]}})
+        m.get("https://example.com/type", json=season_type)
+
+    def _mock_weeks(self, m, events):
+        self._mock_season(m, {
+            "name": "Regular Season",
+            "year": 2024,
+            "weeks": {"$ref": "https://example.com/weeks?limit=100"},
+        })
+        m.get("https://example.com/weeks?limit=100&page=1", json={"items": [{"$ref": "https://example.com/week"}], "pageCount": 1})
+        m.get("https://example.com/week", json={"events": {"$ref": "https://example.com/events?limit=100"}})
+        m.get(
+            "https://example.com/events?limit=100&page=1",
+            json={"items": [{"$ref": f"https://example.com/events/{x}"} for x in range(events)], "pageCount": 1},
+        )
+
+    def test_ordered_games(self):
+        league_model = _TestESPNLeagueModel(self._session, League.NFL, 4)
+        with requests_mock.Mocker() as m:
+            self._mock_weeks(m, 32)
+            games = list(league_model.games)
+        self.assertListEqual(games, list(range(32)))
+        self.assertGreater(len(league_model.threads), 1)
+        self.assertNotIn(id(self._session), league_model.sessions)
+
+    def test_sequential_games(self):
+        league_model = _TestESPNLeagueModel(self._session, League.NFL, 1)
+        with requests_mock.Mocker() as m, self.assertLogs(level="INFO") as logs:
+            self._mock_weeks(m, 4)
+            games = list(league_model.games)
+        self.assertListEqual(games, list(range(4)))
+        self.assertTrue(any("ESPN reference cache:" in x for x in logs.output))
+        self.assertSetEqual(league_model.threads, {threading.get_ident()})
+        self.assertSetEqual(league_model.sessions, {id(self._session)})
+
+    def test_scoreboard_games(self):
+        league_model = _TestESPNLeagueModel(self._session, League.NBA, 4)
+        with requests_mock.Mocker() as m:
+            self._mock_season(m, {
+                "$ref": "http://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/seasons/2020/types/2",
+                "name": "Regular Season",
+                "year": 2020,
+                "startDate": "2020-01-01T00:00Z",
+                "endDate": "2020-01-02T00:00Z",
+            })
+            m.get(
+                "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard",
+                json={"leagues": [{"calendar": []}], "events": [{"id": str(x)} for x in range(16)]},
+            )
+            games = list(league_model.games)
+            fetched_urls = [x.url for x in m.request_history]
+        self.assertListEqual(games, list(range(16)))
+        self.assertGreater(len(league_model.threads), 1)
+        # The events are left to the workers rather than fetched one at a time up front.
+        self.assertFalse(any("/events/" in x for x in fetched_urls))
+        self.assertListEqual(
+            sorted(league_model.event_urls),
+            sorted(
+                f"https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/events/{x}?lang=en&region=us"
+                for x in range(16)
+            ),
+        )
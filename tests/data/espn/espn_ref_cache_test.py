@@ -0,0 +1,61 @@
+"""Tests for the ESPN ref cache class."""
+import datetime
+import unittest
+
+import requests_mock
+import requests_cache
+from sportsball.data.espn.espn_ref_cache import ESPNRefCache
+
+
+class TestESPNRefCache(unittest.TestCase):
+
+    def setUp(self):
+        self._session = requests_cache.CachedSession(backend="memory")
+
+    def test_fetch(self):
+        url = "http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/positions/32?lang=en&region=us"
+        cache = ESPNRefCache()
+        with requests_mock.Mocker() as m:
+            m.get(url, json={"abbreviation": "DT"})
+            _, first = cache.fetch(self._session, url, False)
+            _, second = cache.fetch(self._session, url, False)
+            self.assertEqual(m.call_count, 1)
+        self.assertEqual(first["abbreviation"], "DT")
+        first["abbreviation"] = "DE"
+        self.assertEqual(second["abbreviation"], "DT")
+        self.assertEqual(cache.fetch(self._session, url, False)[1]["abbreviation"], "DT")
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_current_ttl(self):
+        url = "http://sports.core.api.espn.com/v2/sports/football/leagues/nfl/positions/32?lang=en&region=us"
+        cache = ESPNRefCache(current_ttl=datetime.timedelta(seconds=-1))
+        with requests_mock.Mocker() as m:
+            m.get(url, json={"abbreviation": "DT"})
+            cache.fetch(self._session, url, True)
+            cache.fetch(self._session, url, True)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 2)
+
+    def test_max_size(self):
+        cache = ESPNRefCache(max_size=1)
+        with requests_mock.Mocker() as m:
+            m.get("http://a.com/1", json={"id": 1})
+            m.get("http://a.com/2", json={"id": 2})
+            cache.fetch(self._session, "http://a.com/1", False)
+            cache.fetch(self._session, "http://a.com/2", False)
+            cache.fetch(self._session, "http://a.com/1", False)
+        self.assertEqual(cache.misses, 3)
+
+    def test_resize(self):
+        cache = ESPNRefCache()
+        with requests_mock.Mocker() as m:
+            m.get("http://a.com/1", json={"id": 1})
+            m.get("http://a.com/2", json={"id": 2})
+            cache.fetch(self._session, "http://a.com/1", False)
+            cache.fetch(self._session, "http://a.com/2", False)
+            cache.resize(1)
+            cache.fetch(self._session, "http://a.com/2", False)
+            cache.fetch(self._session, "http://a.com/1", False)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 3)
@@ -0,0 +1,89 @@
+"""Tests for the frame builder class."""
+import datetime
+import unittest
+
+import pandas as pd
+import pytz
+
+from sportsball.data.frame_builder import FrameBuilder
+
+
+class TestFrameBuilder(unittest.TestCase):
+
+    def test_columns_across_chunks(self):
+        builder = FrameBuilder(chunk_size=2)
+        builder.append({"dt": datetime.datetime(2020, 1, 1), "a": 1})
+        builder.append({"dt": datetime.datetime(2020, 1, 2), "a": 2})
+        builder.append({"dt": datetime.datetime(2020, 1, 3), "a": 2.5, "b": "x"})
+        self.assertSetEqual(builder.columns, {"dt", "a", "b"})
+        df = builder.to_frame()
+        self.assertEqual(len(df), 3)
+        self.assertListEqual(df["a"].tolist(), [1.0, 2.0, 2.5])
+        self.assertTrue(df["b"].isnull().iloc[0])
+        self.assertEqual(df["b"].iloc[2], "x")
+
+    def test_empty_lists_dropped(self):
+        builder = FrameBuilder()
+        builder.append({"a": 1, "teams": []})
+        df = builder.to_frame()
+        self.assertListEqual(df.columns.tolist(), ["a"])
+
+    def test_mixed_timezones(self):
+        builder = FrameBuilder(chunk_size=1)
+        builder.append(
+            {"dt": pytz.timezone("Australia/Melbourne").localize(datetime.datetime(2020, 1, 1, 10))}
+        )
+        builder.append(
+            {"dt": pytz.timezone("US/Eastern").localize(datetime.datetime(2020, 1, 1, 10))}
+        )
+        df = builder.to_frame()
+        self.assertEqual(str(df["dt"].dt.tz), "UTC")
+        self.assertEqual(df["dt"].iloc[1].hour, 15)
+
+    def test_naive_and_aware(self):
+        builder = FrameBuilder(chunk_size=2)
+        builder.append({"end_dt": datetime.datetime(2020, 1, 1, 10)})
+        builder.append({"end_dt": None})
+        builder.append({"end_dt": pytz.timezone("US/Eastern").localize(datetime.datetime(2020, 1, 1, 10))})
+        builder.append({"end_dt": datetime.datetime(2020, 1, 1, 12)})
+        df = builder.to_frame()
+        end_dts = df["end_dt"].dropna().tolist()
+        self.assertListEqual([x.tz is None for x in end_dts], [True, False, True])
+        self.assertListEqual([x.hour for x in end_dts], [10, 10, 12])
+        self.assertEqual(end_dts[1].utcoffset(), datetime.timedelta(hours=-5))
+
+    def test_naive_then_aware(self):
+        builder = FrameBuilder()
+        builder.append({"end_dt": datetime.datetime(2020, 1, 1, 10)})
+        builder.append({"end_dt": pytz.timezone("US/Eastern").localize(datetime.datetime(2020, 1, 1, 10))})
+        df = builder.to_frame()
+        self.assertIsNone(df["end_dt"].iloc[0].tz)
+        self.assertEqual(df["end_dt"].iloc[0].hour, 10)
+        self.assertEqual(df["end_dt"].iloc[1].tz_convert("UTC").hour, 15)
+
+    def test_naive_chunk_then_aware_chunk(self):
+        builder = FrameBuilder(chunk_size=1)
+        builder.append({"end_dt": datetime.datetime(2020, 1, 1, 10)})
+        builder.append({"end_dt": pytz.timezone("US/Eastern").localize(datetime.datetime(2020, 1, 1, 10))})
+        df = builder.to_frame()
+        self.assertIsNone(df["end_dt"].iloc[0].tz)
+        self.assertEqual(df["end_dt"].iloc[0].hour, 10)
+        self.assertEqual(df["end_dt"].iloc[1].tz_convert("UTC").hour, 15)
+
+    def test_conflicting_types(self):
+        builder = FrameBuilder(chunk_size=1)
+        builder.append({"a": 1})
+        builder.append({"a": "b"})
+        with self.assertLogs(level="WARNING") as logs:
+            df = builder.to_frame()
+        self.assertIn("Storing column a as strings", logs.output[0])
+        self.assertListEqual(df["a"].tolist(), ["1", "b"])
+
+    def test_mixed_values(self):
+        builder = FrameBuilder()
+        builder.append({"a": True})
+        with self.assertLogs(level="WARNING") as logs:
+            builder.append({"a": 1})
+            df = builder.to_frame()
+        self.assertIn("Storing column a as strings", logs.output[0])
+        self.assertListEqual(df["a"].tolist(), ["True", "1"])
@@ -0,0 +1,81 @@
+"""Tests for the geocode database class."""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from sportsball.data.google.geocode_database import GEOCODES_SOURCE, GeocodeDatabase, SportsballGeocodeTuple, build_geocodes, ensure_geocodes, normalise_query, read_geocode_source, write_geocodes
+
+
+def _rows(path):
+    connection = sqlite3.connect(path)
+    try:
+        return (
+            connection.execute("SELECT * FROM venues ORDER BY id").fetchall(),
+            connection.execute("SELECT * FROM searches ORDER BY query").fetchall(),
+        )
+    finally:
+        connection.close()
+
+
+class TestGeocodeDatabase(unittest.TestCase):
+
+    def test_built_on_first_use(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, "cache")
+            database = GeocodeDatabase(directory=directory)
+            self.assertFalse(os.path.exists(directory))
+            geocode = database.get(normalise_query("Imperial Arena at Atlantis Resort, Nassau"))
+            self.assertEqual(geocode.city, "Nassau")
+            self.assertIsNone(database.get("Not a venue"))
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_write(self):
+        geocode = SportsballGeocodeTuple(
+            city="Inglewood",
+            state="CA",
+            postal="",
+            lat=33.958333,
+            lng=-118.341667,
+            housenumber="3900",
+            country="USA",
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "geocodes.sqlite")
+            write_geocodes(path, {"The Forum": geocode, "Great Western Forum": geocode})
+            database = GeocodeDatabase(path)
+            self.assertEqual(database.get("The Forum"), geocode)
+            self.assertEqual(database.get("Great Western Forum"), geocode)
+
+    def test_ensure_matches_source(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "geocodes.sqlite")
+            build_geocodes(GEOCODES_SOURCE, path)
+            built_path = ensure_geocodes(GEOCODES_SOURCE, tmpdir)
+            self.assertEqual(_rows(built_path), _rows(path))
+            mtime = os.path.getmtime(built_path)
+            self.assertEqual(ensure_geocodes(GEOCODES_SOURCE, tmpdir), built_path)
+            self.assertEqual(os.path.getmtime(built_path), mtime)
+
+    def test_ensure_rebuilds_on_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, "geocodes.json")
+            with open(GEOCODES_SOURCE, encoding="utf8") as handle:
+                text = handle.read()
+            with open(source, "w", encoding="utf8") as handle:
+                handle.write(text)
+            first_path = ensure_geocodes(source, tmpdir)
+            with open(source, "w", encoding="utf8") as handle:
+                handle.write(text.replace('"Nassau"', '"New Providence"'))
+            second_path = ensure_geocodes(source, tmpdir)
+            self.assertNotEqual(first_path, second_path)
+            geocode = GeocodeDatabase(second_path).get(
+                normalise_query("Imperial Arena at Atlantis Resort, Nassau")
+            )
+            self.assertEqual(geocode.city, "New Providence")
+
+    def test_read_source(self):
+        geocodes = read_geocode_source(GEOCODES_SOURCE)
+        self.assertEqual(len(geocodes), 4006)
+        self.assertEqual(len(set(geocodes.values())), 2559)
+        self.assertEqual(geocodes["FedExForum, Memphis, TN, USA"].city, "Memphis")
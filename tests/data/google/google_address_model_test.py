@@ -3,7 +3,7 @@ import datetime
 import unittest
 
 import requests_cache
-from sportsball.data.google.google_address_model import create_google_address_model
+from sportsball.data.google.google_address_model import _find_timezone, _rounded_timezone, create_google_address_model
 
 
 class TestGoogleAddressModel(unittest.TestCase):
@@ -15,3 +15,11 @@ class TestGoogleAddressModel(unittest.TestCase):
         dt = datetime.datetime(2010, 10, 10, 10, 10, 00)
         address_model = create_google_address_model("Imperial Arena at Atlantis Resort, Nassau", self.session, dt)
         self.assertEqual(address_model.city, "Nassau")
+
+    def test_timezone_cached(self):
+        dt = datetime.datetime(2010, 10, 10, 10, 10, 00)
+        address_model = create_google_address_model("Imperial Arena at Atlantis Resort, Nassau", self.session, dt)
+        hits = _rounded_timezone.cache_info().hits
+        self.assertEqual(_find_timezone(address_model.latitude, address_model.longitude), address_model.timezone)
+        self.assertEqual(_rounded_timezone.cache_info().hits, hits + 1)
+        self.assertEqual(address_model.timezone, "America/Nassau")
@@ -0,0 +1,166 @@
+"""Tests for the league model class."""
+import datetime
+import unittest
+from unittest import mock
+
+import pandas as pd
+import requests_cache
+import requests_mock
+
+from sportsball.data.frame_builder import FrameBuilder
+from sportsball.data.game_model import GameModel, VERSION
+from sportsball.data.league import League
+from sportsball.data import league_model
+from sportsball.data.league_model import LeagueModel, _normalize_tz, incremental_dt, merge_frames
+from sportsball.data.rate_limiter import HostRateLimiter
+
+from tests.fixtures.league_model import multi_season_frame, row_wise_normalize_tz
+
+
+class _TestLeagueModel(LeagueModel):
+
+    @property
+    def games(self):
+        for i in range(7):
+            yield GameModel(
+                dt=datetime.datetime(2010, 1, 1 + i, 10, 10, 0),
+                week=None,
+                game_number=i,
+                venue=None,
+                teams=[],
+                end_dt=None,
+                attendance=None,
+                league=str(League.NBA),
+                year=None,
+                season_type=None,
+                postponed=True,
+                play_off=None,
+                distance=None,
+                dividends=[],
+                pot=None,
+                umpires=[],
+                version=VERSION,
+            )
+
+
+class TestLeagueModel(unittest.TestCase):
+
+    def test_normalize_tz(self):
+        df = pd.DataFrame({
+            "venue/address/timezone": ["Australia/Melbourne", "America/New_York", None, "Australia/Melbourne"],
+            "dt": pd.to_datetime([
+                datetime.datetime(2020, 1, 1, 19, 30),
+                datetime.datetime(2020, 1, 2, 19, 30),
+                datetime.datetime(2020, 1, 3, 19, 30),
+                datetime.datetime(2020, 1, 4, 19, 30),
+            ]),
+            "end_dt": pd.to_datetime([
+                datetime.datetime(2020, 1, 1, 10, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2020, 1, 2, 10, 0, tzinfo=datetime.timezone.utc),
+                datetime.datetime(2020, 1, 3, 10, 0, tzinfo=datetime.timezone.utc),
+                None,
+            ]),
+        })
+        df = _normalize_tz(df)
+        self.assertEqual(len(df), 3)
+        dts = df["dt"].tolist()
+        self.assertEqual(str(dts[0].tz), "Australia/Melbourne")
+        self.assertEqual(dts[0].hour, 19)
+        self.assertEqual(str(dts[1].tz), "America/New_York")
+        self.assertEqual(dts[1].hour, 19)
+        end_dts = df["end_dt"].tolist()
+        self.assertEqual(str(end_dts[0].tz), "Australia/Melbourne")
+        self.assertEqual(end_dts[0].hour, 21)
+        self.assertEqual(end_dts[1].hour, 5)
+        self.assertTrue(pd.isnull(end_dts[2]))
+
+    def test_normalize_tz_naive_and_aware(self):
+        builder = FrameBuilder()
+        builder.append({
+            "venue/address/timezone": "America/New_York",
+            "dt": datetime.datetime(2020, 1, 1, 19),
+        })
+        builder.append({
+            "venue/address/timezone": "America/New_York",
+            "dt": datetime.datetime(2020, 1, 2, 19, tzinfo=datetime.timezone.utc),
+        })
+        df = _normalize_tz(builder.to_frame())
+        dts = df["dt"].tolist()
+        self.assertEqual(str(dts[0].tz), "America/New_York")
+        self.assertEqual(dts[0].hour, 19)
+        self.assertEqual(dts[1].hour, 14)
+
+    def test_normalize_tz_object_columns(self):
+        df = pd.DataFrame({
+            "venue/address/timezone": ["America/New_York", "Australia/Melbourne", "America/New_York"],
+            "dt": pd.to_datetime([
+                datetime.datetime(2020, 1, 1, 19),
+                datetime.datetime(2020, 1, 2, 19),
+                datetime.datetime(2020, 1, 3, 19),
+            ]),
+            "kickoff": pd.Series([
+                pd.Timestamp("2020-01-01 19:00"),
+                pd.Timestamp("2020-01-02 08:00", tz="UTC"),
+                pd.Timestamp("2020-01-03 19:00", tz="Europe/London"),
+            ], dtype=object),
+            "name": ["a", "b", None],
+        })
+        df = _normalize_tz(df)
+        kickoffs = df["kickoff"].tolist()
+        self.assertEqual(str(kickoffs[0].tz), "America/New_York")
+        self.assertEqual(kickoffs[0].hour, 19)
+        self.assertEqual(str(kickoffs[1].tz), "Australia/Melbourne")
+        self.assertEqual(kickoffs[1].hour, 19)
+        self.assertEqual(kickoffs[2].hour, 14)
+        self.assertListEqual(df["name"].tolist()[:2], ["a", "b"])
+
+    def test_normalize_tz_no_timezone(self):
+        df = pd.DataFrame({"dt": pd.to_datetime([datetime.datetime(2020, 1, 1)])})
+        self.assertIs(_normalize_tz(df), df)
+
+    def test_normalize_tz_row_wise(self):
+        df = multi_season_frame(200, 3)
+        expected_df = row_wise_normalize_tz(df.copy())
+        normalized_df = _normalize_tz(df.copy())
+        for column in df.columns:
+            self.assertListEqual([str(x) for x in normalized_df[column]], [str(x) for x in expected_df[column]], column)
+
+    def test_to_frame(self):
+        df = _TestLeagueModel(League.NBA, None).to_frame()
+        self.assertEqual(len(df), 7)
+        self.assertListEqual(df["game_number"].tolist(), list(range(7)))
+        self.assertIn("version", df.attrs["categorical"])
+
+    def test_to_frames(self):
+        dfs = list(_TestLeagueModel(League.NBA, None).to_frames(chunk_size=3))
+        self.assertListEqual([len(x) for x in dfs], [3, 3, 1])
+        self.assertListEqual(dfs[-1]["index"].tolist(), [6])
+
+    def test_incremental(self):
+        existing_df = _TestLeagueModel(League.NBA, None).to_frame()
+        existing_df = existing_df[existing_df["game_number"] < 5]
+        self.assertEqual(
+            incremental_dt(existing_df, datetime.timedelta(days=2)),
+            datetime.datetime(2010, 1, 3, 10, 10, 0),
+        )
+        league_model.INCREMENTAL_DT = incremental_dt(existing_df, datetime.timedelta(days=2))
+        try:
+            df = _TestLeagueModel(League.NBA, None).to_frame()
+        finally:
+            league_model.INCREMENTAL_DT = None
+        self.assertListEqual(df["game_number"].tolist(), [2, 3, 4, 5, 6])
+        merged_df = merge_frames(existing_df, df)
+        self.assertListEqual(merged_df["game_number"].tolist(), list(range(7)))
+        self.assertListEqual(merged_df["index"].tolist(), list(range(7)))
+
+    def test_worker_pool_throttles_session(self):
+        session = requests_cache.CachedSession(backend="memory")
+        league = _TestLeagueModel(League.NBA, session)
+        with requests_mock.Mocker() as m, mock.patch.object(HostRateLimiter, "wait") as wait:
+            m.get("http://a.com/1", json={"id": 1})
+            m.get("http://a.com/2", json={"id": 2})
+            with league._worker_pool(2, 1.0):
+                session.get("http://a.com/1")
+            self.assertEqual(wait.call_count, 1)
+            session.get("http://a.com/2")
+            self.assertEqual(wait.call_count, 1)
@@ -4,6 +4,7 @@ import unittest
 
 import requests_mock
 from bs4 import BeautifulSoup
+from sportsball.data.oddsportal import decrypt
 from sportsball.data.oddsportal.decrypt import fetch_data
 from scrapesession.scrapesession import ScrapeSession
 
@@ -13,6 +14,8 @@ class TestDecrypt(unittest.TestCase):
     def setUp(self):
         self.session = ScrapeSession(backend="memory")
         self.dir = os.path.dirname(__file__)
+        decrypt._DECRYPTION_DATA.clear()
+        decrypt._AES_KEYS.clear()
 
     def test_decrypt(self):
         with self.session.wayback_disabled():
@@ -27,3 +30,37 @@ class TestDecrypt(unittest.TestCase):
                     m.get("https://www.oddsportal.com/match-event/1-18-SnAeelt9-3-1-yj021.dat?geo=AE&lang=en", content=f.read())
                 data = fetch_data(url, self.session, referer_url, soup)
                 self.assertTrue(data)
+
+    def _mock_urls(self, m):
+        app_url = "https://www.oddsportal.com/res/public/js/build/app.js?v=250213122553"
+        with open(os.path.join(self.dir, "app_250213122553.js"), "rb") as f:
+            app_matcher = m.get(app_url, content=f.read())
+        with open(os.path.join(self.dir, "1-18-SnAeelt9-3-1-yj021.dat"), "rb") as f:
+            m.get("https://www.oddsportal.com/match-event/1-18-SnAeelt9-3-1-yj021.dat?geo=AE&lang=en", content=f.read())
+        with open(os.path.join(self.dir, "sydney-swans-collingwood-magpies-SnAeelt9.html"), "rb") as f:
+            soup = BeautifulSoup(f.read(), "lxml")
+        return app_url, app_matcher, soup
+
+    def test_decrypt_reuses_decryption_data(self):
+        with self.session.cache_disabled(), self.session.wayback_disabled():
+            referer_url = "https://www.oddsportal.com/aussie-rules/australia/afl-2022/sydney-swans-collingwood-magpies-SnAeelt9/"
+            url = "https://www.oddsportal.com/match-event/1-18-SnAeelt9-3-1-yj021.dat?geo=AE&lang=en"
+            with requests_mock.Mocker() as m:
+                _, app_matcher, soup = self._mock_urls(m)
+                first = fetch_data(url, self.session, referer_url, soup)
+                second = fetch_data(url, self.session, referer_url, soup)
+                self.assertEqual(first, second)
+                self.assertEqual(app_matcher.call_count, 1)
+                self.assertEqual(len(decrypt._AES_KEYS), 1)
+
+    def test_decrypt_invalidates_stale_data(self):
+        with self.session.cache_disabled(), self.session.wayback_disabled():
+            referer_url = "https://www.oddsportal.com/aussie-rules/australia/afl-2022/sydney-swans-collingwood-magpies-SnAeelt9/"
+            url = "https://www.oddsportal.com/match-event/1-18-SnAeelt9-3-1-yj021.dat?geo=AE&lang=en"
+            with requests_mock.Mocker() as m:
+                app_url, app_matcher, soup = self._mock_urls(m)
+                decrypt._DECRYPTION_DATA[app_url] = (b"stale", b"stale")
+                data = fetch_data(url, self.session, referer_url, soup)
+                self.assertTrue(data)
+                self.assertEqual(app_matcher.call_count, 1)
+                self.assertNotIn((b"stale", b"stale"), decrypt._AES_KEYS)
@@ -1,9 +1,19 @@
 """Tests for the oddsportal league model class."""
+import datetime
 import os
+import random
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
 
 import requests_cache
-from sportsball.data.oddsportal.oddsportal_league_model import _find_ids
+import tqdm
+from bs4 import BeautifulSoup
+from sportsball.data.league import League
+from sportsball.data.oddsportal.oddsportal_league_model import OddsPortalLeagueModel, _find_ids
+from sportsball.data.worker_settings import PoolSettings, WorkerSettings
 
 
 class TestOddsPortalLeagueModel(unittest.TestCase):
@@ -17,3 +27,80 @@ class TestOddsPortalLeagueModel(unittest.TestCase):
             sports_id, oddsportal_id = _find_ids(handle.read())
             self.assertEqual(sports_id, "18")
             self.assertEqual(oddsportal_id, "6y3HOkJ7")
+
+    def test_crawl_ordered_games(self):
+        with open(os.path.join(self.dir, "results.html"), "r") as handle:
+            response = SimpleNamespace(text=handle.read())
+        pages = {
+            page: {
+                "total": 12,
+                "pagination": {"pages": 4},
+                "rows": [{"url": f"/game-{(page - 1) * 3 + x}/"} for x in range(3)],
+            }
+            for page in range(1, 5)
+        }
+        start_dt = datetime.datetime(2024, 1, 1)
+
+        def _fetch_data(url, session, referer_url, soup):
+            time.sleep(random.random() / 100.0)
+            return {"d": pages[int(url.split("/page/")[1].split("/")[0])]}
+
+        def _create_game(session, url, league, use_cache):
+            time.sleep(random.random() / 100.0)
+            number = int(url.split("game-")[1].rstrip("/"))
+            return SimpleNamespace(dt=start_dt - datetime.timedelta(days=number))
+
+        league_model = OddsPortalLeagueModel(
+            League.AFL, self.session, workers=WorkerSettings(oddsportal=PoolSettings(max_workers=4))
+        )
+        with mock.patch(
+            "sportsball.data.oddsportal.oddsportal_league_model.fetch_data",
+            side_effect=_fetch_data,
+        ), mock.patch(
+            "sportsball.data.oddsportal.oddsportal_league_model.create_oddsportal_game_model",
+            side_effect=_create_game,
+        ), ThreadPoolExecutor(4) as executor, tqdm.tqdm(disable=True) as pbar:
+            games = list(
+                league_model._crawl_results_pages(
+                    executor,
+                    4,
+                    "https://www.oddsportal.com/aussie-rules/australia/afl/results/",
+                    None,
+                    pbar,
+                    response,
+                )
+            )
+        self.assertListEqual(
+            [x.dt for x in games],
+            [start_dt - datetime.timedelta(days=x) for x in range(12)],
+        )
+
+    def test_crawl_stops_at_incremental_season(self):
+        root_url = "https://www.oddsportal.com/aussie-rules/australia/afl/results/"
+        season_urls = [
+            root_url,
+            "https://www.oddsportal.com/aussie-rules/australia/afl-2023/results/",
+            "https://www.oddsportal.com/aussie-rules/australia/afl-2022/results/",
+        ]
+        options = "".join(f"<option value='{x}'></option>" for x in season_urls)
+        fetched_urls = []
+
+        def _fetch_results(url):
+            fetched_urls.append(url)
+            return SimpleNamespace(text=""), BeautifulSoup(f"<select>{options}</select>", "lxml")
+
+        def _crawl_results_pages(executor, window, url, soup, pbar, response):
+            yield url
+            return url == season_urls[1]
+
+        league_model = OddsPortalLeagueModel(
+            League.AFL, self.session, workers=WorkerSettings(oddsportal=PoolSettings(max_workers=4))
+        )
+        with mock.patch.object(
+            league_model, "_fetch_results", side_effect=_fetch_results
+        ), mock.patch.object(
+            league_model, "_crawl_results_pages", side_effect=_crawl_results_pages
+        ):
+            games = list(league_model._crawl_previous(None, 4, None))
+        self.assertListEqual(games, season_urls[:2])
+        self.assertListEqual(fetched_urls, season_urls[:2])
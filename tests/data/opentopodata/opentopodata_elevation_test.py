@@ -0,0 +1,121 @@
+"""Tests for the opentopodata elevation functions."""
+import os
+import tempfile
+import threading
+import unittest
+
+import requests_cache
+import requests_mock
+from sportsball.data.opentopodata.opentopodata_elevation import ElevationBatcher, ElevationStore, find_elevation
+
+
+def _elevations(request, context):
+    locations = request.qs["locations"][0].split("|")
+    return {"results": [{"elevation": float(x.split(",")[0])} for x in locations]}
+
+
+class TestOpenTopoDataElevation(unittest.TestCase):
+
+    def setUp(self):
+        self.session = requests_cache.CachedSession(backend="memory")
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "elevations.sqlite")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_rounded(self):
+        batcher = ElevationBatcher(ElevationStore(self.path))
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m",
+                json={"results": [{"elevation": 10.0}]},
+            )
+            self.assertEqual(find_elevation(self.session, -33.89153, 151.22484, batcher=batcher), 10.0)
+            self.assertEqual(m.last_request.qs["locations"], ["-33.8915,151.2248"])
+            self.assertEqual(find_elevation(self.session, -33.891501, 151.22484, batcher=batcher), 10.0)
+            self.assertEqual(m.call_count, 1)
+
+    def test_persisted(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m",
+                json={"results": [{"elevation": 10.0}]},
+            )
+            find_elevation(self.session, 1.0, 2.0, batcher=ElevationBatcher(ElevationStore(self.path)))
+            self.assertEqual(
+                find_elevation(self.session, 1.0, 2.0, batcher=ElevationBatcher(ElevationStore(self.path))),
+                10.0,
+            )
+            self.assertEqual(m.call_count, 1)
+
+    def test_missing(self):
+        batcher = ElevationBatcher(ElevationStore(self.path))
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m",
+                json={"results": [{"elevation": None}]},
+            )
+            self.assertIsNone(find_elevation(self.session, 1.0, 2.0, batcher=batcher))
+            self.assertIsNone(find_elevation(self.session, 1.0, 2.0, batcher=batcher))
+            self.assertEqual(m.call_count, 1)
+
+    def test_batched(self):
+        batcher = ElevationBatcher(ElevationStore(self.path), batch_size=3)
+        coordinates = [(float(x), 2.0) for x in range(7)]
+        with requests_mock.Mocker() as m:
+            m.get("https://api.opentopodata.org/v1/aster30m", json=_elevations)
+            batcher.find(self.session, coordinates[:2])
+            elevations = batcher.find(self.session, coordinates)
+            self.assertEqual(m.call_count, 3)
+            self.assertEqual(m.last_request.qs["locations"], ["5.0,2.0|6.0,2.0"])
+        self.assertDictEqual(elevations, {x: x[0] for x in coordinates})
+
+    def test_concurrent(self):
+        batcher = ElevationBatcher(ElevationStore(self.path))
+        started = threading.Event()
+        release = threading.Event()
+
+        def _blocking_elevations(request, context):
+            started.set()
+            release.wait()
+            return _elevations(request, context)
+
+        results = {}
+
+        def _find(latitude):
+            session = requests_cache.CachedSession(backend="memory")
+            results[latitude] = find_elevation(session, latitude, 2.0, batcher=batcher)
+
+        with requests_mock.Mocker() as m:
+            m.get("https://api.opentopodata.org/v1/aster30m", json=_blocking_elevations)
+            first = threading.Thread(target=_find, args=(0.0,))
+            first.start()
+            started.wait()
+            # These arrive while the first request is in flight, so they share the next one.
+            threads = [threading.Thread(target=_find, args=(float(x),)) for x in range(1, 6)]
+            for thread in threads:
+                thread.start()
+            while len(batcher._pending) < 6:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in [first, *threads]:
+                thread.join()
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(
+                sorted(m.last_request.qs["locations"][0].split("|")),
+                [f"{float(x)},2.0" for x in range(1, 6)],
+            )
+        self.assertDictEqual(results, {float(x): float(x) for x in range(6)})
+
+    def test_failed(self):
+        batcher = ElevationBatcher(ElevationStore(self.path))
+        with requests_mock.Mocker() as m:
+            m.get("https://api.opentopodata.org/v1/aster30m", status_code=500)
+            with self.assertRaises(Exception):
+                find_elevation(self.session, 1.0, 2.0, batcher=batcher)
+            m.get(
+                "https://api.opentopodata.org/v1/aster30m",
+                json={"results": [{"elevation": 10.0}]},
+            )
+            self.assertEqual(find_elevation(self.session, 1.0, 2.0, batcher=batcher), 10.0)
@@ -0,0 +1,47 @@
+"""Tests for the rate limiter class."""
+import unittest
+from unittest import mock
+
+import requests_mock
+import requests_cache
+from sportsball.data.rate_limiter import HostRateLimiter
+
+
+class TestHostRateLimiter(unittest.TestCase):
+
+    def test_wait(self):
+        rate_limiter = HostRateLimiter(20.0)
+        with mock.patch("time.monotonic", return_value=100.0), mock.patch(
+            "time.sleep"
+        ) as sleep:
+            for _ in range(3):
+                rate_limiter.wait("http://a.com/1")
+            rate_limiter.wait("http://b.com/1")
+        # The first request to each host goes straight away on a stopped clock.
+        self.assertEqual(sleep.call_count, 2)
+        self.assertAlmostEqual(sleep.call_args_list[0].args[0], 0.05)
+        self.assertAlmostEqual(sleep.call_args_list[1].args[0], 0.1)
+
+    def test_throttle_skips_cached(self):
+        session = requests_cache.CachedSession(backend="memory")
+        rate_limiter = HostRateLimiter(1.0)
+        rate_limiter.throttle(session)
+        with requests_mock.Mocker() as m, mock.patch.object(
+            rate_limiter, "wait", wraps=rate_limiter.wait
+        ) as wait:
+            m.get("http://a.com/1", json={"id": 1})
+            session.get("http://a.com/1")
+            session.get("http://a.com/1")
+            session.get("http://a.com/1")
+        self.assertEqual(wait.call_count, 1)
+
+    def test_release(self):
+        session = requests_cache.CachedSession(backend="memory")
+        rate_limiter = HostRateLimiter(1.0)
+        rate_limiter.throttle(session)
+        rate_limiter.release(session)
+        with requests_mock.Mocker() as m, mock.patch.object(rate_limiter, "wait") as wait:
+            m.get("http://a.com/1", json={"id": 1})
+            session.get("http://a.com/1")
+        self.assertEqual(wait.call_count, 0)
+        self.assertListEqual(session.hooks["response"], [])
@@ -0,0 +1,23 @@
+"""Tests for the schema index functions."""
+import unittest
+
+from sportsball.data.field_type import FieldType
+from sportsball.data.game_model import GameModel
+from sportsball.data.schema_index import classify_columns, field_types
+
+
+class TestSchemaIndex(unittest.TestCase):
+
+    def test_field_types(self):
+        self.assertSetEqual(set(field_types(GameModel, "teams/3/points")), {FieldType.POINTS})
+        self.assertSetEqual(set(field_types(GameModel, "teams/3/name")), {FieldType.TEXT})
+        self.assertSetEqual(set(field_types(GameModel, "venue/address/timezone")), {FieldType.CATEGORICAL})
+        self.assertSetEqual(set(field_types(GameModel, "dt")), set())
+        self.assertSetEqual(set(field_types(GameModel, "teams/3/unknown")), set())
+
+    def test_classify_columns(self):
+        classified = classify_columns(GameModel, ["dt", "version", "end_dt", "teams/0/points", "teams/1/points"])
+        self.assertSetEqual(classified[FieldType.CATEGORICAL], {"version"})
+        self.assertSetEqual(classified[FieldType.LOOKAHEAD], {"end_dt"})
+        self.assertSetEqual(classified[FieldType.POINTS], {"teams/0/points", "teams/1/points"})
+        self.assertSetEqual(classified[FieldType.ODDS], set())
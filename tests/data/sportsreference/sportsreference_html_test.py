@@ -0,0 +1,60 @@
+"""Tests for the sportsreference html functions."""
+import io
+import os
+import unittest
+
+import pandas as pd
+from bs4 import BeautifulSoup
+from sportsball.data.sportsreference.sportsreference_html import find, find_all, get_text, parse_html, read_tables, tag_string
+
+
+class TestSportsReferenceHTML(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = os.path.dirname(__file__)
+        with open(os.path.join(self.dir, "201604130MIL.html")) as handle:
+            self.text = handle.read()
+
+    def test_read_tables(self):
+        expected_dfs = pd.read_html(io.StringIO(self.text))
+        dfs = read_tables(parse_html(self.text))
+        self.assertEqual(len(dfs), len(expected_dfs))
+        for df, expected_df in zip(dfs, expected_dfs):
+            pd.testing.assert_frame_equal(df, expected_df)
+
+    def test_read_tables_repeated_columns(self):
+        text = (
+            "<html><body><table><thead><tr><th colspan='4'>Games</th></tr>"
+            "<tr><th>Team</th><th>Score</th><th>Team</th><th>Score</th></tr></thead>"
+            "<tbody><tr><td>A</td><td>1,200</td><td>B</td><td>3</td></tr></tbody></table>"
+            "<table><tr><th>Team</th><th></th><th>Team</th></tr><tr><td>A</td><td>NA</td><td>true</td></tr></table>"
+            "</body></html>"
+        )
+        expected_dfs = pd.read_html(io.StringIO(text))
+        dfs = read_tables(parse_html(text))
+        self.assertEqual(len(dfs), len(expected_dfs))
+        for df, expected_df in zip(dfs, expected_dfs):
+            pd.testing.assert_frame_equal(df, expected_df)
+
+    def test_get_text(self):
+        with open(os.path.join(self.dir, "202501230ATL.html")) as handle:
+            text = handle.read()
+        tree = parse_html(text)
+        soup = BeautifulSoup(text, "lxml")
+        self.assertListEqual(
+            get_text(find(tree, "div", class_name="scorebox_meta")).split(),
+            soup.find("div", class_="scorebox_meta").get_text().split(),
+        )
+        self.assertListEqual(
+            [get_text(x) for x in find_all(tree, "div", class_name="score")],
+            [x.get_text() for x in soup.find_all("div", class_="score")],
+        )
+        self.assertListEqual(get_text(tree).split(), soup.get_text().split())
+
+    def test_tag_string(self):
+        tree = parse_html("<html><body><a href='a'><b>Bucks</b></a><a href='b'>Bucks <b>1</b></a></body></html>")
+        self.assertListEqual([tag_string(x) for x in find_all(tree, "a")], ["Bucks", None])
+
+    def test_parse_empty(self):
+        self.assertEqual(parse_html("<!DOCTYPE html>").tag, "html")
+
@@ -1,8 +1,15 @@
 """Tests for the sportsreference league model class."""
+import random
+import threading
+import time
+import types
 import unittest
 import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 import requests_cache
+import tqdm
 from sportsball.data.sportsreference.sportsreference_league_model import SportsReferenceLeagueModel, _find_game_urls
 from sportsball.data.league import League
 from bs4 import BeautifulSoup
@@ -189,3 +196,30 @@ class TestSportsReferenceLeagueModel(unittest.TestCase):
                 'https://www.baseball-reference.com/boxes/TEX/TEX202108180.shtml',
                 'https://www.baseball-reference.com/boxes/WAS/WAS202108180.shtml'
             ])
+
+    def test_ordered_games(self):
+        url = "https://www.sports-reference.com/cbb/boxscores/index.cgi?month=11&day=22&year=2022"
+        threads = set()
+
+        def _create_game_model(session, game_url, league, position_validator):
+            threads.add(threading.get_ident())
+            time.sleep(random.random() / 100.0)
+            return types.SimpleNamespace(url=game_url, year=2022, season_type=None, dt=None)
+
+        with open(os.path.join(self.dir, "22_11_2022.html")) as handle:
+            soup = BeautifulSoup(handle.read(), "lxml")
+        game_urls = _find_game_urls(soup, url)
+        with mock.patch(
+            "sportsball.data.sportsreference.sportsreference_league_model.create_sportsreference_game_model",
+            side_effect=_create_game_model,
+        ), mock.patch.object(SportsReferenceLeagueModel, "position_validator", return_value={}):
+            with ThreadPoolExecutor(4) as executor, tqdm.tqdm(disable=True) as pbar:
+                self.league_model._executor = executor
+                self.league_model._local = threading.local()
+                try:
+                    games = list(self.league_model._produce_games(soup, pbar, url))
+                finally:
+                    self.league_model._executor = None
+                    self.league_model._local = None
+        self.assertListEqual([x.url for x in games], game_urls)
+        self.assertGreater(len(threads), 1)
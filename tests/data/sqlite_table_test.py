@@ -0,0 +1,38 @@
+"""Tests for the SQLite table class."""
+import os
+import tempfile
+import unittest
+
+from sportsball.data.sqlite_table import SQLiteTable
+
+
+class TestSQLiteTable(unittest.TestCase):
+
+    def test_update(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "table.sqlite")
+            table = SQLiteTable(path, "entries", "a")
+            table.update([("x", 1.5), ("y", None)])
+            table.update([("x", 2.5)])
+            SQLiteTable(path, "entries", "b").update([("x", "other")])
+            self.assertEqual(table.get("x"), 2.5)
+            self.assertIsNone(table.get("z"))
+            self.assertListEqual(sorted(SQLiteTable(path, "entries", "a").items()), [("x", 2.5), ("y", None)])
+
+    def test_get_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "table.sqlite")
+            table = SQLiteTable(path, "entries", "a")
+            table.update([(str(x), x) for x in range(1200)] + [("none", None)])
+            SQLiteTable(path, "entries", "b").update([("other", 1)])
+            keys = [str(x) for x in range(0, 1500, 3)] + ["none", "other"]
+            found = table.get_many(keys)
+            self.assertDictEqual(found, {**{str(x): x for x in range(0, 1200, 3)}, "none": None})
+
+    def test_read_only(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "table.sqlite")
+            SQLiteTable(path, "entries", "a").update([("x", 1.5)])
+            table = SQLiteTable(path, "entries", "a", read_only=True)
+            table.update([("y", 2.5)])
+            self.assertListEqual(table.items(), [("x", 1.5)])
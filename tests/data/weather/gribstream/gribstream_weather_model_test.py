@@ -0,0 +1,115 @@
+"""Tests for the gribstream weather model class."""
+import datetime
+import gzip
+import json
+import os
+import threading
+import unittest
+from unittest import mock
+
+import pytz
+import requests_cache
+import requests_mock
+from sportsball.data.weather.gribstream.gribstream_weather_model import GribstreamBatcher, _fetch_rows, create_gribstream_weather_model
+
+_CSV = """forecasted_at,forecasted_time,lat,lon,TMP|2 m above ground|,DPT|2 m above ground|,RH|2 m above ground|
+2023-10-09T12:00:00Z,2023-10-10T12:00:00Z,41.86232,-87.61672,282.0,276.0,72.0
+2023-10-09T13:00:00Z,2023-10-10T13:00:00Z,41.86232,-87.61672,283.0,276.0,73.0
+"""
+
+
+def _payload(request):
+    return json.loads(gzip.decompress(request.body))
+
+
+def _named_csv(request, context):
+    # Each coordinate's temperature is its latitude, at every hour of the window.
+    payload = _payload(request)
+    start = datetime.datetime.strptime(payload["forecastedFrom"], "%Y-%m-%dT%H:%M:%SZ")
+    end = datetime.datetime.strptime(payload["forecastedUntil"], "%Y-%m-%dT%H:%M:%SZ")
+    lines = ["forecasted_at,forecasted_time,lat,lon,name,TMP|2 m above ground|,DPT|2 m above ground|,RH|2 m above ground|"]
+    hour = start.replace(minute=0)
+    while hour <= end + datetime.timedelta(hours=1):
+        for coordinate in payload["coordinates"]:
+            lines.append(
+                f"{hour - datetime.timedelta(hours=12):%Y-%m-%dT%H:%M:%SZ},{hour:%Y-%m-%dT%H:%M:%SZ},"
+                f"{coordinate['lat']},{coordinate['lon']},{coordinate['name']},"
+                f"{coordinate['lat']},0.0,{hour.hour}"
+            )
+        hour += datetime.timedelta(hours=1)
+    return "\n".join(lines)
+
+
+class TestGribstreamWeatherModel(unittest.TestCase):
+
+    def setUp(self):
+        self.session = requests_cache.CachedSession(backend="memory")
+
+    def test_nearest_row(self):
+        dt = pytz.utc.localize(datetime.datetime(2023, 10, 10, 12, 40))
+        with requests_mock.Mocker() as m, mock.patch.dict(os.environ, {"GRIBSTREAM_API_KEY": "key"}):
+            m.post("https://gribstream.com/api/v2/nbm/forecasts", text=_CSV)
+            weather_model = create_gribstream_weather_model(self.session, 41.8623, -87.6167, dt)
+        self.assertEqual(weather_model.temperature, 283.0)
+        self.assertEqual(weather_model.relative_humidity, 73.0)
+
+    def test_batched(self):
+        batcher = GribstreamBatcher()
+        started = threading.Event()
+        release = threading.Event()
+
+        def _blocking_csv(request, context):
+            started.set()
+            release.wait()
+            return _named_csv(request, context)
+
+        lookups = [
+            (1.0, 2.0, datetime.datetime(2023, 10, 10, 19, 10)),
+            (3.0, 4.0, datetime.datetime(2023, 10, 10, 13, 0)),
+            (5.0, 6.0, datetime.datetime(2023, 10, 10, 22, 30)),
+            (3.0, 4.0, datetime.datetime(2023, 10, 10, 20, 0)),
+            (7.0, 8.0, datetime.datetime(2023, 10, 11, 12, 0)),
+        ]
+        results = {}
+
+        def _find(latitude, longitude, dt):
+            session = requests_cache.CachedSession(backend="memory")
+            rows = batcher.find(session, latitude, longitude, pytz.utc.localize(dt))
+            results[(latitude, dt)] = rows
+
+        with requests_mock.Mocker() as m:
+            m.post("https://gribstream.com/api/v2/nbm/forecasts", text=_blocking_csv)
+            first = threading.Thread(target=_find, args=(0.0, 0.0, datetime.datetime(2023, 10, 10, 12, 0)))
+            first.start()
+            started.wait()
+            # These arrive while the first request is in flight, so they share the next ones.
+            threads = [threading.Thread(target=_find, args=x) for x in lookups]
+            for thread in threads:
+                thread.start()
+            while len(batcher._pending) < len(lookups) + 1:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in [first, *threads]:
+                thread.join()
+            payloads = [_payload(x) for x in m.request_history]
+        self.assertEqual(len(payloads), 3)
+        self.assertListEqual(
+            [(x["lat"], x["lon"]) for x in payloads[1]["coordinates"]],
+            [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)],
+        )
+        self.assertEqual(payloads[1]["forecastedFrom"], "2023-10-10T13:00:00Z")
+        self.assertEqual(payloads[1]["forecastedUntil"], "2023-10-10T22:30:00Z")
+        self.assertListEqual([(x["lat"], x["lon"]) for x in payloads[2]["coordinates"]], [(7.0, 8.0)])
+        for (latitude, dt), rows in results.items():
+            self.assertSetEqual(set(rows["TMP|2 m above ground|"]), {latitude})
+            self.assertIn(pytz.utc.localize(dt.replace(minute=0)), set(rows["forecasted_time"]))
+
+    def test_unnamed_rows(self):
+        dt = pytz.utc.localize(datetime.datetime(2023, 10, 10, 12, 40))
+        with requests_mock.Mocker() as m:
+            m.post("https://gribstream.com/api/v2/nbm/forecasts", text=_CSV)
+            rows = _fetch_rows(self.session, [(dt, 41.8623, -87.6167), (dt, 1.0, 2.0)])
+            payloads = [_payload(x) for x in m.request_history]
+        # A response that does not name its rows is fetched again one venue at a time.
+        self.assertListEqual([len(x["coordinates"]) for x in payloads], [2, 1, 1])
+        self.assertSetEqual(set(rows), {(41.8623, -87.6167), (1.0, 2.0)})
@@ -0,0 +1,71 @@
+"""Tests for the openmeteo weather model class."""
+import datetime
+import re
+import unittest
+from unittest import mock
+
+import numpy as np
+import openmeteo_requests
+import requests_cache
+import requests_mock
+from openmeteo_sdk.WeatherApiResponse import WeatherApiResponse
+from sportsball.data.weather.openmeteo.openmeteo_weather_model import _BLOCKS, _DAILY_VARIABLES, _HOURLY_VARIABLES, _block_dates, _find_block_weather, _parse_openmeteo
+
+from tests.fixtures.openmeteo_weather_model import build_openmeteo_response, pandas_weather
+
+
+class TestOpenMeteoWeatherModel(unittest.TestCase):
+
+    def setUp(self):
+        self.session = requests_cache.CachedSession(backend="memory")
+        _BLOCKS.clear()
+        self.data = build_openmeteo_response(datetime.date(2023, 8, 26), datetime.date(2023, 11, 26))
+        self.dts = [
+            datetime.datetime(2023, 8, 27) + datetime.timedelta(minutes=397 * x)
+            for x in range(300)
+        ]
+
+    def test_parse(self):
+        tz = "America/Chicago"
+        for dt in self.dts:
+            responses = [WeatherApiResponse.GetRootAs(self.data, 4)]
+            weather_model = _parse_openmeteo(responses, tz, dt, "0.0.1")
+            expected = pandas_weather(responses[0], tz, dt)
+            for field, value in expected.items():
+                actual = getattr(weather_model, field)
+                if np.isnan(value):
+                    self.assertTrue(np.isnan(actual))
+                else:
+                    self.assertEqual(actual, value)
+
+    def test_block_weather(self):
+        tz = "America/Chicago"
+        dt = datetime.datetime(2023, 10, 10, 19, 10)
+        block = (dt.date() - datetime.date(1970, 1, 1)).days // 91
+        start_date, end_date = _block_dates(block)
+        with requests_mock.Mocker() as m:
+            m.get(
+                re.compile("https://historical-forecast-api.open-meteo.com/v1/forecast"),
+                content=build_openmeteo_response(start_date, end_date),
+            )
+            weather_model = _find_block_weather(self.session, 44.5013406, -88.0647832, dt, tz)
+            next_weather_model = _find_block_weather(self.session, 44.5013406, -88.0647832, dt + datetime.timedelta(days=7), tz)
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(m.last_request.qs["start_date"], [str(start_date)])
+            self.assertEqual(m.last_request.qs["end_date"], [str(end_date)])
+            self.assertEqual(m.last_request.qs["hourly"], [x for _, x in _HOURLY_VARIABLES])
+            self.assertEqual(m.last_request.qs["daily"], [x for _, x in _DAILY_VARIABLES])
+        days = (dt.date() - start_date).days
+        self.assertEqual(weather_model.temperature, days * 24 + 19)
+        self.assertEqual(next_weather_model.temperature, (days + 7) * 24 + 19)
+        self.assertEqual(weather_model.daily_weather_code, days)
+        self.assertEqual(weather_model.daily_maximum_temperature_2m, 1000 + days)
+
+    def test_block_out_of_range(self):
+        # Older clients raise the API's reason as a plain exception.
+        error = Exception("Parameter 'start_date' is out of allowed range from 2016-01-01 to 2025-06-01")
+        with mock.patch.object(openmeteo_requests.Client, "weather_api", side_effect=error):
+            weather_model = _find_block_weather(
+                self.session, 44.5013406, -88.0647832, datetime.datetime(2016, 1, 2, 19, 10), "America/Chicago"
+            )
+        self.assertIsNone(weather_model)
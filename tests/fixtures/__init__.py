@@ -0,0 +1 @@
+"""Synthetic data shared by the tests and the benchmarks."""
@@ -0,0 +1,175 @@
+"""Synthetic provider models for exercising the field combiners."""
+import contextlib
+import datetime
+from unittest import mock
+
+import numpy as np
+from sportsball.data.combined import most_interesting
+from sportsball.data.combined import (combined_address_model, combined_coach_model, combined_game_model, combined_player_model,
+                                      combined_team_model, combined_umpire_model, combined_venue_model, combined_weather_model)
+from sportsball.data.combined.combined_game_model import create_combined_game_model
+from sportsball.data.combined.identity_table import IdentityTable
+from sportsball.data.combined.most_interesting import more_interesting
+from sportsball.data.game_model import VERSION, GameModel
+from sportsball.data.league import League
+from sportsball.data.player_model import PlayerModel
+from sportsball.data.season_type import SeasonType
+from sportsball.data.team_model import VERSION as TEAM_VERSION
+from sportsball.data.team_model import TeamModel
+
+
+def game_model(rnd):
+    return GameModel(
+        dt=datetime.datetime(2023, 10, 1, 19),
+        week=rnd.choice([None, 0, 3]),
+        game_number=rnd.choice([None, 0, 12]),
+        venue=None,
+        teams=[],
+        end_dt=rnd.choice(
+            [
+                None,
+                datetime.datetime(2023, 10, 1),
+                datetime.datetime(2023, 10, 1, 21),
+                datetime.datetime(2023, 10, 1, 21, 30),
+            ]
+        ),
+        attendance=rnd.choice([None, 0, 18000]),
+        league=str(League.NBA),
+        year=rnd.choice([None, 2023]),
+        season_type=rnd.choice([None, SeasonType.REGULAR]),
+        postponed=rnd.choice([None, False, True]),
+        play_off=rnd.choice([None, False, True]),
+        distance=rnd.choice([None, 0.0, float("nan"), 1200.0]),
+        dividends=[],
+        pot=rnd.choice([None, 0.0, float("nan"), 3.5]),
+        umpires=[],
+        version=VERSION,
+    )
+
+
+def player_model(rnd):
+    values = {
+        "identifier": "a",
+        "name": "James Jones",
+        "species": "human",
+        "colleges": [],
+        "version": VERSION,
+    }
+    for field_name, field in PlayerModel.model_fields.items():
+        if field_name in values or field.default_factory_takes_validated_data:
+            continue
+        if field.annotation == int | None:
+            values[field_name] = rnd.choice([None, 0, 4])
+        elif field.annotation == float | None:
+            values[field_name] = rnd.choice([None, 0.0, float("nan"), 2.5])
+        else:
+            values[field_name] = None
+    # The total rebounds are only derived once both parts are known.
+    values["defensive_rebounds"] = 4
+    return PlayerModel(**values)
+
+
+def team_model(rnd, team):
+    values = {
+        "identifier": f"team{team}",
+        "name": f"Team {team}",
+        "players": [
+            player_model(rnd).model_copy(update={"identifier": f"player{team}-{x}", "name": f"Player {team} {x}"})
+            for x in range(13)
+        ],
+        "odds": [],
+        "news": [],
+        "social": [],
+        "coaches": [],
+        "version": TEAM_VERSION,
+    }
+    for field_name, field in TeamModel.model_fields.items():
+        if field.is_required() and field_name not in values:
+            values[field_name] = None
+    return TeamModel(**values)
+
+
+def more_interesting_fields(models, field_names):
+    values = {}
+    for field_name in field_names:
+        value = None
+        for model in models:
+            value = more_interesting(value, getattr(model, field_name))
+        values[field_name] = value
+    return values
+
+
+def _numpy_is_null(obj):
+    # The null check more_interesting used to make of every value.
+    if obj is None:
+        return True
+    try:
+        if np.isnan(obj):
+            return True
+    except (TypeError, ValueError):
+        pass
+    try:
+        if np.isnat(obj):
+            return True
+    except TypeError:
+        pass
+    return False
+
+
+def chained_combine_fields(models, exclude=frozenset(), include_derived=frozenset()):
+    # One more_interesting chain per field, as the hand written combiners did.
+    field_names = [
+        x
+        for x, y in type(models[0]).model_fields.items()
+        if x not in exclude and (not y.default_factory_takes_validated_data or x in include_derived)
+    ]
+    return more_interesting_fields(models, field_names)
+
+
+def five_provider_games(rnd, count):
+    return [
+        [
+            game_model(rnd).model_copy(update={"teams": [team_model(rnd, 0), team_model(rnd, 1)]})
+            for _ in range(5)
+        ]
+        for _ in range(count)
+    ]
+
+
+def combine_games(games, session):
+    return [
+        create_combined_game_model(
+            game_models=game_models,
+            venue_identity_map={},
+            team_identity_map={},
+            player_identities=IdentityTable("player"),
+            coach_identities=IdentityTable("coach"),
+            umpire_identities=IdentityTable("umpire"),
+            session=session,
+            last_game_number=None,
+            player_ffill={},
+            team_ffill={},
+            coach_ffill={},
+            umpire_ffill={},
+        )
+        for game_models in games
+    ]
+
+
+@contextlib.contextmanager
+def chained_combiners():
+    # Combines with the per field chains and numpy null check the combiners used before.
+    with contextlib.ExitStack() as stack:
+        for module in (
+            combined_address_model,
+            combined_coach_model,
+            combined_game_model,
+            combined_player_model,
+            combined_team_model,
+            combined_umpire_model,
+            combined_venue_model,
+            combined_weather_model,
+        ):
+            stack.enter_context(mock.patch.object(module, "combine_fields", chained_combine_fields))
+        stack.enter_context(mock.patch.object(most_interesting, "is_null", _numpy_is_null))
+        yield
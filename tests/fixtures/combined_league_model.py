@@ -0,0 +1,87 @@
+"""Synthetic provider leagues for exercising the combined league model."""
+import types
+import typing
+
+from sportsball.data.game_model import VERSION, GameModel
+from sportsball.data.league import League
+from sportsball.data.league_model import LeagueModel
+from sportsball.data.player_model import PlayerModel
+from sportsball.data.season_type import SeasonType
+from sportsball.data.team_model import TeamModel
+
+
+def game_model(dt):
+    return GameModel(
+        dt=dt,
+        week=None,
+        game_number=None,
+        venue=None,
+        teams=[],
+        end_dt=None,
+        attendance=None,
+        league=str(League.NBA),
+        year=None,
+        season_type=SeasonType.REGULAR,
+        postponed=None,
+        play_off=None,
+        distance=None,
+        dividends=[],
+        pot=None,
+        umpires=[],
+        version=VERSION,
+    )
+
+
+def synthetic_model(model_class, **kwargs):
+    # Fills every required field with a plausible value for its type.
+    values = {}
+    for field_name, field in model_class.model_fields.items():
+        if not field.is_required() or field_name in kwargs:
+            continue
+        annotation = field.annotation
+        args = typing.get_args(annotation) if isinstance(annotation, types.UnionType) else (annotation,)
+        if typing.get_origin(annotation) is list:
+            values[field_name] = []
+        elif float in args:
+            values[field_name] = 1.5
+        elif int in args:
+            values[field_name] = 2
+        elif str in args:
+            values[field_name] = "a"
+        else:
+            values[field_name] = None
+    values.update(kwargs)
+    return model_class(**values)
+
+
+def synthetic_game_model(dt):
+    teams = [
+        synthetic_model(
+            TeamModel,
+            identifier=f"team{x}",
+            players=[synthetic_model(PlayerModel, identifier=f"player{x}-{y}") for y in range(13)],
+        )
+        for x in range(2)
+    ]
+    model = game_model(dt)
+    model.teams = teams
+    return model
+
+
+class SyntheticLeagueModel(LeagueModel):
+
+    def __init__(self, session, dts, event=None):
+        super().__init__(League.NBA, session)
+        self._dts = dts
+        self._event = event
+
+    @classmethod
+    def name(cls):
+        return "test"
+
+    @property
+    def games(self):
+        for dt in self._dts:
+            yield game_model(dt)
+        if self._event is not None:
+            self._event.wait(timeout=30.0)
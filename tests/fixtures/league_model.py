@@ -0,0 +1,43 @@
+"""Synthetic league frames for exercising timezone normalisation."""
+import datetime
+import random
+
+import pandas as pd
+
+
+def row_wise_normalize_tz(df):
+    # Localises one row at a time, as _normalize_tz used to.
+    tz_column = "venue/address/timezone"
+    df = df.dropna(subset=tz_column)
+
+    def apply_tz(row):
+        tz = row[tz_column]
+        for col in {col for col, val in row.items() if isinstance(val, pd.Timestamp)} | {"dt"}:
+            dt = pd.to_datetime(row[col])
+            if dt.tz is None:
+                row[col] = dt.tz_localize(tz, ambiguous=True, nonexistent="shift_forward")
+            elif str(dt.tz) != str(tz):
+                row[col] = dt.tz_convert(tz)
+        return row
+
+    return df.apply(apply_tz, axis=1)
+
+
+def multi_season_frame(games, columns):
+    # Games over 15 seasons at venues in four timezones, with naive and UTC datetimes.
+    rnd = random.Random(42)
+    start = datetime.datetime(2010, 1, 1, 19, 30)
+    dts = [start + datetime.timedelta(days=rnd.randrange(15 * 365)) for _ in range(games)]
+    data = {
+        "venue/address/timezone": [
+            rnd.choice(["Australia/Melbourne", "America/New_York", "Europe/London", "Asia/Tokyo"])
+            for _ in range(games)
+        ],
+        "dt": pd.to_datetime(dts),
+    }
+    for column in range(columns):
+        offset = datetime.timedelta(hours=column)
+        data[f"naive_{column}"] = pd.to_datetime([x + offset for x in dts])
+        data[f"utc_{column}"] = pd.to_datetime([x - offset for x in dts]).tz_localize("UTC")
+        data[f"value_{column}"] = [rnd.random() for _ in range(games)]
+    return pd.DataFrame(data)
@@ -0,0 +1,78 @@
+"""Synthetic Open-Meteo responses and the frame based decoding they replaced."""
+import datetime
+
+import flatbuffers
+import numpy as np
+import pandas as pd
+import pytz
+from sportsball.data.weather.openmeteo.openmeteo_weather_model import _DAILY_FIELDS, _DAILY_VARIABLES, _HOURLY_FIELDS, _HOURLY_VARIABLES
+
+
+def _build_variables(builder, start, count, interval, columns):
+    variables = []
+    for column in range(columns):
+        values = builder.CreateNumpyVector(
+            (np.arange(count) + column * 1000).astype(np.float32)
+        )
+        builder.StartObject(13)
+        builder.PrependUOffsetTRelativeSlot(3, values, 0)
+        variables.append(builder.EndObject())
+    builder.StartVector(4, len(variables), 4)
+    for variable in reversed(variables):
+        builder.PrependUOffsetTRelative(variable)
+    vector = builder.EndVector()
+    builder.StartObject(4)
+    builder.PrependInt64Slot(0, start, 0)
+    builder.PrependInt64Slot(1, start + count * interval, 0)
+    builder.PrependInt32Slot(2, interval, 0)
+    builder.PrependUOffsetTRelativeSlot(3, vector, 0)
+    return builder.EndObject()
+
+
+def build_openmeteo_response(start_date, end_date):
+    """Build a flatbuffers response with hourly and daily values counting up from the start."""
+    # The decoder reads the times as wall clock times in the venue's timezone.
+    start = int(pytz.utc.localize(datetime.datetime.combine(start_date, datetime.time())).timestamp())
+    days = (end_date - start_date).days + 1
+    builder = flatbuffers.Builder(0)
+    hourly = _build_variables(builder, start, days * 24, 3600, len(_HOURLY_VARIABLES))
+    daily = _build_variables(builder, start, days, 86400, len(_DAILY_VARIABLES))
+    builder.StartObject(15)
+    builder.PrependUOffsetTRelativeSlot(10, daily, 0)
+    builder.PrependUOffsetTRelativeSlot(11, hourly, 0)
+    builder.Finish(builder.EndObject())
+    message = bytes(builder.Output())
+    return len(message).to_bytes(4, byteorder="little") + message
+
+
+def _frame(variables, fields, tz):
+    index = pd.date_range(
+        start=pd.to_datetime(variables.Time(), unit="s"),
+        end=pd.to_datetime(variables.TimeEnd(), unit="s"),
+        freq=pd.Timedelta(seconds=variables.Interval()),
+        inclusive="left",
+        tz=tz,
+    )
+    columns = {}
+    for i, field in enumerate(fields):
+        values = variables.Variables(i).ValuesAsNumpy()
+        if not isinstance(values, np.ndarray):
+            values = variables.Variables(i).ValuesInt64AsNumpy()
+        columns[field] = values
+    row_count = min(len(index), *(len(x) for x in columns.values()))
+    return pd.DataFrame(
+        index=index[:row_count],
+        data={x: y[:row_count] for x, y in columns.items()},
+    )
+
+
+def pandas_weather(response, tz, dt):
+    # Decodes the response into frames and looks up each field, as the model used to.
+    hourly_df = _frame(response.Hourly(), _HOURLY_FIELDS, tz)
+    daily_df = _frame(response.Daily(), _DAILY_FIELDS, tz)
+    dt = pytz.timezone(tz).localize(dt)
+    hourly_idx = hourly_df.index.get_indexer([dt], method="nearest")[0]
+    daily_idx = daily_df.index.get_indexer([dt], method="pad")[0]
+    weather = {x: hourly_df.iloc[hourly_idx][x] for x in _HOURLY_FIELDS}
+    weather.update({x: daily_df.iloc[daily_idx][x] for x in _DAILY_FIELDS})
+    return weather